@@ -0,0 +1,63 @@
+"""Measures the per-request cost of resolving the current user from a bearer token.
+
+Compares the original path (PyJWT re-parses the PEM public key on every decode), decoding with the
+pre-parsed key, and a warm verified-token cache.
+
+Run from the backend directory:
+
+    python -m benchmarks.auth_overhead --iterations 2000
+"""
+import argparse
+import time
+from typing import Callable
+
+import jwt
+
+from src.application.services.auth.auth import AuthService
+from src.application.services.auth.payload import PayloadExtractorService
+from src.application.services.auth.token import TokenService
+from src.config import settings
+from src.infrastructure.auth.jwt import JWTHandler
+from src.infrastructure.auth.key_ring import KeyRing
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+def measure(name: str, call: Callable[[], object], iterations: int) -> float:
+    call()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    per_call = (time.perf_counter() - started) / iterations * 1_000_000
+    print(f"{name:<28} {per_call:10.1f} us/request")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    jwt_settings = settings.auth_jwt
+    key_ring = KeyRing(jwt_settings.keys, jwt_settings.signing_kid)
+    token_handler = JWTHandler(key_ring=key_ring, expire_minutes=jwt_settings.expire_minutes)
+    signing_key = next(key for key in jwt_settings.keys if key["kid"] == jwt_settings.signing_kid)
+    token_service = TokenService(token_handler)
+    payload_extractor_service = PayloadExtractorService(token_handler)
+    token = token_handler.encode({"id": 1, "role": "CLIENT", "is_active": True})
+
+    def pem_decode():
+        payload = jwt.decode(token, signing_key["public_key"], algorithms=[signing_key["algorithm"]])
+        return payload_extractor_service.extract_user_from_payload(payload)
+
+    uncached_auth_service = AuthService(token_service, payload_extractor_service, TTLCache(ttl=0, max_size=0))
+    cached_auth_service = AuthService(token_service, payload_extractor_service, TTLCache(ttl=3600, max_size=1024))
+
+    print(f"{signing_key['algorithm']} ({signing_key['kid']}), {args.iterations} iterations")
+    before = measure("PEM key parsed per call", pem_decode, args.iterations)
+    measure("pre-parsed key", lambda: uncached_auth_service.get_current_active_auth_user(token), args.iterations)
+    after = measure("verified-token cache hit", lambda: cached_auth_service.get_current_active_auth_user(token), args.iterations)
+    print(f"speed-up with cache: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
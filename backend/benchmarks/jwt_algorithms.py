@@ -0,0 +1,69 @@
+"""Compares token encode and decode throughput of the signing algorithms supported by the key ring.
+
+Keys are generated in memory, so the benchmark does not depend on the configured certificates. It goes
+through JWTHandler and KeyRing, so the numbers include the kid lookup done on every decode.
+
+Run from the backend directory:
+
+    python -m benchmarks.jwt_algorithms --iterations 2000
+"""
+import argparse
+import time
+from typing import Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from src.infrastructure.auth.jwt import JWTHandler
+from src.infrastructure.auth.key_ring import KeyRing
+
+PAYLOAD = {"id": 1, "role": "CLIENT", "is_active": True}
+
+
+def generate_key(algorithm: str) -> dict:
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    return {
+        "kid": algorithm.lower(),
+        "algorithm": algorithm,
+        "private_key": private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ).decode(),
+        "public_key": private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode(),
+    }
+
+
+def ops_per_second(call: Callable[[], object], iterations: int) -> float:
+    call()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{args.iterations} iterations")
+    print(f"{'algorithm':<10} {'encode/s':>12} {'decode/s':>12} {'token bytes':>12}")
+    for algorithm in ("RS256", "EdDSA"):
+        key = generate_key(algorithm)
+        token_handler = JWTHandler(key_ring=KeyRing([key], key["kid"]), expire_minutes=15)
+        token = token_handler.encode(PAYLOAD)
+
+        encode_rate = ops_per_second(lambda: token_handler.encode(PAYLOAD), args.iterations)
+        decode_rate = ops_per_second(lambda: token_handler.decode(token), args.iterations)
+        print(f"{algorithm:<10} {encode_rate:12.0f} {decode_rate:12.0f} {len(token):12d}")
+
+
+if __name__ == "__main__":
+    main()
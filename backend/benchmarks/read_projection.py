@@ -0,0 +1,97 @@
+"""Compares the entity read path with the projection read path for listing accounts.
+
+The entity path maps every row to an Account, an AccountReadDTO and an AccountResponse and renders the
+list through the response model; the projection path renders the rows as they were read. Rows are plain
+dicts standing in for asyncpg records, which support the same mapping access.
+
+Run from the backend directory:
+
+    python -m benchmarks.read_projection --rows 1000 --iterations 50
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.api.responses import ORJSONResponse
+from src.application.mappers.account import AccountMapper
+from src.infrastructure.database.mappers.account import AccountDatabaseMapper
+from src.infrastructure.mappers.account import AccountSchemaMapper
+from src.infrastructure.schemas.account import AccountResponse
+
+
+def build_rows(rows: int) -> list[dict]:
+    created_at = datetime(2025, 1, 1, 12, 30)
+    return [
+        {
+            "id": i,
+            "user_id": i % 97,
+            "bank_id": i % 7,
+            "balance": Decimal(i * 1013) / 100,
+            "status": "ACTIVE",
+            "type": "SETTLEMENT",
+            "created_at": created_at + timedelta(minutes=i),
+            "updated_at": created_at + timedelta(minutes=i, seconds=30)
+        }
+        for i in range(rows)
+    ]
+
+
+def measure(name: str, call: Callable[[], bytes], rows: int, iterations: int, repeats: int = 5) -> float:
+    call()
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        best = min(best, (time.perf_counter() - started) / iterations)
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<12} {best * 1000:8.2f} ms/response {best / rows * 1_000_000:8.2f} us/row {peak / 1024:10.0f} KiB peak")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    field = create_model_field(name="Response_get_user_accounts", type_=list[AccountResponse], mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def entity_path() -> bytes:
+        accounts = [AccountDatabaseMapper.from_db_row(row) for row in rows]
+        responses = [
+            AccountSchemaMapper.to_response(AccountMapper.map_account_to_account_read_dto(account))
+            for account in accounts
+        ]
+        content = loop.run_until_complete(serialize_response(field=field, response_content=responses))
+        return ORJSONResponse(content).body
+
+    def projection_path() -> bytes:
+        return ORJSONResponse([dict(row) for row in rows]).body
+
+    if entity_path() != projection_path():
+        raise SystemExit("The projection renders the accounts differently from the entity path")
+
+    print(f"{args.rows} rows, best of 5 x {args.iterations} iterations")
+    before = measure("entities", entity_path, args.rows, args.iterations)
+    after = measure("projections", projection_path, args.rows, args.iterations)
+    print(f"speed-up: {before / after:.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Measures the cost of turning 1,000 accounts into a JSON response body.
+
+Compares FastAPI's path for an endpoint returning AccountResponse schemas (validation against the response
+model, serialization to plain data and rendering) with the stdlib json and with orjson, and returning an
+ORJSONResponse directly, which skips the response-model handling, both for the schemas and for plain rows.
+
+Run from the backend directory:
+
+    python -m benchmarks.response_serialization --rows 1000 --iterations 50
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.api.responses import ORJSONResponse
+from src.application.dtos.account import AccountReadDTO
+from src.domain.enums.account import AccountStatus, AccountType
+from src.infrastructure.mappers.account import AccountSchemaMapper
+from src.infrastructure.schemas.account import AccountResponse
+
+
+def build_accounts(rows: int) -> list[AccountResponse]:
+    created_at = datetime(2025, 1, 1, 12, 30)
+    return [
+        AccountSchemaMapper.to_response(
+            AccountReadDTO(
+                id=i,
+                user_id=i % 97,
+                bank_id=i % 7,
+                balance=Decimal(i * 1013) / 100,
+                status=AccountStatus.ACTIVE,
+                type=AccountType.SETTLEMENT,
+                created_at=created_at + timedelta(minutes=i),
+                updated_at=created_at + timedelta(minutes=i, seconds=30)
+            )
+        )
+        for i in range(rows)
+    ]
+
+
+def measure(name: str, call: Callable[[], bytes], iterations: int, repeats: int = 5) -> float:
+    call()
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        best = min(best, (time.perf_counter() - started) / iterations * 1000)
+    print(f"{name:<44} {best:8.2f} ms/response")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    accounts = build_accounts(args.rows)
+    rows = [account.model_dump() for account in accounts]
+    field = create_model_field(name="Response_get_user_accounts", type_=list[AccountResponse], mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def through_response_model(response_class: type[JSONResponse]) -> Callable[[], bytes]:
+        def render() -> bytes:
+            content = loop.run_until_complete(serialize_response(field=field, response_content=accounts))
+            return response_class(content).body
+        return render
+
+    expected = json.loads(through_response_model(JSONResponse)())
+    if json.loads(ORJSONResponse(accounts).body) != expected or json.loads(ORJSONResponse(rows).body) != expected:
+        raise SystemExit("ORJSONResponse renders the accounts differently from FastAPI's default path")
+
+    print(f"{args.rows} rows, best of 5 x {args.iterations} iterations")
+    before = measure("response model, stdlib json", through_response_model(JSONResponse), args.iterations)
+    measure("response model, orjson", through_response_model(ORJSONResponse), args.iterations)
+    measure("ORJSONResponse of schemas returned directly", lambda: ORJSONResponse(accounts).body, args.iterations)
+    after = measure("ORJSONResponse of rows returned directly", lambda: ORJSONResponse(rows).body, args.iterations)
+    print(f"speed-up of plain rows over the default path: {before / after:.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import HTTPException
 
 
@@ -5,6 +7,7 @@ class HttpExceptionFactory:
     @staticmethod
     def create_http_exception(
             status_code: int,
-            detail: str
+            detail: str,
+            headers: Optional[dict[str, str]] = None
     ) -> HTTPException:
-        return HTTPException(status_code=status_code,detail=detail)
\ No newline at end of file
+        return HTTPException(status_code=status_code,detail=detail, headers=headers)
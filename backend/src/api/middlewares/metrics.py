@@ -0,0 +1,44 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
+from src.infrastructure.metrics.context import RequestTimings
+
+
+class MetricsMiddleware:
+    """Records the latency, status code and database time of every HTTP request under its route template,
+    and reports the timing of the request in the Server-Timing header of its response."""
+
+    unmatched_route = "<unmatched>"
+
+    def __init__(self, app: ASGIApp, metrics: AbstractMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = RequestTimings.start()
+        timing = RequestTimings.current()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", RequestTimings.server_timing(timing))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            RequestTimings.reset(token)
+            self.metrics.observe_request(scope["method"], self._route(scope), status_code, timing)
+
+    def _route(self, scope: Scope) -> str:
+        """Returns the path template of the matched route, so that requests for different ids are recorded
+        together."""
+        route = scope.get("route")
+        return getattr(route, "path", self.unmatched_route)
@@ -0,0 +1,83 @@
+from typing import Callable, Optional
+from urllib.parse import parse_qs
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.abstractions.auth.auth import AbstractAuthService
+from src.application.abstractions.diagnostics.profiling import AbstractProfilingService
+from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.user import UserAccessDTO
+from src.domain.exceptions.forbidden import ForbiddenError, UserInactiveError
+from src.infrastructure.exceptions.jwt_exceptions import ExpiredTokenError, InvalidTokenError, TokenDecodeError
+
+
+class ProfilingMiddleware:
+    """Profiles a request sent by staff with the X-Profile header or the profile query parameter set.
+
+    The id of the profile is returned in the X-Profile-Id header, and the profile can be read from
+    /staff/diagnostics/profiles/{profile_id} once the response is complete. A request that does not ask to be
+    profiled, or whose sender may not profile, is handled as usual, without any sampling.
+    """
+
+    header = b"x-profile"
+    query_parameter = "profile"
+    enabled_values = ("1", "true")
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            auth_service: Callable[[], AbstractAuthService],
+            profiling_service: Callable[[], AbstractProfilingService],
+            log_service: Callable[[], AbstractLogService]
+    ):
+        self.app = app
+        self.auth_service = auth_service
+        self.profiling_service = profiling_service
+        self.log_service = log_service
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        user = self._authenticate(scope)
+        profiling_service = self.profiling_service()
+        try:
+            profile_id = await profiling_service.start_profiling(user) if user is not None else None
+        except ForbiddenError:
+            self.log_service().warning("User with ID %s is not allowed to profile requests", user.id)
+            profile_id = None
+        if profile_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            await profiling_service.stop_profiling(profile_id)
+
+    def _requested(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                return value.decode("latin-1").lower() in self.enabled_values
+        query_string = scope.get("query_string", b"")
+        if self.query_parameter.encode() not in query_string:
+            return False
+        values = parse_qs(query_string.decode("latin-1")).get(self.query_parameter, [])
+        return any(value.lower() in self.enabled_values for value in values)
+
+    def _authenticate(self, scope: Scope) -> Optional[UserAccessDTO]:
+        authorization = next((value for name, value in scope["headers"] if name == b"authorization"), b"")
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        try:
+            return self.auth_service().get_current_active_auth_user(token)
+        except (ExpiredTokenError, InvalidTokenError, TokenDecodeError, UserInactiveError):
+            return None
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from fastapi import Query
+
+from src.application.dtos.page import PageRequestDTO
+from src.config import settings
+
+
+def get_page_request(
+        cursor: Optional[str] = Query(None, description="Opaque cursor taken from the next_cursor of the previous page"),
+        limit: int = Query(settings.pagination.default_page_size, ge=1, le=settings.pagination.max_page_size)
+) -> PageRequestDTO:
+    return PageRequestDTO(limit=limit, cursor=cursor)
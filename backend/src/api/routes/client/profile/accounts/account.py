@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status
 from dependency_injector.wiring import Provide, inject
 
+from src.api.responses import ORJSONResponse
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.accounts.account_profile import AbstractAccountProfileService
 from src.application.abstractions.logs.log import AbstractLogService
@@ -47,20 +48,33 @@ async def get_account_by_id(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> AccountResponse:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is fetching account with ID {account_id}")
+    log_service.info(
+        "User ID %s (%s) is fetching account with ID %s",
+        requesting_user.id,
+        requesting_user.role,
+        account_id
+    )
     try:
         fetched_account_dto = await account_profile_service.get_account_by_id(account_id, requesting_user)
         log_service.info(
-            f"Successfully fetched account with ID {account_id} for User ID {requesting_user.id} ({requesting_user.role})")
+            "Successfully fetched account with ID %s for User ID %s (%s)",
+            account_id,
+            requesting_user.id,
+            requesting_user.role
+        )
     except ForbiddenError as exc:
-        log_service.warning(f"Forbidden access attempt by user ID {requesting_user.id}: {str(exc)}")
+        log_service.warning("Forbidden access attempt by user ID %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(exc)
         )
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) attempted to fetch non-existent account ID {account_id}: {str(exc)}"
+            "User ID %s (%s) attempted to fetch non-existent account ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_404_NOT_FOUND,
@@ -68,7 +82,11 @@ async def get_account_by_id(
         )
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching account with ID {account_id}: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching account with ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -89,27 +107,30 @@ async def get_user_accounts(
             Provide[Application.services.account_profile_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[AccountResponse]:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is fetching accounts")
+) -> ORJSONResponse:
+    log_service.info("User ID %s (%s) is fetching accounts", requesting_user.id, requesting_user.role)
     try:
-        fetched_accounts_dto = await account_profile_service.get_accounts(requesting_user)
-        log_service.info(f"Successfully fetched accounts for User ID {requesting_user.id} ({requesting_user.role})")
+        fetched_accounts = await account_profile_service.get_accounts(requesting_user)
+        log_service.info("Successfully fetched accounts for User ID %s (%s)", requesting_user.id, requesting_user.role)
     except ForbiddenError as exc:
-        log_service.warning(f"Forbidden access attempt by user ID {requesting_user.id}: {str(exc)}")
+        log_service.warning("Forbidden access attempt by user ID %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(exc)
         )
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching accounts: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching accounts: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while fetching the list of accounts."
         )
-    return [AccountSchemaMapper.to_response(fetched_account_dto) for fetched_account_dto in fetched_accounts_dto]
+    return ORJSONResponse(fetched_accounts)
 
 
 @router.post("/", response_model=AccountResponse, responses={
@@ -128,28 +149,40 @@ async def create_account(
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> AccountResponse:
     account_create_dto = AccountSchemaMapper.from_create_request(account_create, requesting_user.id)
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create an account")
+    log_service.info("User ID %s (%s) is attempting to create an account", requesting_user.id, requesting_user.role)
     try:
         created_account_dto = await account_profile_service.create_account(
             account_create_dto,
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created account with ID {created_account_dto.id}"
+            "User ID %s (%s) successfully created account with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_account_dto.id
         )
     except UniqueConstraintError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered unique constraint violation while creating account: {str(exc)}"
+            "User ID %s (%s) encountered unique constraint violation while creating account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_409_CONFLICT, str(exc))
     except ForeignKeyError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered foreign key constraint violation while creating account: {str(exc)}"
+            "User ID %s (%s) encountered foreign key constraint violation while creating account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating account: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
@@ -178,7 +211,10 @@ async def update_account(
 ) -> AccountResponse:
     account_update_dto = AccountSchemaMapper.from_update_request_to_client(account_update)
     log_service.info(
-        f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to update account with ID {account_id}"
+        "User ID %s (%s) is attempting to update account with ID %s",
+        requesting_user.id,
+        requesting_user.role,
+        account_id
     )
     try:
         updated_account_dto = await account_profile_service.update_account(
@@ -187,40 +223,63 @@ async def update_account(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully updated account with ID {updated_account_dto.id}"
+            "User ID %s (%s) successfully updated account with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            updated_account_dto.id
         )
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) attempted to update non-existent account ID {account_id}: {str(exc)}"
+            "User ID %s (%s) attempted to update non-existent account ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_404_NOT_FOUND,
             f"Account with ID {account_id} not found."
         )
     except ForbiddenError as exc:
-        log_service.warning(f"Forbidden access attempt by user ID {requesting_user.id}: {str(exc)}")
+        log_service.warning("Forbidden access attempt by user ID %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(exc)
         )
     except NoFieldsToUpdateError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) attempted to update account with ID {account_id} but no fields were provided: {str(exc)}"
+            "User ID %s (%s) attempted to update account with ID %s but no fields were provided: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except AccountAlreadyInRequestedStatusError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) attempted to update account ID {account_id} to the same status: {str(exc)}"
+            "User ID %s (%s) attempted to update account ID %s to the same status: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except StatusChangeNotAllowedError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) attempted to change account ID {account_id} status: {str(exc)}"
+            "User ID %s (%s) attempted to change account ID %s status: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while updating account ID {account_id}: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while updating account ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
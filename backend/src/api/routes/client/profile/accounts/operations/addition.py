@@ -2,14 +2,19 @@ from fastapi import APIRouter, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.api.pagination import get_page_request
+from src.api.responses import ORJSONResponse
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.additions.addition_profile import AbstractAdditionProfileService
 from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.page import PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 from src.domain.exceptions.forbidden import ForbiddenError
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError, UniqueConstraintError, ForeignKeyError
-from src.infrastructure.mappers.addition import AdditionSchemaMapper
+from src.infrastructure.mappers.page import PageSchemaMapper
+from src.infrastructure.schemas.page import PageResponse
 from src.infrastructure.schemas.addition import AdditionResponse, AdditionCreateRequest
 
 
@@ -17,7 +22,8 @@ from src.infrastructure.schemas.addition import AdditionResponse, AdditionCreate
 router = APIRouter(prefix="/additions", tags=["Additions"])
 
 
-@router.get("/", response_model=list[AdditionResponse], responses={
+@router.get("/", response_model=PageResponse[AdditionResponse], responses={
+    400: {"description": "Invalid page cursor"},
     401: {"description": "Invalid or expired token"},
     403: {"description": "User is inactive"},
     500: {"description": "Unexpected server error"}
@@ -25,39 +31,51 @@ router = APIRouter(prefix="/additions", tags=["Additions"])
 @inject
 async def get_additions_by_account_id(
         account_id: int,
+        page_request: PageRequestDTO = Depends(get_page_request),
         requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
         addition_profile_service: AbstractAdditionProfileService = Depends(
             Provide[Application.services.addition_profile_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[AdditionResponse]:
+) -> ORJSONResponse:
     try:
-        log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is fetching additions")
+        log_service.info("User ID %s (%s) is fetching additions", requesting_user.id, requesting_user.role)
         fetched_additions_dto = await addition_profile_service.get_additions_by_account_id(
             account_id,
+            page_request,
             requesting_user
         )
-        log_service.info(f"Successfully fetched additions for User ID {requesting_user.id} ({requesting_user.role})")
+        log_service.info("Successfully fetched additions for User ID %s (%s)", requesting_user.id, requesting_user.role)
+    except InvalidCursorError as exc:
+        raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while fetching additions: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while fetching additions: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) tried to access non-existent additions: {str(exc)}"
+            "User ID %s (%s) tried to access non-existent additions: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching additions: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching additions: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while fetching the list of additions."
         )
-    fetched_additions = [AdditionSchemaMapper.to_response(fetched_addition_dto) for fetched_addition_dto in fetched_additions_dto]
-    return fetched_additions
+    return ORJSONResponse(PageSchemaMapper.to_projection_response(fetched_additions_dto))
 
 
 @router.post("/", response_model=AdditionResponse, responses={
@@ -77,7 +95,7 @@ async def create_addition(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> AdditionResponse:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create an addition")
+    log_service.info("User ID %s (%s) is attempting to create an addition", requesting_user.id, requesting_user.role)
     try:
         created_addition = await addition_profile_service.create_addition(
             account_id,
@@ -85,26 +103,41 @@ async def create_addition(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created addition with ID {created_addition.id}"
+            "User ID %s (%s) successfully created addition with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_addition.id
         )
     except UniqueConstraintError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered unique constraint violation while creating addition: {str(exc)}"
+            "User ID %s (%s) encountered unique constraint violation while creating addition: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_409_CONFLICT, str(exc))
     except ForeignKeyError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered foreign key constraint violation while creating addition: {str(exc)}"
+            "User ID %s (%s) encountered foreign key constraint violation while creating addition: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc))
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while creating addition: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while creating addition: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating addition: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating addition: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
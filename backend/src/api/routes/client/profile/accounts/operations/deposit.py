@@ -43,7 +43,11 @@ async def get_deposit_account_by_id(
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching deposit account with ID {deposit_account_id}: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching deposit account with ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            deposit_account_id,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
@@ -66,7 +70,9 @@ async def create_deposit_account(
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> DepositAccountResponse:
     log_service.info(
-        f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create deposit account request"
+        "User ID %s (%s) is attempting to create deposit account request",
+        requesting_user.id,
+        requesting_user.role
     )
     deposit_create_dto = DepositSchemaMapper.map_deposit_account_from_create_request(
         deposit_create_request,
@@ -80,16 +86,25 @@ async def create_deposit_account(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created deposit account with ID {created_deposit_account_dto.id}"
+            "User ID %s (%s) successfully created deposit account with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_deposit_account_dto.id
         )
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while creating deposit account: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while creating deposit account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating deposit account: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating deposit account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
@@ -2,16 +2,21 @@ from fastapi import APIRouter, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.api.pagination import get_page_request
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.loans.loan_profile import AbstractLoanProfileService
 from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.page import PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 from src.domain.exceptions.forbidden import ForbiddenError
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 from src.infrastructure.mappers.account import AccountSchemaMapper
 from src.infrastructure.mappers.loan import LoanSchemaMapper
+from src.infrastructure.mappers.page import PageSchemaMapper
 from src.infrastructure.schemas.account import AccountCreateRequest
+from src.infrastructure.schemas.page import PageResponse
 from src.infrastructure.schemas.loan import LoanAccountResponse, LoanResponse, LoanCreateRequest, \
     LoanTransactionResponse, LoanTransactionCreateRequest
 
@@ -30,26 +35,39 @@ async def get_loan_account_by_account_id(
 ) -> LoanAccountResponse:
     try:
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) is fetching loan account with account ID {account_id}"
+            "User ID %s (%s) is fetching loan account with account ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            account_id
         )
         fetched_loan_account_dto = await loan_profile_service.get_loan_account_by_account_id(
             account_id,
             requesting_user
         )
-        log_service.info(f"Successfully fetched transfers for User ID {requesting_user.id} ({requesting_user.role})")
+        log_service.info("Successfully fetched transfers for User ID %s (%s)", requesting_user.id, requesting_user.role)
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while fetching loan account: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while fetching loan account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) tried to access non-existent loan account with ID {loan_account_id}: {str(exc)}"
+            "User ID %s (%s) tried to access non-existent loan account with ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            loan_account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching loan account: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching loan account: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
@@ -71,7 +89,7 @@ async def create_loan_request(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> LoanAccountResponse:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create loan request")
+    log_service.info("User ID %s (%s) is attempting to create loan request", requesting_user.id, requesting_user.role)
     loan_create_dto = LoanSchemaMapper.map_loan_from_create_request(loan_create_request)
     account_create_dto = AccountSchemaMapper.from_create_request(account_create_request, requesting_user.id)
     try:
@@ -81,16 +99,25 @@ async def create_loan_request(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created loan request with ID {created_loan_account_dto.id}"
+            "User ID %s (%s) successfully created loan request with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_loan_account_dto.id
         )
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while creating loan request: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while creating loan request: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating loan request: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating loan request: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -110,7 +137,11 @@ async def create_loan_transaction(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> LoanTransactionResponse:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create loan transaction")
+    log_service.info(
+        "User ID %s (%s) is attempting to create loan transaction",
+        requesting_user.id,
+        requesting_user.role
+    )
     loan_transaction_create_dto = LoanSchemaMapper.map_loan_transaction_from_create_request(
         loan_transaction_create_request,
         loan_account_id
@@ -122,22 +153,35 @@ async def create_loan_transaction(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created loan transaction with ID {created_loan_transaction_dto.id}"
+            "User ID %s (%s) successfully created loan transaction with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_loan_transaction_dto.id
         )
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) tried to create loan transaction for non-existent loan account with ID {loan_account_id}: {str(exc)}"
+            "User ID %s (%s) tried to create loan transaction for non-existent loan account with ID %s: %s",
+            requesting_user.id,
+            requesting_user.role,
+            loan_account_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except ForbiddenError as exc:
         raise exc
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while creating loan transaction request: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while creating loan transaction request: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating loan transaction: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating loan transaction: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
@@ -148,24 +192,29 @@ async def create_loan_transaction(
     return created_loan_transaction
 
 
-@router.get("/{loan_account_id}/transactions", response_model=list[LoanTransactionResponse])
+@router.get("/{loan_account_id}/transactions", response_model=PageResponse[LoanTransactionResponse])
 @inject
 async def get_loan_transactions_by_loan_account_id(
         loan_account_id: int,
+        page_request: PageRequestDTO = Depends(get_page_request),
         requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
         loan_profile_service: AbstractLoanProfileService = Depends(
             Provide[Application.services.loan_profile_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[LoanTransactionResponse]:
+) -> PageResponse[LoanTransactionResponse]:
     try:
         loan_transactions_dto = await loan_profile_service.get_loan_transactions_by_loan_account_id(
             loan_account_id,
+            page_request,
             requesting_user
         )
+    except InvalidCursorError as exc:
+        raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except Exception as exc:
         raise exc
-    loan_transactions = [
-        LoanSchemaMapper.map_loan_transaction_to_response(loan_transaction_dto) for loan_transaction_dto in loan_transactions_dto
-    ]
+    loan_transactions = PageSchemaMapper.to_response(
+        loan_transactions_dto,
+        LoanSchemaMapper.map_loan_transaction_to_response
+    )
     return loan_transactions
\ No newline at end of file
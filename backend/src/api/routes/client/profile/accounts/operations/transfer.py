@@ -2,20 +2,27 @@ from fastapi import APIRouter, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.api.pagination import get_page_request
+from src.api.responses import ORJSONResponse
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.transfers.transfer_profile import AbstractTransferProfileService
 from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.page import PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 from src.domain.exceptions.forbidden import ForbiddenError
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError, UniqueConstraintError, ForeignKeyError
+from src.infrastructure.mappers.page import PageSchemaMapper
 from src.infrastructure.mappers.transfer import TransferSchemaMapper
+from src.infrastructure.schemas.page import PageResponse
 from src.infrastructure.schemas.transfer import TransferResponse, TransferCreateRequest
 
 router = APIRouter(prefix="/transfers", tags=["Transfers"])
 
 
-@router.get("/", response_model=list[TransferResponse], responses={
+@router.get("/", response_model=PageResponse[TransferResponse], responses={
+    400: {"description": "Invalid page cursor"},
     401: {"description": "Invalid or expired token"},
     403: {"description": "User is inactive"},
     500: {"description": "Unexpected server error"}
@@ -23,39 +30,51 @@ router = APIRouter(prefix="/transfers", tags=["Transfers"])
 @inject
 async def get_transfers_by_account_id(
         account_id: int,
+        page_request: PageRequestDTO = Depends(get_page_request),
         requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
         transfer_profile_service: AbstractTransferProfileService = Depends(
             Provide[Application.services.transfer_profile_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[TransferResponse]:
+) -> ORJSONResponse:
     try:
-        log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is fetching transfers")
+        log_service.info("User ID %s (%s) is fetching transfers", requesting_user.id, requesting_user.role)
         fetched_transfers_dto = await transfer_profile_service.get_transfers_by_account_id(
             account_id,
+            page_request,
             requesting_user
         )
-        log_service.info(f"Successfully fetched transfers for User ID {requesting_user.id} ({requesting_user.role})")
+        log_service.info("Successfully fetched transfers for User ID %s (%s)", requesting_user.id, requesting_user.role)
+    except InvalidCursorError as exc:
+        raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while fetching transfers: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while fetching transfers: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) tried to access non-existent transfers: {str(exc)}"
+            "User ID %s (%s) tried to access non-existent transfers: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching transfers: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching transfers: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while fetching the list of transfers."
         )
-    fetched_transfers = [TransferSchemaMapper.to_response(fetched_transfer_dto) for fetched_transfer_dto in fetched_transfers_dto]
-    return fetched_transfers
+    return ORJSONResponse(PageSchemaMapper.to_projection_response(fetched_transfers_dto))
 
 
 @router.post("/", response_model=TransferResponse, responses={
@@ -75,7 +94,7 @@ async def create_transfer(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> TransferResponse:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create an transfer")
+    log_service.info("User ID %s (%s) is attempting to create an transfer", requesting_user.id, requesting_user.role)
     transfer_create_dto = TransferSchemaMapper.from_create_request(transfer_create, account_id)
     try:
         created_transfer = await transfer_profile_service.create_transfer(
@@ -83,27 +102,42 @@ async def create_transfer(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created transfer with ID {created_transfer.id}"
+            "User ID %s (%s) successfully created transfer with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_transfer.id
         )
     except UniqueConstraintError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered unique constraint violation while creating transfer: {str(exc)}"
+            "User ID %s (%s) encountered unique constraint violation while creating transfer: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_409_CONFLICT, str(exc))
     except ForeignKeyError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered foreign key constraint violation while creating transfer: {str(exc)}"
+            "User ID %s (%s) encountered foreign key constraint violation while creating transfer: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc))
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while creating transfer: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while creating transfer: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         raise exc
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating transfer: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating transfer: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
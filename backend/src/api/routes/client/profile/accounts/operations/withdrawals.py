@@ -2,20 +2,27 @@ from fastapi import APIRouter, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.api.pagination import get_page_request
+from src.api.responses import ORJSONResponse
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.withdrawals.withdrawal_profile import AbstractWithdrawalProfileService
 from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.page import PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 from src.domain.exceptions.forbidden import ForbiddenError
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError, UniqueConstraintError, ForeignKeyError
+from src.infrastructure.mappers.page import PageSchemaMapper
 from src.infrastructure.mappers.withdrawal import WithdrawalSchemaMapper
+from src.infrastructure.schemas.page import PageResponse
 from src.infrastructure.schemas.withdrawal import WithdrawalResponse, WithdrawalCreateRequest
 
 router = APIRouter(prefix="/withdrawals", tags=["Withdrawals"])
 
 
-@router.get("/", response_model=list[WithdrawalResponse], responses={
+@router.get("/", response_model=PageResponse[WithdrawalResponse], responses={
+    400: {"description": "Invalid page cursor"},
     401: {"description": "Invalid or expired token"},
     403: {"description": "User is inactive"},
     500: {"description": "Unexpected server error"}
@@ -23,38 +30,55 @@ router = APIRouter(prefix="/withdrawals", tags=["Withdrawals"])
 @inject
 async def get_withdrawals_by_account_id(
         account_id: int,
+        page_request: PageRequestDTO = Depends(get_page_request),
         requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
         withdrawal_profile_service: AbstractWithdrawalProfileService = Depends(
             Provide[Application.services.withdrawal_profile_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[WithdrawalResponse]:
+) -> ORJSONResponse:
     try:
-        log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is fetching withdrawals")
+        log_service.info("User ID %s (%s) is fetching withdrawals", requesting_user.id, requesting_user.role)
         fetched_withdrawals = await withdrawal_profile_service.get_withdrawals_by_account_id(
             account_id,
+            page_request,
             requesting_user
         )
-        log_service.info(f"Successfully fetched withdrawals for User ID {requesting_user.id} ({requesting_user.role})")
+        log_service.info(
+            "Successfully fetched withdrawals for User ID %s (%s)",
+            requesting_user.id,
+            requesting_user.role
+        )
+    except InvalidCursorError as exc:
+        raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while fetching withdrawals: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while fetching withdrawals: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except NotFoundError as exc:
         log_service.warning(
-            f"User ID {requesting_user.id} ({requesting_user.role}) tried to access non-existent withdrawals: {str(exc)}"
+            "User ID %s (%s) tried to access non-existent withdrawals: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an error while fetching withdrawals: {str(exc)}"
+            "User ID %s (%s) encountered an error while fetching withdrawals: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while fetching the list of withdrawals."
         )
-    return fetched_withdrawals
+    return ORJSONResponse(PageSchemaMapper.to_projection_response(fetched_withdrawals))
 
 
 @router.post("/", response_model=WithdrawalResponse, responses={
@@ -74,7 +98,7 @@ async def create_withdrawal(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> WithdrawalResponse:
-    log_service.info(f"User ID {requesting_user.id} ({requesting_user.role}) is attempting to create an withdrawal")
+    log_service.info("User ID %s (%s) is attempting to create an withdrawal", requesting_user.id, requesting_user.role)
     withdrawal_create_dto = WithdrawalSchemaMapper.from_create_request(withdrawal_create, account_id)
     try:
         created_withdrawal = await withdrawal_profile_service.create_withdrawal(
@@ -82,26 +106,41 @@ async def create_withdrawal(
             requesting_user
         )
         log_service.info(
-            f"User ID {requesting_user.id} ({requesting_user.role}) successfully created withdrawal with ID {created_withdrawal.id}"
+            "User ID %s (%s) successfully created withdrawal with ID %s",
+            requesting_user.id,
+            requesting_user.role,
+            created_withdrawal.id
         )
     except UniqueConstraintError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered unique constraint violation while creating withdrawal: {str(exc)}"
+            "User ID %s (%s) encountered unique constraint violation while creating withdrawal: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_409_CONFLICT, str(exc))
     except ForeignKeyError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered foreign key constraint violation while creating withdrawal: {str(exc)}"
+            "User ID %s (%s) encountered foreign key constraint violation while creating withdrawal: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc))
     except ForbiddenError as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered a ForbiddenError while creating withdrawal: {str(exc)}"
+            "User ID %s (%s) encountered a ForbiddenError while creating withdrawal: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status.HTTP_403_FORBIDDEN, str(exc))
     except Exception as exc:
         log_service.error(
-            f"User ID {requesting_user.id} ({requesting_user.role}) encountered an unexpected error while creating withdrawal: {str(exc)}"
+            "User ID %s (%s) encountered an unexpected error while creating withdrawal: %s",
+            requesting_user.id,
+            requesting_user.role,
+            exc
         )
         raise exc
         raise HttpExceptionFactory.create_http_exception(
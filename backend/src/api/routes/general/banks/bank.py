@@ -2,12 +2,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.api.pagination import get_page_request
 from src.application.abstractions.banks.bank_public import AbstractBankPublicService
 from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.page import PageRequestDTO
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 from src.infrastructure.mappers.bank import BankSchemaMapper
+from src.infrastructure.mappers.page import PageSchemaMapper
 from src.infrastructure.schemas.bank import BankResponse
+from src.infrastructure.schemas.page import PageResponse
 
 router = APIRouter(prefix="/banks", tags=["Banks"])
 
@@ -24,14 +29,14 @@ async def get_bank_by_id(
 ) -> BankResponse:
     try:
         fetched_bank_dto = await bank_public_service.get_bank_by_id(bank_id)
-        log_service.info(f"Successfully fetched bank with ID {bank_id}")
+        log_service.info("Successfully fetched bank with ID %s", bank_id)
     except NotFoundError as exc:
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc)
         )
     except Exception as exc:
-        log_service.error(f"An unexpected error occurred while fetching the bank with ID {bank_id}: {str(exc)}")
+        log_service.error("An unexpected error occurred while fetching the bank with ID %s: %s", bank_id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching the bank."
@@ -40,22 +45,26 @@ async def get_bank_by_id(
     return bank
 
 
-@router.get("/", response_model=list[BankResponse], responses={
+@router.get("/", response_model=PageResponse[BankResponse], responses={
+    400: {"description": "Invalid page cursor"},
     500: {"description": "Unexpected server error"}
 })
 @inject
 async def get_banks(
+        page_request: PageRequestDTO = Depends(get_page_request),
         bank_info_service: AbstractBankPublicService = Depends(Provide[Application.services.bank_info_service]),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[BankResponse]:
+) -> PageResponse[BankResponse]:
     try:
-        fetched_banks_dto = await bank_info_service.get_banks()
-        log_service.info(f"Successfully fetched {len(fetched_banks_dto)} banks")
+        fetched_banks_dto = await bank_info_service.get_banks(page_request)
+        log_service.info("Successfully fetched %s banks", len(fetched_banks_dto.items))
+    except InvalidCursorError as exc:
+        raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except Exception as exc:
-        log_service.error(f"An unexpected error occurred while fetching the list of banks: {str(exc)}")
+        log_service.error("An unexpected error occurred while fetching the list of banks: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching the list of banks."
         )
-    banks = [BankSchemaMapper.to_response(bank_dto) for bank_dto in fetched_banks_dto]
+    banks = PageSchemaMapper.to_response(fetched_banks_dto, BankSchemaMapper.to_response)
     return banks
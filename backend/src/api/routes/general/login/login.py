@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, Form, status, HTTPException
+import math
+
+from fastapi import APIRouter, Depends, Form, Request, status, HTTPException
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
 from src.application.abstractions.auth.login import AbstractLoginService
+from src.application.abstractions.auth.rate_limit import AbstractAuthRateLimitService
 from src.application.abstractions.logs.log import AbstractLogService
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.jwt_exceptions import TokenCreationError, InvalidLoginError
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
+from src.infrastructure.exceptions.security_exceptions import PasswordHandlerOverloadedError, RateLimitExceededError
 from src.infrastructure.schemas.token import TokenInfo
 
 router = APIRouter(tags=["AuthJWT"])
@@ -15,45 +19,64 @@ router = APIRouter(tags=["AuthJWT"])
 @router.post("/login", response_model=TokenInfo, responses={
     401: {"description": "Invalid phone number or password"},
     404: {"description": "User not found"},
+    429: {"description": "Too many login attempts for the phone number or from the client address"},
+    503: {"description": "Too many concurrent authentication requests"},
     500: {"description": "Unexpected server error"}
 })
 @inject
 async def login(
+        request: Request,
         username: str = Form(...),
         password: str = Form(...),
+        rate_limit_service: AbstractAuthRateLimitService = Depends(
+            Provide[Application.services.auth_rate_limit_service]
+        ),
         login_service: AbstractLoginService = Depends(Provide[Application.services.login_service]),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service]),
 ) -> TokenInfo:
     try:
+        await rate_limit_service.check_login(username, request.client.host if request.client else "")
         access_token = await login_service.authenticate_user(username, password)
     except NotFoundError as exc:
-        log_service.error(f"User not found during login attempt for phone_number: {username}: {str(exc)}")
+        log_service.error("User not found during login attempt for phone_number: %s: %s", username, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc)
         )
     except InvalidLoginError as exc:
-        log_service.error(f"Token creation failed during login attempt for phone_number: {username}: {str(exc)}")
+        log_service.error("Token creation failed during login attempt for phone_number: %s: %s", username, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(exc)
         )
+    except RateLimitExceededError as exc:
+        log_service.warning("Login attempt for phone_number %s rejected by the rate limiter: %s", username, exc)
+        raise HttpExceptionFactory.create_http_exception(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+            headers={"Retry-After": str(math.ceil(exc.retry_after))}
+        )
+    except PasswordHandlerOverloadedError as exc:
+        log_service.warning("Login attempt for phone_number %s rejected: %s", username, exc)
+        raise HttpExceptionFactory.create_http_exception(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"}
+        )
     except TokenCreationError as exc:
-        log_service.error(f"Token creation failed during login attempt for phone_number: {username}: {str(exc)}")
+        log_service.error("Token creation failed during login attempt for phone_number: %s: %s", username, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while creating the authentication token."
         )
     except Exception as exc:
-        log_service.error(
-            f"Unexpected error during login attempt for username with phone_number: {username}: {str(exc)}"
-        )
+        log_service.error("Unexpected error during login attempt for username with phone_number: %s: %s", username, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred during the authentication process."
         )
 
-    log_service.info(f"User with phone_number {username} successfully logged in.")
+    log_service.info("User with phone_number %s successfully logged in.", username)
     return TokenInfo(
         access_token=access_token,
         token_type="Bearer"
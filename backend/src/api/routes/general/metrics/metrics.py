@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from dependency_injector.wiring import inject, Provide
+
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
+from src.infrastructure.dependencies.app import Application
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+@inject
+async def get_metrics(
+        metrics: AbstractMetrics = Depends(Provide[Application.core.metrics])
+) -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, status
+import math
+
+from fastapi import APIRouter, Depends, Request, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.application.abstractions.auth.rate_limit import AbstractAuthRateLimitService
 from src.application.abstractions.logs.log import AbstractLogService
 from src.application.abstractions.registration.registration import AbstractUserRegistrationService
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.repository_exceptions import UniqueConstraintError
+from src.infrastructure.exceptions.security_exceptions import PasswordHandlerOverloadedError, RateLimitExceededError
 from src.infrastructure.mappers.user import UserSchemaMapper
 from src.infrastructure.schemas.user import UserResponse, UserCreateRequest
 
@@ -14,30 +18,66 @@ router = APIRouter(prefix="/registration", tags=["Registration"])
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED, responses={
     409: {"description": "Conflict due to a unique constraint violation"},
+    429: {"description": "Too many registration attempts for the phone number or from the client address"},
+    503: {"description": "Too many concurrent authentication requests"},
     500: {"description": "Unexpected server error"}
 })
 @inject
 async def user_registration(
+        request: Request,
         user_create_request: UserCreateRequest,
+        rate_limit_service: AbstractAuthRateLimitService = Depends(
+            Provide[Application.services.auth_rate_limit_service]
+        ),
         registration_service: AbstractUserRegistrationService = Depends(
             Provide[Application.services.user_registration_service],
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service]),
 ) -> UserResponse:
-    log_service.info(f"Attempting to register a new user with phone_number: {user_create_request.phone_number}")
+    log_service.info("Attempting to register a new user with phone_number: %s", user_create_request.phone_number)
     user_dto = UserSchemaMapper.from_create_request(user_create_request)
     try:
+        await rate_limit_service.check_registration(
+            user_create_request.phone_number,
+            request.client.host if request.client else ""
+        )
         created_user_dto = await registration_service.create_user_client(user_dto)
         log_service.info(
-            f"User successfully registered with phone_number {created_user_dto.phone_number} and ID {created_user_dto.id}"
+            "User successfully registered with phone_number %s and ID %s",
+            created_user_dto.phone_number,
+            created_user_dto.id
         )
     except UniqueConstraintError as exc:
         log_service.error(
-            f"Unique constraint violation while creating user with phone_number {user_create_request.phone_number}: {str(exc)}"
+            "Unique constraint violation while creating user with phone_number %s: %s",
+            user_create_request.phone_number,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    except RateLimitExceededError as exc:
+        log_service.warning(
+            "Registration of user with phone_number %s rejected by the rate limiter: %s",
+            user_create_request.phone_number,
+            exc
+        )
+        raise HttpExceptionFactory.create_http_exception(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+            headers={"Retry-After": str(math.ceil(exc.retry_after))}
+        )
+    except PasswordHandlerOverloadedError as exc:
+        log_service.warning(
+            "Registration of user with phone_number %s rejected: %s",
+            user_create_request.phone_number,
+            exc
+        )
+        raise HttpExceptionFactory.create_http_exception(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"}
+        )
     except Exception as exc:
-        log_service.error(f"Unexpected error occurred during user registration: {str(exc)}")
+        log_service.error("Unexpected error occurred during user registration: %s", exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while user registration."
@@ -32,12 +32,12 @@ async def get_profile(
 ) -> ProfileResponse:
     try:
         fetched_profile_dto: User = await profile_service.get_profile(requesting_user)
-        log_service.info(f"Successfully fetched profile for user_id = {fetched_profile_dto.id}")
+        log_service.info("Successfully fetched profile for user_id = %s", fetched_profile_dto.id)
     except NotFoundError as exc:
-        log_service.warning(f"User with ID {requesting_user.id} failed to fetch profile: {str(exc)}")
+        log_service.warning("User with ID %s failed to fetch profile: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
-        log_service.error(f"Unexpected error occurred while fetching profile for user {requesting_user.id}: {str(exc)}")
+        log_service.error("Unexpected error occurred while fetching profile for user %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while fetching the user."
@@ -59,24 +59,24 @@ async def update_profile(
         profile_service: AbstractProfileService = Depends(Provide[Application.services.profile_service]),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> ProfileResponse:
-    log_service.info(f"User {requesting_user.id} is updating profile")
+    log_service.info("User %s is updating profile", requesting_user.id)
     try:
         updated_user_dto = await profile_service.update_profile_by_user_id(
             requesting_user,
             profile_update
         )
-        log_service.info(f"Profile updated successfully for user_id = {updated_user_dto.id}")
+        log_service.info("Profile updated successfully for user_id = %s", updated_user_dto.id)
     except NotFoundError as exc:
-        log_service.error(f"User with ID {requesting_user.id} not found for update: {str(exc)}")
+        log_service.error("User with ID %s not found for update: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except NoFieldsToUpdateError as exc:
-        log_service.error(f"No fields to update for user with ID {requesting_user.id}: {str(exc)}")
+        log_service.error("No fields to update for user with ID %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(status.HTTP_400_BAD_REQUEST, str(exc))
     except UniqueConstraintError as exc:
-        log_service.error(f"Unique constraint violation for user with ID {requesting_user.id}: {str(exc)}")
+        log_service.error("Unique constraint violation for user with ID %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(status.HTTP_409_CONFLICT, str(exc))
     except Exception as exc:
-        log_service.error(f"Unexpected error occurred while updating profile for user {requesting_user.id}: {str(exc)}")
+        log_service.error("Unexpected error occurred while updating profile for user %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while updating profile."
@@ -96,15 +96,15 @@ async def delete_profile(
         user_service: AbstractProfileService = Depends(Provide[Application.services.profile_service]),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> dict:
-    log_service.info(f"Attempting to delete profile for user_id = {requesting_user.id}")
+    log_service.info("Attempting to delete profile for user_id = %s", requesting_user.id)
     try:
         await user_service.delete_user_by_id(requesting_user)
-        log_service.info(f"User with user_id = {requesting_user.id} deleted successfully.")
+        log_service.info("User with user_id = %s deleted successfully.", requesting_user.id)
     except NotFoundError as exc:
-        log_service.error(f"User with ID {requesting_user.id} not found for deletion: {str(exc)}")
+        log_service.error("User with ID %s not found for deletion: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(status.HTTP_404_NOT_FOUND, str(exc))
     except Exception as exc:
-        log_service.error(f"Unexpected error occurred while deleting profile for user {requesting_user.id}: {str(exc)}")
+        log_service.error("Unexpected error occurred while deleting profile for user %s: %s", requesting_user.id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "An unexpected error occurred while deleting the user."
@@ -37,12 +37,12 @@ async def get_user_accounts(
             user_id,
             requesting_user
         )
-        log_service.info(f"Successfully fetched accounts for user ID {user_id}")
+        log_service.info("Successfully fetched accounts for user ID %s", user_id)
     except ForbiddenError as exc:
         raise exc
     except Exception as exc:
         raise exc
-        log_service.error(f"An unexpected error occurred while fetching accounts for user ID {user_id}: {str(exc)}")
+        log_service.error("An unexpected error occurred while fetching accounts for user ID %s: %s", user_id, exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching the list of accounts."
@@ -65,24 +65,24 @@ async def delete_account_by_id(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> None:
-    log_service.info(f"Deleting account with ID {account_id}")
+    log_service.info("Deleting account with ID %s", account_id)
     try:
         await account_management_service.delete_account_by_id(account_id, requesting_user)
-        log_service.info(f"Account with ID {account_id} deleted successfully")
+        log_service.info("Account with ID %s deleted successfully", account_id)
     except NotFoundError as exc:
-        log_service.warning(f"Account with ID {account_id} not found for deletion: {str(exc)}")
+        log_service.warning("Account with ID %s not found for deletion: %s", account_id, exc)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc)
         )
     except ForbiddenError as exc:
-        log_service.error(f"Forbidden error while deleting the account with ID {account_id}: {str(exc)}")
+        log_service.error("Forbidden error while deleting the account with ID %s: %s", account_id, exc)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(exc)
         )
     except Exception as exc:
-        log_service.error(f"An unexpected error while deleting the account with ID {account_id}: {str(exc)}")
+        log_service.error("An unexpected error while deleting the account with ID %s: %s", account_id, exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred while deleting the account with id {account_id}."
@@ -1,13 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from dependency_injector.wiring import Provide, inject
 
+from src.api.pagination import get_page_request
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.banks.bank_management import AbstractBankManagementService
 from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.page import PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
+from src.domain.exceptions.forbidden import ForbiddenError
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.mappers.bank import BankSchemaMapper
+from src.infrastructure.mappers.cache import CacheSchemaMapper
+from src.infrastructure.mappers.page import PageSchemaMapper
 from src.infrastructure.schemas.bank import BankResponse, BankCreateRequest, BankUpdateRequest
+from src.infrastructure.schemas.cache import CacheStatsResponse
+from src.infrastructure.schemas.page import PageResponse
 from src.infrastructure.exceptions.repository_exceptions import (
     NotFoundError,
     UniqueConstraintError,
@@ -17,6 +25,35 @@ from src.infrastructure.exceptions.repository_exceptions import (
 router = APIRouter(prefix="/banks", tags=["Banks Management"])
 
 
+@router.get("/cache/stats", response_model=CacheStatsResponse, responses={
+    403: {"description": "Insufficient permissions"},
+    500: {"description": "Unexpected server error"}
+})
+@inject
+async def get_bank_cache_stats(
+        requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
+        bank_management_service: AbstractBankManagementService = Depends(
+            Provide[Application.services.bank_management_service]
+        ),
+        log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
+) -> CacheStatsResponse:
+    try:
+        stats_dto = await bank_management_service.get_bank_cache_stats(requesting_user)
+    except ForbiddenError as exc:
+        log_service.warning("User with ID %s is not allowed to read bank cache stats", requesting_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(exc)
+        )
+    except Exception as exc:
+        log_service.error("An unexpected error occurred while fetching bank cache stats: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while fetching bank cache stats."
+        )
+    return CacheSchemaMapper.to_response(stats_dto)
+
+
 @router.get("/{bank_id}", response_model=BankResponse, responses={
     404: {"description": "Bank not found"},
     500: {"description": "Unexpected server error"}
@@ -31,15 +68,15 @@ async def get_bank_by_id(
 ) -> BankResponse:
     try:
         bank_dto = await bank_management_service.get_bank_by_id(bank_id)
-        log_service.info(f"Successfully fetched bank with ID {bank_id}")
+        log_service.info("Successfully fetched bank with ID %s", bank_id)
     except NotFoundError as exc:
-        log_service.warning(f"Bank with ID {bank_id} not found: {str(exc)}")
+        log_service.warning("Bank with ID %s not found: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc)
         )
     except Exception as exc:
-        log_service.error(f"An unexpected error occurred while fetching the bank with ID {bank_id}: {str(exc)}")
+        log_service.error("An unexpected error occurred while fetching the bank with ID %s: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching the bank."
@@ -47,26 +84,30 @@ async def get_bank_by_id(
     return BankSchemaMapper.to_response(bank_dto)
 
 
-@router.get("/", response_model=list[BankResponse], responses={
+@router.get("/", response_model=PageResponse[BankResponse], responses={
+    400: {"description": "Invalid page cursor"},
     500: {"description": "Unexpected server error"}
 })
 @inject
 async def get_banks(
+        page_request: PageRequestDTO = Depends(get_page_request),
         bank_management_service: AbstractBankManagementService = Depends(
             Provide[Application.services.bank_management_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[BankResponse]:
+) -> PageResponse[BankResponse]:
     try:
-        banks = await bank_management_service.get_banks()
-        log_service.info(f"Successfully fetched {len(banks)} banks")
+        banks = await bank_management_service.get_banks(page_request)
+        log_service.info("Successfully fetched %s banks", len(banks.items))
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except Exception as exc:
-        log_service.error(f"An unexpected error occurred while fetching the list of banks: {str(exc)}")
+        log_service.error("An unexpected error occurred while fetching the list of banks: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching the list of banks."
         )
-    return banks
+    return PageSchemaMapper.to_response(banks, BankSchemaMapper.to_response)
 
 
 @router.post("/", response_model=BankResponse, responses={
@@ -82,21 +123,21 @@ async def create_bank(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> BankResponse:
-    log_service.info(f"Creating bank with name {bank_create.name}")
+    log_service.info("Creating bank with name %s", bank_create.name)
     try:
         created_bank = await bank_management_service.create_bank(bank_create, requesting_user)
-        log_service.info(f"Bank with name {created_bank.name} and ID {created_bank.id} successfully created")
+        log_service.info("Bank with name %s and ID %s successfully created", created_bank.name, created_bank.id)
     except UniqueConstraintError as exc:
-        log_service.error(
-            f"Unique constraint violation while creating the bank with name {bank_create.name}: {str(exc)}"
-        )
+        log_service.error("Unique constraint violation while creating the bank with name %s: %s", bank_create.name, exc)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc)
         )
     except Exception as exc:
         log_service.error(
-            f"An unexpected error occurred while creating the bank with name {bank_create.name}: {str(exc)}"
+            "An unexpected error occurred while creating the bank with name %s: %s",
+            bank_create.name,
+            exc
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -121,31 +162,31 @@ async def update_bank_by_id(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> BankResponse:
-    log_service.info(f"Updating bank with ID {bank_id}")
+    log_service.info("Updating bank with ID %s", bank_id)
     try:
         updated_bank = await bank_management_service.update_bank_by_id(bank_id, bank_update, requesting_user)
-        log_service.info(f"Bank with ID {bank_id} successfully updated")
+        log_service.info("Bank with ID %s successfully updated", bank_id)
     except NotFoundError as exc:
-        log_service.error(f"Bank with ID {bank_id} not found for update: {str(exc)}")
+        log_service.error("Bank with ID %s not found for update: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc)
         )
     except NoFieldsToUpdateError as exc:
-        log_service.error(f"No fields to update for bank with ID {bank_id}: {str(exc)}")
+        log_service.error("No fields to update for bank with ID %s: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc)
         )
     except UniqueConstraintError as exc:
-        log_service.error(f"Unique constraint violation while updating bank with ID {bank_id}: {str(exc)}")
+        log_service.error("Unique constraint violation while updating bank with ID %s: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc)
         )
     except Exception as exc:
         raise exc
-        log_service.error(f"An unexpected error while updating the bank with ID {bank_id}: {str(exc)}")
+        log_service.error("An unexpected error while updating the bank with ID %s: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred while updating the bank with id {bank_id}."
@@ -165,18 +206,18 @@ async def delete_bank_by_id(
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 
 ) -> dict:
-    log_service.info(f"Deleting bank with ID {bank_id}")
+    log_service.info("Deleting bank with ID %s", bank_id)
     try:
         await bank_management_service.delete_bank_by_id(bank_id)
-        log_service.info(f"Bank with ID {bank_id} deleted successfully")
+        log_service.info("Bank with ID %s deleted successfully", bank_id)
     except NotFoundError as exc:
-        log_service.warning(f"Bank with ID {bank_id} not found for deletion: {str(exc)}")
+        log_service.warning("Bank with ID %s not found for deletion: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc)
         )
     except Exception as exc:
-        log_service.error(f"An unexpected error while deleting the bank with ID {bank_id}: {str(exc)}")
+        log_service.error("An unexpected error while deleting the bank with ID %s: %s", bank_id, exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred while deleting the bank with id {bank_id}."
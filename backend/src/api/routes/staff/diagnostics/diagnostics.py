@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from dependency_injector.wiring import Provide, inject
+
+from src.api.security import get_current_active_auth_user
+from src.application.abstractions.diagnostics.profiling import AbstractProfilingService
+from src.application.abstractions.diagnostics.query_stats import AbstractQueryStatsService
+from src.application.abstractions.logs.log import AbstractLogService
+from src.application.dtos.user import UserAccessDTO
+from src.domain.exceptions.forbidden import ForbiddenError
+from src.infrastructure.dependencies.app import Application
+from src.infrastructure.exceptions.repository_exceptions import NotFoundError
+from src.infrastructure.mappers.query_stats import QueryStatsSchemaMapper
+from src.infrastructure.schemas.query_stats import QueryStatsResponse
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+
+@router.get("/queries", response_model=list[QueryStatsResponse], responses={
+    403: {"description": "Insufficient permissions"},
+    500: {"description": "Unexpected server error"}
+})
+@inject
+async def get_query_stats(
+        requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
+        query_stats_service: AbstractQueryStatsService = Depends(Provide[Application.services.query_stats_service]),
+        log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
+) -> list[QueryStatsResponse]:
+    try:
+        stats_dtos = await query_stats_service.get_query_stats(requesting_user)
+    except ForbiddenError as exc:
+        log_service.warning("User with ID %s is not allowed to read query stats", requesting_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(exc)
+        )
+    except Exception as exc:
+        log_service.error("An unexpected error occurred while fetching query stats: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while fetching query stats."
+        )
+    return [QueryStatsSchemaMapper.to_response(stats_dto) for stats_dto in stats_dtos]
+
+
+@router.delete("/queries", response_model=dict, status_code=status.HTTP_200_OK, responses={
+    403: {"description": "Insufficient permissions"},
+    500: {"description": "Unexpected server error"}
+})
+@inject
+async def reset_query_stats(
+        requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
+        query_stats_service: AbstractQueryStatsService = Depends(Provide[Application.services.query_stats_service]),
+        log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
+) -> dict:
+    try:
+        await query_stats_service.reset_query_stats(requesting_user)
+        log_service.info("User with ID %s reset the query stats", requesting_user.id)
+    except ForbiddenError as exc:
+        log_service.warning("User with ID %s is not allowed to reset query stats", requesting_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(exc)
+        )
+    except Exception as exc:
+        log_service.error("An unexpected error occurred while resetting query stats: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while resetting query stats."
+        )
+    return {"message": "Query stats reset successfully"}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse, responses={
+    403: {"description": "Insufficient permissions"},
+    404: {"description": "Profile not found"},
+    500: {"description": "Unexpected server error"}
+})
+@inject
+async def get_profile(
+        profile_id: str,
+        requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
+        profiling_service: AbstractProfilingService = Depends(Provide[Application.services.profiling_service]),
+        log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
+) -> PlainTextResponse:
+    try:
+        profile = await profiling_service.get_profile(profile_id, requesting_user)
+    except ForbiddenError as exc:
+        log_service.warning("User with ID %s is not allowed to read profile %s", requesting_user.id, profile_id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(exc)
+        )
+    except NotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc)
+        )
+    except Exception as exc:
+        log_service.error("An unexpected error occurred while fetching profile %s: %s", profile_id, exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while fetching the profile."
+        )
+    return PlainTextResponse(profile)
@@ -2,12 +2,17 @@ from fastapi import APIRouter, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.api.exceptions.exception_factory import HttpExceptionFactory
+from src.api.pagination import get_page_request
 from src.api.security import get_current_active_auth_user
 from src.application.abstractions.logs.log import AbstractLogService
 from src.application.abstractions.users.user_management import AbstractUserManagementService
+from src.application.dtos.page import PageRequestDTO
 from src.application.dtos.user import UserAccessDTO, UserReadDTO
+from src.domain.exceptions.pagination import InvalidCursorError
 from src.infrastructure.dependencies.app import Application
+from src.infrastructure.mappers.page import PageSchemaMapper
 from src.infrastructure.mappers.user import UserSchemaMapper
+from src.infrastructure.schemas.page import PageResponse
 from src.infrastructure.schemas.user import UserResponse, UserUpdateRequest
 from src.infrastructure.exceptions.repository_exceptions import (
     NotFoundError,
@@ -35,13 +40,16 @@ async def get_user_by_id(
 ) -> UserReadDTO:
     try:
         fetched_user_dto = await user_management_service.get_user_by_id(user_id, requesting_user)
-        log_service.info(f"User with ID {requesting_user.id} successfully fetched user with ID {user_id}.")
+        log_service.info("User with ID %s successfully fetched user with ID %s.", requesting_user.id, user_id)
     except NotFoundError as exc:
-        log_service.warning(f"User with ID {requesting_user.id} failed to fetch user with ID {user_id}: {str(exc)}")
+        log_service.warning("User with ID %s failed to fetch user with ID %s: %s", requesting_user.id, user_id, exc)
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
     except Exception as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} encountered an unexpected error while fetching user with ID {user_id}: {str(exc)}"
+            "User with ID %s encountered an unexpected error while fetching user with ID %s: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -50,31 +58,41 @@ async def get_user_by_id(
     return UserSchemaMapper.to_response(fetched_user_dto)
 
 
-@router.get("/", response_model=list[UserReadDTO], responses={
+@router.get("/", response_model=PageResponse[UserResponse], responses={
+    400: {"description": "Invalid page cursor"},
     401: {"description": "Invalid or expired token"},
     403: {"description": "User is inactive or lacks required role to access this resource"},
     500: {"description": "Unexpected server error"}
 })
 @inject
 async def get_users(
+        page_request: PageRequestDTO = Depends(get_page_request),
         requesting_user: UserAccessDTO = Depends(get_current_active_auth_user),
         user_management_service: AbstractUserManagementService = Depends(
             Provide[Application.services.user_management_service]
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
-) -> list[UserReadDTO]:
+) -> PageResponse[UserResponse]:
     try:
-        fetched_users_dto = await user_management_service.get_all_users(requesting_user)
-        log_service.info(f"User with ID {requesting_user.id} successfully fetched {len(fetched_users_dto)} users.")
+        fetched_users_dto = await user_management_service.get_all_users(page_request, requesting_user)
+        log_service.info(
+            "User with ID %s successfully fetched %s users.",
+            requesting_user.id,
+            len(fetched_users_dto.items)
+        )
+    except InvalidCursorError as exc:
+        raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except Exception as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} encountered an unexpected error while fetching users: {str(exc)}"
+            "User with ID %s encountered an unexpected error while fetching users: %s",
+            requesting_user.id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred fetching fetching the list of users."
         )
-    return [UserSchemaMapper.to_response(fetched_user_dto) for fetched_user_dto in fetched_users_dto]
+    return PageSchemaMapper.to_response(fetched_users_dto, UserSchemaMapper.to_response)
 
 
 @router.patch("/{user_id}", response_model=UserReadDTO, responses={
@@ -95,28 +113,40 @@ async def update_user_by_id(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> UserResponse:
-    log_service.info(f"User with ID {requesting_user.id} is updating user with ID {user_id}")
+    log_service.info("User with ID %s is updating user with ID %s", requesting_user.id, user_id)
     try:
         updated_user = await user_management_service.update_user_by_id(user_id, user_update)
-        log_service.info(f"User with ID {requesting_user.id} successfully updated user with ID {user_id}")
+        log_service.info("User with ID %s successfully updated user with ID %s", requesting_user.id, user_id)
     except NotFoundError as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} attempted to update user with ID {user_id}, but user not found: {str(exc)}"
+            "User with ID %s attempted to update user with ID %s, but user not found: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
     except NoFieldsToUpdateError as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} attempted to update user with ID {user_id}, but no fields to update: {str(exc)}"
+            "User with ID %s attempted to update user with ID %s, but no fields to update: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except UniqueConstraintError as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} attempted to update user with ID {user_id}, but a unique constraint violation occurred: {str(exc)}"
+            "User with ID %s attempted to update user with ID %s, but a unique constraint violation occurred: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
     except Exception as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} encountered an unexpected error while updating user with ID {user_id}: {str(exc)}"
+            "User with ID %s encountered an unexpected error while updating user with ID %s: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -140,18 +170,24 @@ async def delete_user_by_id(
         ),
         log_service: AbstractLogService = Depends(Provide[Application.services.log_service])
 ) -> dict:
-    log_service.info(f"User with ID {requesting_user.id} is attempting to delete user with ID {user_id}")
+    log_service.info("User with ID %s is attempting to delete user with ID %s", requesting_user.id, user_id)
     try:
         await user_management_service.delete_user_by_id(user_id)
-        log_service.info(f"User with ID {requesting_user.id} successfully deleted user with ID {user_id}")
+        log_service.info("User with ID %s successfully deleted user with ID %s", requesting_user.id, user_id)
     except NotFoundError as exc:
         log_service.warning(
-            f"User with ID {requesting_user.id} attempted to delete user with ID {user_id}, but user not found: {str(exc)}"
+            "User with ID %s attempted to delete user with ID %s, but user not found: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         HttpExceptionFactory.create_http_exception(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
     except Exception as exc:
         log_service.error(
-            f"User with ID {requesting_user.id} encountered an unexpected error while deleting user with ID {user_id}: {str(exc)}"
+            "User with ID %s encountered an unexpected error while deleting user with ID %s: %s",
+            requesting_user.id,
+            user_id,
+            exc
         )
         HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
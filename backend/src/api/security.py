@@ -9,12 +9,13 @@ from src.application.dtos.user import UserAccessDTO
 from src.domain.exceptions.forbidden import UserInactiveError
 from src.infrastructure.dependencies.app import Application
 from src.infrastructure.exceptions.jwt_exceptions import ExpiredTokenError, InvalidTokenError, TokenDecodeError
+from src.infrastructure.logger.context import LogContext
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
 
 @inject
-def get_current_active_auth_user(
+async def get_current_active_auth_user(
         token: str = Depends(oauth2_scheme),
         auth_service: AbstractAuthService = Depends(
             Provide[Application.services.auth_service]
@@ -23,8 +24,10 @@ def get_current_active_auth_user(
             Provide[Application.services.log_service]
         )
 ) -> UserAccessDTO:
+    """Declared async so that FastAPI runs it on the event loop rather than in its threadpool,
+    since the token cache of the auth service is not thread-safe."""
     try:
-        return auth_service.get_current_active_auth_user(token)
+        user = auth_service.get_current_active_auth_user(token)
     except ExpiredTokenError as exc:
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc))
     except InvalidTokenError as exc:
@@ -34,8 +37,10 @@ def get_current_active_auth_user(
     except UserInactiveError as exc:
         raise HttpExceptionFactory.create_http_exception(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
     except Exception as exc:
-        log_service.error(f"Unexpected error occurred: {str(exc)}")
+        log_service.error("Unexpected error occurred: %s", exc)
         raise HttpExceptionFactory.create_http_exception(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred."
         )
+    LogContext.bind(user_id=user.id)
+    return user
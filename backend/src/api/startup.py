@@ -1,12 +1,39 @@
 from fastapi import Depends
 from dependency_injector.wiring import Provide, inject
 
-from src.infrastructure.database.database_initializer import DatabaseInitializer
+from src.domain.abstractions.cache.invalidation import AbstractCacheInvalidationListener
+from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.domain.abstractions.metrics.loop_monitor import AbstractEventLoopMonitor
+from src.infrastructure.database.migrations.runner import MigrationRunner
 from src.infrastructure.dependencies.app import Application
 
 
 @inject
 async def app_startup(
-        database_initializer: DatabaseInitializer = Depends(Provide[Application.gateways.database_initializer])
+        database_connection: AbstractDatabaseConnection = Depends(Provide[Application.gateways.database_connection]),
+        migration_runner: MigrationRunner = Depends(Provide[Application.gateways.migration_runner]),
+        cache_invalidation_listener: AbstractCacheInvalidationListener = Depends(
+            Provide[Application.gateways.cache_invalidation_listener]
+        ),
+        loop_monitor: AbstractEventLoopMonitor = Depends(Provide[Application.core.loop_monitor])
 ) -> None:
-    await database_initializer.create_all_tables()
+    await loop_monitor.start()
+    await database_connection.connect()
+    await migration_runner.migrate()
+    await cache_invalidation_listener.start()
+
+
+@inject
+async def app_shutdown(
+        database_connection: AbstractDatabaseConnection = Depends(Provide[Application.gateways.database_connection]),
+        cache_invalidation_listener: AbstractCacheInvalidationListener = Depends(
+            Provide[Application.gateways.cache_invalidation_listener]
+        ),
+        loop_monitor: AbstractEventLoopMonitor = Depends(Provide[Application.core.loop_monitor]),
+        logger: AbstractLogger = Depends(Provide[Application.core.logger])
+) -> None:
+    await cache_invalidation_listener.stop()
+    await database_connection.close()
+    await loop_monitor.stop()
+    logger.close()
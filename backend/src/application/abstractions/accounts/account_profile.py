@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from src.application.dtos.account import AccountCreateDTO, AccountReadDTO, AccountUpdateClientDTO
 from src.application.dtos.user import UserAccessDTO
+from src.domain.entities.projection import Projection
 
 
 class AbstractAccountProfileService(ABC):
@@ -13,7 +14,7 @@ class AbstractAccountProfileService(ABC):
         pass
 
     @abstractmethod
-    async def get_accounts(self, requesting_user: UserAccessDTO) -> list[AccountCreateDTO]:
+    async def get_accounts(self, requesting_user: UserAccessDTO) -> list[Projection]:
         """Retrieve accounts associated with the requesting user."""
         pass
 
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 
 from src.application.dtos.addition import AdditionReadDTO, AdditionCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
+from src.domain.entities.projection import Projection
 
 
 class AbstractAdditionProfileService(ABC):
@@ -11,9 +13,10 @@ class AbstractAdditionProfileService(ABC):
     async def get_additions_by_account_id(
             self,
             account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[AdditionReadDTO]:
-        """Retrieve additions associated with the requesting account."""
+    ) -> PageReadDTO[Projection]:
+        """Retrieve a page of additions associated with the requesting account."""
         pass
 
     @abstractmethod
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractAuthRateLimitService(ABC):
+    """Abstract service for limiting authentication attempts before any credentials are checked."""
+
+    @abstractmethod
+    async def check_login(self, phone_number: str, client_ip: str) -> None:
+        """Raise if the phone number or the client address has made too many login attempts."""
+        pass
+
+    @abstractmethod
+    async def check_registration(self, phone_number: str, client_ip: str) -> None:
+        """Raise if the phone number or the client address has made too many registration attempts."""
+        pass
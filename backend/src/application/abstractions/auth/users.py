@@ -1,17 +1,12 @@
 from abc import ABC, abstractmethod
 
-from src.application.dtos.user import UserReadDTO
+from src.application.dtos.user import UserCredentialsDTO
 
 
 class AbstractAuthUserService(ABC):
     """Abstract service for user authentication and password management."""
 
     @abstractmethod
-    async def get_user_by_phone_number(self, phone_number: str) -> UserReadDTO:
-        """Retrieve a user by their phone number."""
-        pass
-
-    @abstractmethod
-    async def get_user_hashed_password_by_phone_number(self, phone_number: str) -> str:
-        """Retrieve the hashed password for a user based on their phone number."""
+    async def get_user_credentials_by_phone_number(self, phone_number: str) -> UserCredentialsDTO:
+        """Retrieve a user together with their hashed password by their phone number in a single query."""
         pass
@@ -1,6 +1,8 @@
 from abc import abstractmethod, ABC
 
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.bank import BankReadDTO, BankCreateDTO, BankUpdateDTO
+from src.application.dtos.cache import CacheStatsReadDTO
 from src.application.dtos.user import UserAccessDTO
 
 
@@ -13,8 +15,8 @@ class AbstractBankManagementService(ABC):
         pass
 
     @abstractmethod
-    async def get_banks(self) -> list[BankReadDTO]:
-        """Retrieve a list of banks."""
+    async def get_banks(self, page_request: PageRequestDTO) -> PageReadDTO[BankReadDTO]:
+        """Retrieve a page of banks."""
         pass
 
     @abstractmethod
@@ -36,3 +38,8 @@ class AbstractBankManagementService(ABC):
     async def delete_bank_by_id(self, bank_id: int, requesting_user: UserAccessDTO) -> None:
         """Delete a bank by its ID."""
         pass
+
+    @abstractmethod
+    async def get_bank_cache_stats(self, requesting_user: UserAccessDTO) -> CacheStatsReadDTO:
+        """Retrieve the hit and miss counters of the public bank cache."""
+        pass
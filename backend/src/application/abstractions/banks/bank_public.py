@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.bank import BankReadDTO
 from src.application.dtos.user import UserAccessDTO, UserReadDTO
 
@@ -13,6 +14,6 @@ class AbstractBankPublicService(ABC):
         pass
 
     @abstractmethod
-    async def get_banks(self) -> list[BankReadDTO]:
-        """Retrieve a list of banks."""
+    async def get_banks(self, page_request: PageRequestDTO) -> PageReadDTO[BankReadDTO]:
+        """Retrieve a page of banks."""
         pass
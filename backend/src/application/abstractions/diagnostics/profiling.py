@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from src.application.dtos.user import UserAccessDTO
+
+
+class AbstractProfilingService(ABC):
+    """Abstract service for profiling single requests on demand."""
+
+    @abstractmethod
+    async def start_profiling(self, requesting_user: UserAccessDTO) -> str:
+        """Start profiling the request being handled and return the id of its profile."""
+        pass
+
+    @abstractmethod
+    async def stop_profiling(self, profile_id: str) -> None:
+        """Stop profiling the request and store its profile."""
+        pass
+
+    @abstractmethod
+    async def get_profile(self, profile_id: str, requesting_user: UserAccessDTO) -> str:
+        """Retrieve a stored profile in the folded stack format read by flame graph tools."""
+        pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from src.application.dtos.query_stats import QueryStatsReadDTO
+from src.application.dtos.user import UserAccessDTO
+
+
+class AbstractQueryStatsService(ABC):
+    """Abstract service for reading the statistics of the database queries run by the application."""
+
+    @abstractmethod
+    async def get_query_stats(self, requesting_user: UserAccessDTO) -> list[QueryStatsReadDTO]:
+        """Retrieve the statistics of every query fingerprint, the one with the most total time first."""
+        pass
+
+    @abstractmethod
+    async def reset_query_stats(self, requesting_user: UserAccessDTO) -> None:
+        """Forget the statistics collected so far."""
+        pass
@@ -8,6 +8,7 @@ from src.application.dtos.loan import (
     LoanTransactionCreateDTO,
     LoanTransactionReadDTO
 )
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 
 
@@ -44,6 +45,7 @@ class AbstractLoanProfileService(ABC):
     async def get_loan_transactions_by_loan_account_id(
             self,
             loan_account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[LoanTransactionReadDTO]:
+    ) -> PageReadDTO[LoanTransactionReadDTO]:
         pass
\ No newline at end of file
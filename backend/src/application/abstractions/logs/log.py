@@ -1,20 +1,25 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class AbstractLogService(ABC):
-    """Abstract service for logging different types of messages."""
+    """Abstract service for logging different types of messages.
+
+    Messages take %-style positional arguments, formatted only if the message is written, and keyword
+    arguments that are logged as structured fields.
+    """
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
         """Log an informational message."""
         pass
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
         """Log an error message."""
         pass
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
         """Log a warning message."""
         pass
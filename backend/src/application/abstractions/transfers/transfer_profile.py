@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 
 from src.application.dtos.transfer import TransferReadDTO, TransferCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
+from src.domain.entities.projection import Projection
 
 
 class AbstractTransferProfileService(ABC):
@@ -11,9 +13,10 @@ class AbstractTransferProfileService(ABC):
     async def get_transfers_by_account_id(
             self,
             account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[TransferReadDTO]:
-        """Retrieve transfers associated with the requesting account."""
+    ) -> PageReadDTO[Projection]:
+        """Retrieve a page of transfers associated with the requesting account."""
         pass
 
     @abstractmethod
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserUpdateDTO, UserReadDTO, UserAccessDTO
 
 
@@ -12,8 +13,12 @@ class AbstractUserManagementService(ABC):
         pass
 
     @abstractmethod
-    async def get_all_users(self, requesting_user: UserAccessDTO) -> list[UserReadDTO]:
-        """Retrieve a list of users."""
+    async def get_all_users(
+            self,
+            page_request: PageRequestDTO,
+            requesting_user: UserAccessDTO
+    ) -> PageReadDTO[UserReadDTO]:
+        """Retrieve a page of users."""
         pass
 
     @abstractmethod
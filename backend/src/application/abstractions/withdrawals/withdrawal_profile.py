@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 
 from src.application.dtos.withdrawal import WithdrawalReadDTO, WithdrawalCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
+from src.domain.entities.projection import Projection
 
 
 class AbstractWithdrawalProfileService(ABC):
@@ -11,9 +13,10 @@ class AbstractWithdrawalProfileService(ABC):
     async def get_withdrawals_by_account_id(
             self,
             account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[WithdrawalReadDTO]:
-        """Retrieve withdrawals associated with the requesting account."""
+    ) -> PageReadDTO[Projection]:
+        """Retrieve a page of withdrawals associated with the requesting account."""
         pass
 
     @abstractmethod
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheStatsReadDTO:
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    size: int
+    max_size: int
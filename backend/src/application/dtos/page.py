@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PageReadDTO(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class PageRequestDTO:
+    limit: int
+    cursor: Optional[str] = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QueryStatsReadDTO:
+    fingerprint: str
+    count: int
+    total_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    rows: int
+    callers: list[str]
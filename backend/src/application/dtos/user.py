@@ -19,6 +19,12 @@ class UserReadDTO:
     updated_at: datetime
 
 
+@dataclass(frozen=True)
+class UserCredentialsDTO:
+    user: UserReadDTO
+    hashed_password: str
+
+
 @dataclass(frozen=True)
 class UserCreateDTO:
     name: str
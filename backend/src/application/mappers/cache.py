@@ -0,0 +1,18 @@
+from src.application.dtos.cache import CacheStatsReadDTO
+from src.domain.entities.cache import CacheStats
+
+
+class CacheMapper:
+    """Utility class for mapping cache statistics to DTOs."""
+
+    @staticmethod
+    def map_cache_stats_to_cache_stats_read_dto(stats: CacheStats) -> CacheStatsReadDTO:
+        lookups = stats.hits + stats.misses
+        return CacheStatsReadDTO(
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_ratio=stats.hits / lookups if lookups else 0.0,
+            evictions=stats.evictions,
+            size=stats.size,
+            max_size=stats.max_size
+        )
@@ -81,9 +81,11 @@ class EnterpriseMapper:
         return EnterprisePayrollRequestReadDTO(
             status=request.status,
             passport_numbers=request.passport_numbers,
+            accounts_id=request.accounts_id,
             enterprise=enterprise_read_dto,
             specialist=specialist_read_dto,
             created_at=request.created_at,
+            amount=request.amount,
             updated_at=request.updated_at,
             id=request.id
         )
@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable, Optional, TypeVar
+
+from src.application.dtos.page import PageReadDTO
+from src.domain.entities.page import Page, PageCursor
+from src.domain.exceptions.pagination import InvalidCursorError
+
+T = TypeVar("T")
+D = TypeVar("D")
+
+
+class PageMapper:
+    """Utility class for mapping between pages of domain entities, page DTOs and opaque cursor tokens."""
+
+    @staticmethod
+    def map_page_to_page_read_dto(
+            page: Page[T],
+            item_mapper: Optional[Callable[[T], D]] = None
+    ) -> PageReadDTO:
+        """Maps every item with the item mapper, or keeps the items as they are if there is none."""
+        return PageReadDTO(
+            items=[item_mapper(item) for item in page.items] if item_mapper else page.items,
+            next_cursor=PageMapper.encode_cursor(page.next_cursor) if page.next_cursor else None
+        )
+
+    @staticmethod
+    def encode_cursor(cursor: PageCursor) -> str:
+        payload = json.dumps([cursor.created_at.isoformat(), cursor.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(token: Optional[str]) -> Optional[PageCursor]:
+        if token is None:
+            return None
+        try:
+            payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            created_at, cursor_id = json.loads(payload)
+            return PageCursor(created_at=datetime.fromisoformat(created_at), id=int(cursor_id))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            raise InvalidCursorError(token)
@@ -0,0 +1,19 @@
+from src.application.dtos.query_stats import QueryStatsReadDTO
+from src.domain.entities.query_stats import QueryStats
+
+
+class QueryStatsMapper:
+    """Utility class for mapping query statistics to DTOs."""
+
+    @staticmethod
+    def map_query_stats_to_query_stats_read_dto(stats: QueryStats) -> QueryStatsReadDTO:
+        return QueryStatsReadDTO(
+            fingerprint=stats.fingerprint,
+            count=stats.count,
+            total_ms=round(stats.total_seconds * 1000, 3),
+            p50_ms=round(stats.p50_seconds * 1000, 3),
+            p99_ms=round(stats.p99_seconds * 1000, 3),
+            max_ms=round(stats.max_seconds * 1000, 3),
+            rows=stats.rows,
+            callers=list(stats.callers)
+        )
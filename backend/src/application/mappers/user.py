@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from src.domain.entities.user import User
-from src.application.dtos.user import UserCreateDTO, UserReadDTO, UserUpdateDTO
+from src.application.dtos.user import UserCreateDTO, UserCredentialsDTO, UserReadDTO, UserUpdateDTO
 from src.domain.enums.user import UserRole
 
 
@@ -56,3 +56,10 @@ class UserMapper:
             created_at=user.created_at,
             updated_at=user.updated_at
         )
+
+    @staticmethod
+    def map_user_to_user_credentials_dto(user: User) -> UserCredentialsDTO:
+        return UserCredentialsDTO(
+            user=UserMapper.map_user_to_user_read_dto(user),
+            hashed_password=user.hashed_password
+        )
@@ -3,13 +3,16 @@ from src.application.dtos.account import AccountReadDTO, AccountCreateDTO, Accou
 from src.application.dtos.user import UserAccessDTO
 from src.application.mappers.account import AccountMapper
 from src.application.services.accounts.access_control import AccountProfileAccessControlService as AccessControl
+from src.domain.abstractions.cache.cache import AbstractCache
 from src.domain.abstractions.database.uows.account import AbstractAccountUnitOfWork
+from src.domain.entities.projection import Projection
 from src.domain.enums.account import AccountType, AccountStatus
 
 
 class AccountProfileService(AbstractAccountProfileService):
-    def __init__(self, uow: AbstractAccountUnitOfWork):
+    def __init__(self, uow: AbstractAccountUnitOfWork, account_cache: AbstractCache):
         self.uow = uow
+        self.account_cache = account_cache
 
     async def get_account_by_id(self, account_id: int, requesting_user: UserAccessDTO) -> AccountReadDTO:
         async with self.uow as uow:
@@ -18,12 +21,10 @@ class AccountProfileService(AbstractAccountProfileService):
         account_dto = AccountMapper.map_account_to_account_read_dto(account)
         return account_dto
 
-    async def get_accounts(self, requesting_user: UserAccessDTO) -> list[AccountReadDTO]:
+    async def get_accounts(self, requesting_user: UserAccessDTO) -> list[Projection]:
+        """Accounts are read as projections straight from the rows, since listing them involves no domain logic."""
         AccessControl.can_get_accounts(requesting_user)
-        async with self.uow as uow:
-            accounts = await self.uow.account_repository.get_accounts_by_user_id(requesting_user.id)
-        accounts_dto = [AccountMapper.map_account_to_account_read_dto(account) for account in accounts]
-        return accounts_dto
+        return await self.account_cache.get_or_load(requesting_user.id, lambda: self._load_accounts(requesting_user.id))
 
     async def create_account(
             self,
@@ -39,6 +40,7 @@ class AccountProfileService(AbstractAccountProfileService):
         )
         async with self.uow as uow:
             created_account = await self.uow.account_repository.create_account(account_create)
+        self.account_cache.invalidate(requesting_user.id)
         created_account_dto = AccountMapper.map_account_to_account_read_dto(created_account)
         return created_account_dto
 
@@ -53,5 +55,10 @@ class AccountProfileService(AbstractAccountProfileService):
             AccessControl.can_update_account(current_account.user_id, requesting_user)
             account_update = AccountMapper.map_account_update_client_dto_to_account(account_update_dto, current_account)
             updated_account = await self.uow.account_repository.update_account(account_id, account_update)
+        self.account_cache.invalidate(updated_account.user_id)
         updated_account_dto = AccountMapper.map_account_to_account_read_dto(updated_account)
         return updated_account_dto
+
+    async def _load_accounts(self, user_id: int) -> list[Projection]:
+        async with self.uow as uow:
+            return await self.uow.account_repository.get_account_projections_by_user_id(user_id)
@@ -1,11 +1,14 @@
 from src.application.abstractions.additions.addition_profile import AbstractAdditionProfileService
 from src.application.dtos.addition import AdditionReadDTO, AdditionCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 from src.application.mappers.addition import AdditionMapper
+from src.application.mappers.page import PageMapper
 from src.application.services.additions.access_control import AdditionProfileAccessControlService as AccessControl
 from src.domain.abstractions.database.uows.addition import AbstractAdditionUnitOfWork
+from src.domain.entities.projection import Projection
 from src.domain.enums.account import AccountStatus, AccountType
-from src.domain.exceptions.account import InactiveAccountError, InvalidAccountTypeError
+from src.domain.exceptions.account import InvalidAccountTypeError
 
 
 class AdditionProfileService(AbstractAdditionProfileService):
@@ -15,15 +18,21 @@ class AdditionProfileService(AbstractAdditionProfileService):
     async def get_additions_by_account_id(
             self,
             account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[AdditionReadDTO]:
+    ) -> PageReadDTO[Projection]:
+        cursor = PageMapper.decode_cursor(page_request.cursor)
         async with self.uow as uow:
             account = await uow.account_repository.get_account_by_id(account_id)
             AccessControl.can_get_additions(account.user_id, requesting_user)
 
-            additions = await uow.addition_repository.get_additions_by_account_id(account_id)
+            additions = await uow.addition_repository.get_addition_projections_by_account_id(
+                account_id,
+                page_request.limit,
+                cursor
+            )
 
-        additions_dto = [AdditionMapper.map_addition_to_addition_read_dto(addition) for addition in additions]
+        additions_dto = PageMapper.map_page_to_page_read_dto(additions)
         return additions_dto
 
     async def create_addition(
@@ -35,14 +44,15 @@ class AdditionProfileService(AbstractAdditionProfileService):
         async with self.uow as uow:
             account = await uow.account_repository.get_account_by_id(account_id)
             AccessControl.can_create_addition(account.user_id, requesting_user)
-            if account.status is not AccountStatus.ACTIVE:
-                raise InactiveAccountError(account.status)
             if account.type is not AccountType.SETTLEMENT:
                 raise InvalidAccountTypeError(account.type, AccountType.SETTLEMENT)
-            new_account_balance = account.balance + addition_create_dto.amount
+            await uow.account_repository.credit_account_balance(
+                account_id,
+                addition_create_dto.amount,
+                required_status=AccountStatus.ACTIVE
+            )
             addition_create = AdditionMapper.map_addition_create_dto_to_addition(addition_create_dto, account_id)
             created_addition = await uow.addition_repository.create_addition(addition_create)
-            await uow.account_repository.update_account_balance(account_id, new_account_balance)
 
         created_addition_dto = AdditionMapper.map_addition_to_addition_read_dto(created_addition)
         return created_addition_dto
@@ -1,19 +1,33 @@
+import hashlib
+import time
+
 from src.application.abstractions.auth.auth import AbstractAuthService
 from src.application.abstractions.auth.payload import AbstractPayloadExtractorService
 from src.application.abstractions.auth.token import AbstractTokenService
 from src.application.dtos.user import UserAccessDTO
+from src.domain.abstractions.cache.cache import AbstractCache
 
 
 class AuthService(AbstractAuthService):
     def __init__(
             self,
             token_service: AbstractTokenService,
-            payload_extractor_service: AbstractPayloadExtractorService
+            payload_extractor_service: AbstractPayloadExtractorService,
+            token_cache: AbstractCache
     ):
         self.token_service = token_service
         self.payload_extractor_service = payload_extractor_service
+        self.token_cache = token_cache
 
     def get_current_active_auth_user(self, token: str) -> UserAccessDTO:
+        """Verified tokens are cached by digest until they expire, so the signature of a token
+        is checked once per worker instead of on every request that presents it."""
+        token_digest = hashlib.sha256(token.encode()).digest()
+        user_access_dto = self.token_cache.get(token_digest)
+        if user_access_dto is not None:
+            return user_access_dto
+
         payload = self.token_service.decode_token(token)
         user_access_dto = self.payload_extractor_service.extract_user_from_payload(payload)
+        self.token_cache.set(token_digest, user_access_dto, ttl=payload["exp"] - time.time())
         return user_access_dto
@@ -19,16 +19,12 @@ class LoginService(AbstractLoginService):
         self.token_service = token_service
 
     async def validate_auth_user(self, phone_number: str, password: str) -> bool:
-        hashed_password = await self.auth_user_service.get_user_hashed_password_by_phone_number(phone_number)
-        if not hashed_password or not self.password_service.validate_password(password, hashed_password):
-            return False
-        return True
+        user_credentials = await self.auth_user_service.get_user_credentials_by_phone_number(phone_number)
+        return await self.password_service.validate_password(password, user_credentials.hashed_password)
 
     async def authenticate_user(self, phone_number: str, password: str) -> Optional[str]:
-        user = await self.auth_user_service.get_user_by_phone_number(phone_number)
-        is_valid = await self.validate_auth_user(phone_number, password)
-        if not is_valid:
+        user_credentials = await self.auth_user_service.get_user_credentials_by_phone_number(phone_number)
+        if not await self.password_service.validate_password(password, user_credentials.hashed_password):
             raise InvalidLoginError()
 
-        return self.token_service.create_access_token(user)
-
+        return self.token_service.create_access_token(user_credentials.user)
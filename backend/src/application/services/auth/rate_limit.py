@@ -0,0 +1,23 @@
+from src.application.abstractions.auth.rate_limit import AbstractAuthRateLimitService
+from src.domain.abstractions.security.rate_limiter import AbstractRateLimiter
+from src.infrastructure.exceptions.security_exceptions import RateLimitExceededError
+
+
+class AuthRateLimitService(AbstractAuthRateLimitService):
+    """Each attempt takes a token from the bucket of the client address and from the bucket of the phone number,
+    so neither spraying one account from many addresses nor many accounts from one address gets through."""
+
+    def __init__(self, rate_limiter: AbstractRateLimiter):
+        self.rate_limiter = rate_limiter
+
+    async def check_login(self, phone_number: str, client_ip: str) -> None:
+        await self._check(("login_ip", client_ip), ("login_phone", phone_number))
+
+    async def check_registration(self, phone_number: str, client_ip: str) -> None:
+        await self._check(("registration_ip", client_ip), ("registration_phone", phone_number))
+
+    async def _check(self, *buckets: tuple[str, str]) -> None:
+        for rule, key in buckets:
+            retry_after = await self.rate_limiter.acquire(rule, key)
+            if retry_after > 0:
+                raise RateLimitExceededError(retry_after)
@@ -1,14 +1,20 @@
 from src.application.mappers.bank import BankMapper
+from src.application.mappers.cache import CacheMapper
+from src.application.mappers.page import PageMapper
 from src.application.services.banks.access_control import BankManagementAccessControlService
 from src.application.abstractions.banks.bank_management import AbstractBankManagementService
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.bank import BankReadDTO, BankCreateDTO, BankUpdateDTO
+from src.application.dtos.cache import CacheStatsReadDTO
 from src.application.dtos.user import UserAccessDTO
+from src.domain.abstractions.cache.cache import AbstractCache
 from src.domain.abstractions.database.uows.bank import AbstractBankUnitOfWork
 
 
 class BankManagementService(AbstractBankManagementService):
-    def __init__(self, uow: AbstractBankUnitOfWork):
+    def __init__(self, uow: AbstractBankUnitOfWork, bank_cache: AbstractCache):
         self.uow = uow
+        self.bank_cache = bank_cache
 
     async def get_bank_by_id(self, bank_id: int) -> BankReadDTO:
         async with self.uow as uow:
@@ -16,10 +22,11 @@ class BankManagementService(AbstractBankManagementService):
         bank_dto = BankMapper.map_bank_to_bank_read_dto(bank)
         return bank_dto
 
-    async def get_banks(self) -> list[BankReadDTO]:
+    async def get_banks(self, page_request: PageRequestDTO) -> PageReadDTO[BankReadDTO]:
+        cursor = PageMapper.decode_cursor(page_request.cursor)
         async with self.uow as uow:
-            banks = await uow.bank_repository.get_banks()
-        banks_dto = [BankMapper.map_bank_to_bank_read_dto(bank) for bank in banks]
+            banks = await uow.bank_repository.get_banks(page_request.limit, cursor)
+        banks_dto = PageMapper.map_page_to_page_read_dto(banks, BankMapper.map_bank_to_bank_read_dto)
         return banks_dto
 
     async def create_bank(self, bank_create_dto: BankCreateDTO, requesting_user: UserAccessDTO) -> BankReadDTO:
@@ -28,6 +35,7 @@ class BankManagementService(AbstractBankManagementService):
         bank_create = BankMapper.map_bank_create_dto_to_addition(bank_create_dto)
         async with self.uow as uow:
             new_bank = await uow.bank_repository.create_bank(bank_create)
+        self.bank_cache.clear()
 
         new_bank_dto = BankMapper.map_bank_to_bank_read_dto(new_bank)
         return new_bank_dto
@@ -44,6 +52,7 @@ class BankManagementService(AbstractBankManagementService):
             current_bank = await uow.bank_repository.get_bank_by_id(bank_id)
             bank_update = BankMapper.map_bank_update_dto_to_bank(bank_update_dto, current_bank)
             updated_bank = await uow.bank_repository.update_bank_by_id(bank_id, bank_update)
+        self.bank_cache.clear()
 
         updated_bank_dto = BankMapper.map_bank_to_bank_read_dto(updated_bank)
         return updated_bank_dto
@@ -52,3 +61,8 @@ class BankManagementService(AbstractBankManagementService):
         BankManagementAccessControlService.can_delete_bank(requesting_user)
         async with self.uow as uow:
             await uow.bank_repository.delete_bank_by_id(bank_id)
+        self.bank_cache.clear()
+
+    async def get_bank_cache_stats(self, requesting_user: UserAccessDTO) -> CacheStatsReadDTO:
+        BankManagementAccessControlService.can_get_banks(requesting_user)
+        return CacheMapper.map_cache_stats_to_cache_stats_read_dto(self.bank_cache.stats())
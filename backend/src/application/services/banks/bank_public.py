@@ -1,21 +1,38 @@
+from typing import Optional
+
 from src.application.abstractions.banks.bank_public import AbstractBankPublicService
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.bank import BankReadDTO
 from src.application.mappers.bank import BankMapper
+from src.application.mappers.page import PageMapper
+from src.domain.abstractions.cache.cache import AbstractCache
 from src.domain.abstractions.database.uows.bank import AbstractBankUnitOfWork
+from src.domain.entities.page import PageCursor
 
 
 class BankPublicService(AbstractBankPublicService):
-    def __init__(self, uow: AbstractBankUnitOfWork):
+    def __init__(self, uow: AbstractBankUnitOfWork, bank_cache: AbstractCache):
         self.uow = uow
+        self.bank_cache = bank_cache
 
     async def get_bank_by_id(self, bank_id: int) -> BankReadDTO:
+        return await self.bank_cache.get_or_load(("bank", bank_id), lambda: self._load_bank_by_id(bank_id))
+
+    async def get_banks(self, page_request: PageRequestDTO) -> PageReadDTO[BankReadDTO]:
+        cursor = PageMapper.decode_cursor(page_request.cursor)
+        return await self.bank_cache.get_or_load(
+            ("banks", page_request.limit, page_request.cursor),
+            lambda: self._load_banks(page_request.limit, cursor)
+        )
+
+    async def _load_bank_by_id(self, bank_id: int) -> BankReadDTO:
         async with self.uow as uow:
             bank = await uow.bank_repository.get_bank_by_id(bank_id)
         bank_dto = BankMapper.map_bank_to_bank_read_dto(bank)
         return bank_dto
 
-    async def get_banks(self) -> list[BankReadDTO]:
+    async def _load_banks(self, limit: int, cursor: Optional[PageCursor]) -> PageReadDTO[BankReadDTO]:
         async with self.uow as uow:
-            banks = await uow.bank_repository.get_banks()
-        banks_dto = [BankMapper.map_bank_to_bank_read_dto(bank) for bank in banks]
+            banks = await uow.bank_repository.get_banks(limit, cursor)
+        banks_dto = PageMapper.map_page_to_page_read_dto(banks, BankMapper.map_bank_to_bank_read_dto)
         return banks_dto
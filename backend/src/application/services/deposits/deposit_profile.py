@@ -63,28 +63,38 @@ class DepositProfileService(AbstractDepositProfileService):
             deposit_transaction_create_client_dto: DepositTransactionCreateClientDTO,
             requesting_user: UserAccessDTO
     ) -> DepositTransactionReadDTO:
-        async with self.uow as uow:
-            deposit_account = await self.uow.deposit_repository.get_deposit_account_by_id(
-                deposit_transaction_create_client_dto.deposit_account_id
-            )
-            AccessControl.can_create_deposit_transaction(deposit_account.user_id, requesting_user)
-            account = await self.uow.account_repository.get_account_by_id(deposit_account.account_id)
-            receiver_account = await self.uow.account_repository.get_account_by_id(
-                deposit_transaction_create_client_dto.account_id
-            )
-            created_deposit_transaction = await self.uow.deposit_repository.create_deposit_transaction(
-                DepositTransaction(
-                    from_account_id=deposit_transaction_create_client_dto.deposit_account_id,
-                    to_account_id=deposit_transaction_create_client_dto.account_id,
-                    type=DepositTransactionType.WITHDRAWAL,
-                    amount=account.balance
-                )
-            )
-            await self.uow.account_repository.update_account_balance(
-                receiver_account.id,
-                receiver_account.balance + account.balance
-            )
-            await self.uow.account_repository.update_account_balance(account.id, 0)
-            await self.uow.account_repository.update_account_status(account.id, AccountStatus.BLOCKED)
+        created_deposit_transaction = await self.uow.run(
+            self._transfer_from_deposit_to_account,
+            deposit_transaction_create_client_dto,
+            requesting_user
+        )
         return DepositMapper.map_deposit_transaction_to_deposit_transaction_read_dto(created_deposit_transaction)
 
+    async def _transfer_from_deposit_to_account(
+            self,
+            deposit_transaction_create_client_dto: DepositTransactionCreateClientDTO,
+            requesting_user: UserAccessDTO
+    ) -> DepositTransaction:
+        deposit_account = await self.uow.deposit_repository.get_deposit_account_by_id(
+            deposit_transaction_create_client_dto.deposit_account_id
+        )
+        AccessControl.can_create_deposit_transaction(deposit_account.user_id, requesting_user)
+        accounts = await self.uow.account_repository.lock_accounts(
+            [deposit_account.account_id, deposit_transaction_create_client_dto.account_id]
+        )
+        account = accounts[deposit_account.account_id]
+        created_deposit_transaction = await self.uow.deposit_repository.create_deposit_transaction(
+            DepositTransaction(
+                from_account_id=deposit_transaction_create_client_dto.deposit_account_id,
+                to_account_id=deposit_transaction_create_client_dto.account_id,
+                type=DepositTransactionType.WITHDRAWAL,
+                amount=account.balance
+            )
+        )
+        await self.uow.account_repository.credit_account_balance(
+            deposit_transaction_create_client_dto.account_id,
+            account.balance
+        )
+        await self.uow.account_repository.debit_account_balance(account.id, account.balance)
+        await self.uow.account_repository.update_account_status(account.id, AccountStatus.BLOCKED)
+        return created_deposit_transaction
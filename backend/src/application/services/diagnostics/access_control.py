@@ -0,0 +1,25 @@
+from src.application.dtos.user import UserAccessDTO
+from src.domain.enums.user import UserRole
+from src.domain.exceptions.forbidden import ForbiddenError
+
+
+class DiagnosticsAccessControlService:
+    """Service for controlling access to the diagnostics of the application."""
+
+    @staticmethod
+    def can_read_diagnostics(requesting_user: UserAccessDTO) -> bool:
+        if UserRole(requesting_user.role) in [
+            UserRole.ADMINISTRATOR,
+            UserRole.MANAGER,
+            UserRole.OPERATOR
+        ]:
+            return True
+        raise ForbiddenError()
+
+    @staticmethod
+    def can_reset_diagnostics(requesting_user: UserAccessDTO) -> bool:
+        if UserRole(requesting_user.role) in [
+            UserRole.ADMINISTRATOR
+        ]:
+            return True
+        raise ForbiddenError()
@@ -0,0 +1,20 @@
+from src.application.abstractions.diagnostics.profiling import AbstractProfilingService
+from src.application.dtos.user import UserAccessDTO
+from src.application.services.diagnostics.access_control import DiagnosticsAccessControlService
+from src.domain.abstractions.metrics.profiler import AbstractRequestProfiler
+
+
+class ProfilingService(AbstractProfilingService):
+    def __init__(self, profiler: AbstractRequestProfiler):
+        self.profiler = profiler
+
+    async def start_profiling(self, requesting_user: UserAccessDTO) -> str:
+        DiagnosticsAccessControlService.can_read_diagnostics(requesting_user)
+        return self.profiler.start()
+
+    async def stop_profiling(self, profile_id: str) -> None:
+        await self.profiler.stop(profile_id)
+
+    async def get_profile(self, profile_id: str, requesting_user: UserAccessDTO) -> str:
+        DiagnosticsAccessControlService.can_read_diagnostics(requesting_user)
+        return await self.profiler.load(profile_id)
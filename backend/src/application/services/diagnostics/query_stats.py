@@ -0,0 +1,19 @@
+from src.application.abstractions.diagnostics.query_stats import AbstractQueryStatsService
+from src.application.dtos.query_stats import QueryStatsReadDTO
+from src.application.dtos.user import UserAccessDTO
+from src.application.mappers.query_stats import QueryStatsMapper
+from src.application.services.diagnostics.access_control import DiagnosticsAccessControlService
+from src.domain.abstractions.database.query_interceptor import AbstractQueryStatsInterceptor
+
+
+class QueryStatsService(AbstractQueryStatsService):
+    def __init__(self, query_stats: AbstractQueryStatsInterceptor):
+        self.query_stats = query_stats
+
+    async def get_query_stats(self, requesting_user: UserAccessDTO) -> list[QueryStatsReadDTO]:
+        DiagnosticsAccessControlService.can_read_diagnostics(requesting_user)
+        return [QueryStatsMapper.map_query_stats_to_query_stats_read_dto(stats) for stats in self.query_stats.stats()]
+
+    async def reset_query_stats(self, requesting_user: UserAccessDTO) -> None:
+        DiagnosticsAccessControlService.can_reset_diagnostics(requesting_user)
+        self.query_stats.reset()
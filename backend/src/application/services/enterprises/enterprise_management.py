@@ -13,6 +13,7 @@ from src.domain.entities.account import Account
 from src.domain.enums.account import AccountType, AccountStatus
 from src.domain.enums.enterprise import EnterprisePayrollRequestStatus
 from src.domain.enums.user import UserRole
+from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class EnterpriseManagementService(AbstractEnterpriseManagementService):
@@ -67,28 +68,39 @@ class EnterpriseManagementService(AbstractEnterpriseManagementService):
                 raise ValueError(".......................")
             enterprise = await self.uow.enterprise_repository.get_enterprise_by_id(enterprise_payroll_request.enterprise_id)
             account = await self.uow.account_repository.get_account_by_id(enterprise.account_id)
-            for user_passport_number in enterprise_payroll_request.passport_numbers:
-                # raise not found error if no user
-                user = await self.uow.user_repository.get_user_by_passport_number(user_passport_number)
-
-                await self.uow.account_repository.create_account(
-                    Account(
-                        user_id=user,
-                        bank_id=enterprise.bank_id,
-                        type=AccountType.SALARY,
-                        status=AccountStatus.ACTIVE
-                    )
+            users = await self.uow.user_repository.get_users_by_passport_numbers(
+                enterprise_payroll_request.passport_numbers
+            )
+            found_passport_numbers = {user.passport_number for user in users}
+            missing_passport_numbers = [
+                passport_number for passport_number in enterprise_payroll_request.passport_numbers
+                if passport_number not in found_passport_numbers
+            ]
+            if missing_passport_numbers:
+                raise NotFoundError(f"Users with passport numbers {missing_passport_numbers} not found")
+            await self.uow.account_repository.create_accounts([
+                Account(
+                    user_id=user.id,
+                    bank_id=enterprise.bank_id,
+                    type=AccountType.SALARY,
+                    status=AccountStatus.ACTIVE
                 )
+                for user in users
+            ])
             specialist = await self.uow.enterprise_repository.get_enterprise_specialist_by_id(enterprise_payroll_request.specialist_id)
             user = await self.uow.user_repository.get_user_by_id(specialist.user_id)
             enterprise_payroll_request = await self.uow.enterprise_repository.update_payroll_request_status_by_id(
                 enterprise_payroll_request.id,
                 EnterprisePayrollRequestStatus.APPROVED
             )
-        user_dto = UserMapper.map_user_to_user_read_dto(user)
-        specialist_dto = EnterpriseMapper.map_enterprise_specialist_to_enterprise_specialist_read_dto(specialist, user_dto)
         account_dto = AccountMapper.map_account_to_account_read_dto(account)
         enterprise_dto = EnterpriseMapper.map_enterprise_to_enterprise_read_dto(enterprise, account_dto)
+        user_dto = UserMapper.map_user_to_user_read_dto(user)
+        specialist_dto = EnterpriseMapper.map_enterprise_specialist_to_enterprise_specialist_read_dto(
+            specialist,
+            user_dto,
+            enterprise_dto
+        )
         enterprise_payroll_request_dto = EnterpriseMapper.map_enterprise_payroll_request_to_enterprise_payroll_request_read_dto(
             enterprise_payroll_request,
             enterprise_dto,
@@ -4,6 +4,7 @@ from src.application.mappers.account import AccountMapper
 from src.application.mappers.enterprise import EnterpriseMapper
 from src.application.mappers.user import UserMapper
 from src.domain.abstractions.database.uows.enterprise import AbstractEnterpriseUnitOfWork
+from src.domain.entities.enterprise import EnterprisePayrollTransaction
 from src.application.services.enterprises.access_control import EnterpriseSpecialistAccessControlService as AccessControl
 from src.domain.exceptions.account import InsufficientFundsError
 from src.application.dtos.enterprise import (
@@ -108,18 +109,33 @@ class EnterpriseSpecialistService(AbstractEnterpriseSpecialistService):
             enterprise_payroll_request_id: int,
             requesting_user: UserAccessDTO
     ) -> None:
-        async with self.uow as uow:
-            enterprise_payroll_request = await self.uow.enterprise_repository.get_enterprise_payroll_request_by_id(enterprise_payroll_request_id)
-            specialist = await self.uow.enterprise_repository.get_enterprise_specialist_by_id(enterprise_payroll_request.specialist_id)
-            AccessControl.can_make_enterprise_payroll_request(specialist.user_id, requesting_user)
-            enterprise = await self.uow.enterprise_repository.get_enterprise_by_id(enterprise_payroll_request.enterprise_id)
-            enterprise_account = await self.uow.account_repository.get_account_by_id(enterprise.account_id)
-            payment_amount = len(enterprise_payroll_request.passport_numbers) * enterprise_payroll_request.amount
-            if payment_amount > enterprise_account.balance:
-                raise InsufficientFundsError(enterprise_account.balance)
-            for account_id in enterprise_payroll_request.accounts_id:
-                user_account = await self.uow.account_repository.get_account_by_id(account_id)
-                new_account_balance = user_account.balance + enterprise_payroll_request.amount
-                await self.uow.account_repository.update_account_balance(user_account.id, new_account_balance)
-            new_enterprise_account_balance = enterprise_account.balance - payment_amount
-            await self.uow.account_repository.update_account_balance(enterprise_account.id, new_enterprise_account_balance)
\ No newline at end of file
+        await self.uow.run(self._make_enterprise_payroll_request, enterprise_payroll_request_id, requesting_user)
+
+    async def _make_enterprise_payroll_request(
+            self,
+            enterprise_payroll_request_id: int,
+            requesting_user: UserAccessDTO
+    ) -> None:
+        enterprise_payroll_request = await self.uow.enterprise_repository.get_enterprise_payroll_request_by_id(enterprise_payroll_request_id)
+        specialist = await self.uow.enterprise_repository.get_enterprise_specialist_by_id(enterprise_payroll_request.specialist_id)
+        AccessControl.can_make_enterprise_payroll_request(specialist.user_id, requesting_user)
+        enterprise = await self.uow.enterprise_repository.get_enterprise_by_id(enterprise_payroll_request.enterprise_id)
+        # Every account is locked in id order in one statement, like in transfers, so that the payroll cannot
+        # deadlock with them; only the debited account is read.
+        await self.uow.account_repository.lock_account_ids(
+            [enterprise.account_id, *enterprise_payroll_request.accounts_id]
+        )
+        accounts = await self.uow.account_repository.lock_accounts([enterprise.account_id])
+        enterprise_account = accounts[enterprise.account_id]
+        payment_amount = len(enterprise_payroll_request.passport_numbers) * enterprise_payroll_request.amount
+        if payment_amount > enterprise_account.balance:
+            raise InsufficientFundsError(enterprise_account.balance)
+        await self.uow.account_repository.credit_accounts_balance(
+            enterprise_payroll_request.accounts_id,
+            enterprise_payroll_request.amount
+        )
+        await self.uow.account_repository.debit_account_balance(enterprise_account.id, payment_amount)
+        await self.uow.enterprise_repository.create_enterprise_payroll_transactions([
+            EnterprisePayrollTransaction(payroll_request_id=enterprise_payroll_request.id)
+            for _ in enterprise_payroll_request.accounts_id
+        ])
@@ -1,8 +1,10 @@
 from src.application.abstractions.loans.loan_profile import AbstractLoanProfileService
 from src.application.dtos.account import AccountCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
 from src.application.mappers.account import AccountMapper
 from src.application.mappers.loan import LoanMapper
+from src.application.mappers.page import PageMapper
 from src.domain.abstractions.database.uows.loan import AbstractLoanUnitOfWork
 from src.application.services.loans.access_control import LoanProfileAccessControlService as AccessControl
 from src.domain.entities.loan import LoanAccount
@@ -88,8 +90,9 @@ class LoanProfileService(AbstractLoanProfileService):
                 raise InsufficientFundsError(account.balance)
             loan = await self.uow.loan_repository.get_loan_by_id(loan_account.loan_id)
             max_allowed_payment = loan.amount * loan.interest_rate
-            loan_transactions = await self.uow.loan_repository.get_loan_transactions_by_loan_account_id(loan_account_id)
-            already_paid = sum(loan_transaction.amount for loan_transaction in loan_transactions)
+            already_paid = await self.uow.loan_repository.get_loan_transactions_total_by_loan_account_id(
+                loan_account_id
+            )
             if already_paid + loan_transaction_create_dto.amount > max_allowed_payment:
                 raise PaymentExceedsLimitError(
                     payment_amount=loan_transaction_create_dto.amount,
@@ -101,9 +104,10 @@ class LoanProfileService(AbstractLoanProfileService):
                 LoanTransactionType.PAYMENT
             )
             created_loan_transaction = await self.uow.loan_repository.create_loan_transaction(loan_transaction)
-            await self.uow.account_repository.update_account_balance(
+            await self.uow.account_repository.debit_account_balance(
                 account.id,
-                account.balance - created_loan_transaction.amount
+                created_loan_transaction.amount,
+                required_status=AccountStatus.ACTIVE
             )
             if already_paid + loan_transaction_create_dto.amount == max_allowed_payment:
                 if account.balance == 0:
@@ -119,14 +123,21 @@ class LoanProfileService(AbstractLoanProfileService):
     async def get_loan_transactions_by_loan_account_id(
             self,
             loan_account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[LoanTransactionReadDTO]:
+    ) -> PageReadDTO[LoanTransactionReadDTO]:
+        cursor = PageMapper.decode_cursor(page_request.cursor)
         async with self.uow as uow:
             loan_account = await self.uow.loan_repository.get_loan_account_by_id(loan_account_id)
             AccessControl.can_get_loan_transactions(loan_account.user_id, requesting_user)
-            loan_transactions = await self.uow.loan_repository.get_loan_transactions_by_loan_account_id(loan_account_id)
+            loan_transactions = await self.uow.loan_repository.get_loan_transactions_by_loan_account_id(
+                loan_account_id,
+                page_request.limit,
+                cursor
+            )
 
-        loan_transactions_dto = [
-            LoanMapper.map_loan_transaction_to_loan_transaction_read_dto(loan_transaction) for loan_transaction in loan_transactions
-        ]
+        loan_transactions_dto = PageMapper.map_page_to_page_read_dto(
+            loan_transactions,
+            LoanMapper.map_loan_transaction_to_loan_transaction_read_dto
+        )
         return loan_transactions_dto
@@ -1,3 +1,5 @@
+from typing import Any
+
 from src.domain.abstractions.logger.logger import AbstractLogger
 from src.application.abstractions.logs.log import AbstractLogService
 
@@ -6,11 +8,11 @@ class LogService(AbstractLogService):
     def __init__(self, logger: AbstractLogger):
         self.logger = logger
 
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        self.logger.info(message, *args, **fields)
 
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
+        self.logger.error(message, *args, **fields)
 
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        self.logger.warning(message, *args, **fields)
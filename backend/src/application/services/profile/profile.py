@@ -1,22 +1,21 @@
 from typing import Optional
 
-from src.application.dtos.profile import ProfileUpdateDTO
+from src.application.dtos.profile import ProfileReadDTO, ProfileUpdateDTO
 from src.application.dtos.user import UserAccessDTO
 from src.application.mappers.profile import ProfileMapper
 from src.application.abstractions.profile.profile import AbstractProfileService
+from src.domain.abstractions.cache.cache import AbstractCache
 from src.domain.abstractions.database.uows.user import AbstractUserUnitOfWork
 from src.domain.entities.user import User
 
 
 class ProfileService(AbstractProfileService):
-    def __init__(self, uow: AbstractUserUnitOfWork):
+    def __init__(self, uow: AbstractUserUnitOfWork, profile_cache: AbstractCache):
         self.uow = uow
+        self.profile_cache = profile_cache
 
     async def get_profile(self, requesting_user: UserAccessDTO) -> Optional[User]:
-        async with self.uow as uow:
-            user = await uow.user_repository.get_user_by_id(requesting_user.id)
-        profile_dto = ProfileMapper.map_user_to_profile_read_dto(user)
-        return profile_dto
+        return await self.profile_cache.get_or_load(requesting_user.id, lambda: self._load_profile(requesting_user.id))
 
     async def update_profile_by_user_id(
             self,
@@ -27,6 +26,7 @@ class ProfileService(AbstractProfileService):
             current_user = await uow.user_repository.get_user_by_id(requesting_user.id)
             user_update = ProfileMapper.map_profile_update_dto_to_user(profile_update_dto, current_user)
             updated_user = await uow.user_repository.update_user_by_id(requesting_user.id, user_update)
+        self.profile_cache.invalidate(requesting_user.id)
 
         updated_profile_dto = ProfileMapper.map_user_to_profile_read_dto(updated_user)
         return updated_profile_dto
@@ -34,3 +34,10 @@ class ProfileService(AbstractProfileService):
     async def delete_user_by_id(self, requesting_user: UserAccessDTO) -> None:
         async with self.uow as uow:
             await uow.user_repository.delete_user_by_id(requesting_user.id)
+        self.profile_cache.invalidate(requesting_user.id)
+
+    async def _load_profile(self, user_id: int) -> ProfileReadDTO:
+        async with self.uow as uow:
+            user = await uow.user_repository.get_user_by_id(user_id)
+        profile_dto = ProfileMapper.map_user_to_profile_read_dto(user)
+        return profile_dto
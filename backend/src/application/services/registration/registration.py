@@ -16,9 +16,20 @@ class UserRegistrationService(AbstractUserRegistrationService):
         self.password_handler = password_handler
 
     async def _create_user(self, user_create_dto: UserCreateDTO, role: UserRole) -> UserReadDTO:
-        """General method to create a user for a specific role."""
+        """General method to create a user for a specific role.
 
-        hashed_password = self.password_handler.hash_password(user_create_dto.password)
+        Uniqueness is checked before the password is hashed, so a duplicate registration is rejected
+        without spending a bcrypt round; the unique constraints still guard against concurrent inserts.
+        """
+
+        async with self.uow as uow:
+            await self.uow.user_repository.check_user_uniqueness(
+                user_create_dto.passport_number,
+                user_create_dto.phone_number,
+                user_create_dto.email
+            )
+
+        hashed_password = await self.password_handler.hash_password(user_create_dto.password)
 
         user_create = UserMapper.map_user_create_dto_to_user(
             user_create_dto,
@@ -4,9 +4,14 @@ from src.application.dtos.user import UserAccessDTO
 from src.application.mappers.transfer import TransferMapper
 from src.domain.abstractions.database.uows.transfer import AbstractTransferUnitOfWork
 from src.application.services.transfer.access_control import TransferManagementAccessControlService as AccessControl
+from src.domain.entities.transfer import Transfer
 from src.domain.enums.account import AccountStatus
 from src.domain.enums.transfer import TransferStatus
-from src.domain.exceptions.account import SuspendedAccountOperationError
+from src.domain.exceptions.account import (
+    SuspendedAccountOperationError,
+    InactiveAccountError,
+    InsufficientFundsError
+)
 from src.domain.exceptions.transfer import TransferAlreadyCanceledError, InsufficientRecipientBalanceError
 
 
@@ -23,32 +28,39 @@ class TransferManagementService(AbstractTransferManagementService):
 
     async def reverse_transfer_by_id(self, transfer_id: int, requesting_user: UserAccessDTO) -> TransferReadDTO:
         AccessControl.can_reverse_transaction(requesting_user)
-        async with self.uow as uow:
-            transfer = await self.uow.transfer_repository.get_transfer_by_id(transfer_id)
-            if transfer.status is TransferStatus.CANCELED:
-                raise TransferAlreadyCanceledError(transfer.id, transfer.status)
-            sender_account = await self.uow.account_repository.get_account_by_id(transfer.from_account_id)
-            if sender_account.status is not AccountStatus.ACTIVE:
-                raise SuspendedAccountOperationError(sender_account.id, sender_account.status)
-            receive_account = await self.uow.account_repository.get_account_by_id(transfer.to_account_id)
-            if receive_account.status is not AccountStatus.ACTIVE:
-                raise SuspendedAccountOperationError(receive_account.id, receive_account.status)
-            if receive_account.balance < transfer.amount:
-                raise InsufficientRecipientBalanceError(
-                    account_id=receive_account.id,
-                    current_balance=receive_account.balance,
-                    required_amount=transfer.amount
-                )
-
-            new_sender_account_balance = sender_account.balance + transfer.amount
-            new_receive_account_balance = receive_account.balance - transfer.amount
-            await self.uow.account_repository.update_account_balance(sender_account.id, new_sender_account_balance)
-            await self.uow.account_repository.update_account_balance(receive_account.id, new_receive_account_balance)
-
-            updated_transfer = await self.uow.transfer_repository.update_transfer_status_by_id(
-                transfer.id,
-                TransferStatus.CANCELED
-            )
+        updated_transfer = await self.uow.run(self._reverse_transfer_by_id, transfer_id)
         updated_transfer_dto = TransferMapper.map_transfer_to_transfer_read_dto(updated_transfer)
         return updated_transfer_dto
 
+    async def _reverse_transfer_by_id(self, transfer_id: int) -> Transfer:
+        transfer = await self.uow.transfer_repository.get_transfer_by_id(transfer_id)
+        await self.uow.account_repository.lock_accounts([transfer.from_account_id, transfer.to_account_id])
+        # The guarded update matches only a completed transfer in the database, so of two concurrent
+        # reversals the second waits for the row and then finds the transfer already canceled.
+        canceled_transfer = await self.uow.transfer_repository.cancel_completed_transfer_by_id(transfer.id)
+        if canceled_transfer is None:
+            raise TransferAlreadyCanceledError(transfer.id, TransferStatus.CANCELED)
+        try:
+            await self.uow.account_repository.debit_account_balance(
+                transfer.to_account_id,
+                transfer.amount,
+                required_status=AccountStatus.ACTIVE
+            )
+        except InactiveAccountError as exc:
+            raise SuspendedAccountOperationError(transfer.to_account_id, exc.current_status)
+        except InsufficientFundsError as exc:
+            raise InsufficientRecipientBalanceError(
+                account_id=transfer.to_account_id,
+                current_balance=exc.current_balance,
+                required_amount=transfer.amount
+            )
+        try:
+            await self.uow.account_repository.credit_account_balance(
+                transfer.from_account_id,
+                transfer.amount,
+                required_status=AccountStatus.ACTIVE
+            )
+        except InactiveAccountError as exc:
+            raise SuspendedAccountOperationError(transfer.from_account_id, exc.current_status)
+
+        return canceled_transfer
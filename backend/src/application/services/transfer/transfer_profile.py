@@ -1,9 +1,13 @@
 from src.application.abstractions.transfers.transfer_profile import AbstractTransferProfileService
 from src.application.dtos.transfer import TransferReadDTO, TransferCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
+from src.application.mappers.page import PageMapper
 from src.application.mappers.transfer import TransferMapper
 from src.application.services.transfer.access_control import TransferProfileAccessControlService as AccessControl
 from src.domain.abstractions.database.uows.transfer import AbstractTransferUnitOfWork
+from src.domain.entities.projection import Projection
+from src.domain.entities.transfer import Transfer
 from src.domain.enums.account import AccountStatus
 from src.domain.exceptions.account import InactiveAccountError
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
@@ -16,13 +20,19 @@ class TransferProfileService(AbstractTransferProfileService):
     async def get_transfers_by_account_id(
             self,
             account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[TransferReadDTO]:
+    ) -> PageReadDTO[Projection]:
+        cursor = PageMapper.decode_cursor(page_request.cursor)
         async with self.uow as uow:
             account = await uow.account_repository.get_account_by_id(account_id)
             AccessControl.can_get_transfers(account.user_id, requesting_user)
-            transfers = await uow.transfer_repository.get_transfers_by_account_id(account_id)
-        transfers_dto = [TransferMapper.map_transfer_to_transfer_read_dto(transfer) for transfer in transfers]
+            transfers = await uow.transfer_repository.get_transfer_projections_by_account_id(
+                account_id,
+                page_request.limit,
+                cursor
+            )
+        transfers_dto = PageMapper.map_page_to_page_read_dto(transfers)
         return transfers_dto
 
     async def create_transfer(
@@ -30,22 +40,29 @@ class TransferProfileService(AbstractTransferProfileService):
             transfer_create_dto: TransferCreateDTO,
             requesting_user: UserAccessDTO
     ) -> TransferReadDTO:
-        async with self.uow as uow:
-            sender_account = await uow.account_repository.get_account_by_id(transfer_create_dto.from_account_id)
-            AccessControl.can_create_transfer(sender_account.user_id, requesting_user)
-            if sender_account.status is not AccountStatus.ACTIVE:
-                raise InactiveAccountError(sender_account.status)
-            receive_account = await uow.account_repository.get_account_by_id(transfer_create_dto.to_account_id)
-            if receive_account.status is not AccountStatus.ACTIVE:
-                raise NotFoundError(f"Account with id {receive_account.status} not found")
-
-            new_sender_account_balance = sender_account.balance - transfer_create_dto.amount
-            new_receiver_account_balance = receive_account.balance + transfer_create_dto.amount
-            transfer_create = TransferMapper.map_transfer_create_dto_to_transfer(transfer_create_dto)
-
-            created_transfer = await uow.transfer_repository.create_transfer(transfer_create)
-            await uow.account_repository.update_account_balance(sender_account.id, new_sender_account_balance)
-            await uow.account_repository.update_account_balance(receive_account.id, new_receiver_account_balance)
-
+        created_transfer = await self.uow.run(self._create_transfer, transfer_create_dto, requesting_user)
         created_transfer_dto = TransferMapper.map_transfer_to_transfer_read_dto(created_transfer)
         return created_transfer_dto
+
+    async def _create_transfer(self, transfer_create_dto: TransferCreateDTO, requesting_user: UserAccessDTO) -> Transfer:
+        accounts = await self.uow.account_repository.lock_accounts(
+            [transfer_create_dto.from_account_id, transfer_create_dto.to_account_id]
+        )
+        sender_account = accounts[transfer_create_dto.from_account_id]
+        AccessControl.can_create_transfer(sender_account.user_id, requesting_user)
+        await self.uow.account_repository.debit_account_balance(
+            sender_account.id,
+            transfer_create_dto.amount,
+            required_status=AccountStatus.ACTIVE
+        )
+        try:
+            await self.uow.account_repository.credit_account_balance(
+                transfer_create_dto.to_account_id,
+                transfer_create_dto.amount,
+                required_status=AccountStatus.ACTIVE
+            )
+        except InactiveAccountError:
+            raise NotFoundError(f"Account with id {transfer_create_dto.to_account_id} not found")
+
+        transfer_create = TransferMapper.map_transfer_create_dto_to_transfer(transfer_create_dto)
+        return await self.uow.transfer_repository.create_transfer(transfer_create)
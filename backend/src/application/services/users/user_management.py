@@ -1,13 +1,17 @@
 from src.application.abstractions.users.user_management import AbstractUserManagementService
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO, UserReadDTO, UserUpdateDTO
+from src.application.mappers.page import PageMapper
 from src.application.mappers.user import UserMapper
 from src.application.services.users.access_control import UserManagementAccessControlService as AccessControl
+from src.domain.abstractions.cache.cache import AbstractCache
 from src.domain.abstractions.database.uows.user import AbstractUserUnitOfWork
 
 
 class UserManagementService(AbstractUserManagementService):
-    def __init__(self, uow: AbstractUserUnitOfWork):
+    def __init__(self, uow: AbstractUserUnitOfWork, profile_cache: AbstractCache):
         self.uow = uow
+        self.profile_cache = profile_cache
 
     async def get_user_by_id(self, user_id: int, requesting_user: UserAccessDTO) -> UserReadDTO:
         AccessControl.can_get_users(requesting_user)
@@ -16,11 +20,16 @@ class UserManagementService(AbstractUserManagementService):
         user_dto = UserMapper.map_user_to_user_read_dto(user)
         return user_dto
 
-    async def get_all_users(self, requesting_user: UserAccessDTO) -> list[UserReadDTO]:
+    async def get_all_users(
+            self,
+            page_request: PageRequestDTO,
+            requesting_user: UserAccessDTO
+    ) -> PageReadDTO[UserReadDTO]:
         AccessControl.can_get_users(requesting_user)
+        cursor = PageMapper.decode_cursor(page_request.cursor)
         async with self.uow as uow:
-            users = await uow.user_repository.get_users()
-        users_dto = [UserMapper.map_user_to_user_read_dto(user) for user in users]
+            users = await uow.user_repository.get_users(page_request.limit, cursor)
+        users_dto = PageMapper.map_page_to_page_read_dto(users, UserMapper.map_user_to_user_read_dto)
         return users_dto
 
     async def update_user_by_id(
@@ -36,6 +45,7 @@ class UserManagementService(AbstractUserManagementService):
             user_update = UserMapper.map_user_update_dto_to_user(user_update_dto, current_user)
 
             updated_user = await uow.user_repository.update_user_by_id(user_id, user_update)
+        self.profile_cache.invalidate(user_id)
 
         updated_user_dto = UserMapper.map_user_to_user_read_dto(updated_user)
         return updated_user_dto
@@ -45,3 +55,4 @@ class UserManagementService(AbstractUserManagementService):
 
         async with self.uow as uow:
             await uow.user_repository.delete_user_by_id(user_id)
+        self.profile_cache.invalidate(user_id)
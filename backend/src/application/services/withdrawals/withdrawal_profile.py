@@ -1,11 +1,14 @@
 from src.application.abstractions.withdrawals.withdrawal_profile import AbstractWithdrawalProfileService
 from src.application.dtos.withdrawal import WithdrawalReadDTO, WithdrawalCreateDTO
+from src.application.dtos.page import PageReadDTO, PageRequestDTO
 from src.application.dtos.user import UserAccessDTO
+from src.application.mappers.page import PageMapper
 from src.application.mappers.withdrawal import WithdrawalMapper
 from src.application.services.withdrawals.access_control import WithdrawalProfileAccessControlService as AccessControl
 from src.domain.abstractions.database.uows.withdrawal import AbstractWithdrawalUnitOfWork
+from src.domain.entities.projection import Projection
 from src.domain.enums.account import AccountStatus, AccountType
-from src.domain.exceptions.account import InsufficientFundsError, InactiveAccountError, InvalidAccountTypeError
+from src.domain.exceptions.account import InvalidAccountTypeError
 
 
 class WithdrawalProfileService(AbstractWithdrawalProfileService):
@@ -15,16 +18,21 @@ class WithdrawalProfileService(AbstractWithdrawalProfileService):
     async def get_withdrawals_by_account_id(
             self,
             account_id: int,
+            page_request: PageRequestDTO,
             requesting_user: UserAccessDTO
-    ) -> list[WithdrawalReadDTO]:
+    ) -> PageReadDTO[Projection]:
+        cursor = PageMapper.decode_cursor(page_request.cursor)
         async with self.uow as uow:
             account = await self.uow.account_repository.get_account_by_id(account_id)
             AccessControl.can_get_withdrawals(account.user_id, requesting_user)
 
-            withdrawals = await self.uow.withdrawal_repository.get_withdrawals_by_account_id(account_id)
+            withdrawals = await self.uow.withdrawal_repository.get_withdrawal_projections_by_account_id(
+                account_id,
+                page_request.limit,
+                cursor
+            )
 
-        withdrawals_dto = [WithdrawalMapper.map_withdrawal_to_withdrawal_read_dto(withdrawal) for withdrawal in
-                           withdrawals]
+        withdrawals_dto = PageMapper.map_page_to_page_read_dto(withdrawals)
         return withdrawals_dto
 
     async def create_withdrawal(
@@ -35,15 +43,14 @@ class WithdrawalProfileService(AbstractWithdrawalProfileService):
         async with self.uow as uow:
             account = await uow.account_repository.get_account_by_id(withdrawal_create_dto.account_id)
             AccessControl.can_create_withdrawal(account.user_id, requesting_user)
-            if account.status is not AccountStatus.ACTIVE:
-                raise InactiveAccountError(account.status)
             if account.type is not AccountType.SETTLEMENT:
                 raise InvalidAccountTypeError(account.type, AccountType.SETTLEMENT)
-            new_account_balance = account.balance - withdrawal_create_dto.amount
-            if new_account_balance < 0:
-                raise InsufficientFundsError(account.balance)
+            await uow.account_repository.debit_account_balance(
+                withdrawal_create_dto.account_id,
+                withdrawal_create_dto.amount,
+                required_status=AccountStatus.ACTIVE
+            )
             created_withdrawal = await uow.withdrawal_repository.create_withdrawal(withdrawal_create_dto)
-            await uow.account_repository.update_account_balance(withdrawal_create_dto.account_id, new_account_balance)
 
         created_withdrawal_dto = WithdrawalMapper.map_withdrawal_to_withdrawal_read_dto(created_withdrawal)
         return created_withdrawal_dto
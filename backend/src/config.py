@@ -28,14 +28,21 @@ class DbSettings:
     password: str = os.environ.get("DB_PASS")
 
     url: str = f"postgres://{user}:{password}@{host}/{name}"
-    echo: bool = True
+    echo: bool = os.environ.get("DB_ECHO", "false").lower() == "true"
 
 
 class AuthJWT:
     jwt_config: dict = config["core"]["jwt_handler"]
-    public_key: str = read_key(BASE_DIR / jwt_config["public_key_path"])
-    private_key: str = read_key(BASE_DIR / jwt_config["private_key_path"])
-    algorithm: str = jwt_config["algorithm"]
+    signing_kid: str = jwt_config["signing_kid"]
+    keys: list[dict] = [
+        {
+            "kid": key["kid"],
+            "algorithm": key["algorithm"],
+            "public_key": read_key(BASE_DIR / key["public_key_path"]),
+            "private_key": read_key(BASE_DIR / key["private_key_path"]) if key.get("private_key_path") else None,
+        }
+        for key in jwt_config["keys"]
+    ]
     expire_minutes: int = jwt_config["expire_minutes"]
 
 
@@ -43,10 +50,17 @@ class Logger:
     log_config: dict = config["core"]["logging"]
 
 
+class Pagination:
+    pagination_config: dict = config["api"]["pagination"]
+    default_page_size: int = pagination_config["default_page_size"]
+    max_page_size: int = pagination_config["max_page_size"]
+
+
 class Settings:
     db: DbSettings = DbSettings()
     auth_jwt: AuthJWT = AuthJWT()
     logger: Logger = Logger()
+    pagination: Pagination = Pagination()
 
 
 settings = Settings()
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from src.domain.entities.cache import CacheStats
+
+T = TypeVar("T")
+
+
+class AbstractCache(ABC):
+    """Abstract class for an in-process cache of read results."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value cached for the key, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache the value for the key, for ttl seconds if given instead of the default time to live."""
+        pass
+
+    @abstractmethod
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for the key, calling the loader and caching its result on a miss."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, key: Hashable) -> None:
+        """Evict the value cached for the key."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Evict all cached values."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return the hit, miss and eviction counters of the cache."""
+        pass
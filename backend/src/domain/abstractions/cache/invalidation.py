@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractCacheInvalidationListener(ABC):
+    """Abstract class for evicting cached values when the underlying rows change in another process."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start listening for changes in the background."""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop listening and release the listener connection."""
+        pass
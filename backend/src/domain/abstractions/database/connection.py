@@ -1,24 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncContextManager
 
 
 class AbstractDatabaseConnection(ABC):
-    """Abstract class for managing a database connection."""
+    """Abstract class for managing a pool of database connections."""
 
     @abstractmethod
     async def connect(self) -> None:
-        """Establish a connection to the database."""
+        """Open the connection pool."""
         pass
 
     @abstractmethod
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the connection pool and all of its connections."""
         pass
 
-    @property
     @abstractmethod
-    def connection(self) -> Any:
-        """Get the current database connection instance."""
+    async def acquire(self) -> Any:
+        """Acquire a connection from the pool for exclusive use."""
+        pass
+
+    @abstractmethod
+    async def release(self, connection: Any) -> None:
+        """Return a previously acquired connection to the pool."""
+        pass
+
+    @abstractmethod
+    def connection(self) -> AsyncContextManager[Any]:
+        """Acquire a connection for the duration of an `async with` block."""
         pass
 
     @abstractmethod
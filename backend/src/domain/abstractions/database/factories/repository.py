@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.accounts import AbstractAccountRepository
 from src.domain.abstractions.database.repositories.additions import AbstractAdditionRepository
 from src.domain.abstractions.database.repositories.banks import AbstractBankRepository
@@ -13,37 +14,37 @@ from src.domain.abstractions.database.repositories.withdrawals import AbstractWi
 
 class AbstractRepositoryFactory(ABC):
     @abstractmethod
-    def create_account_repository(self, connection) -> AbstractAccountRepository:
+    def create_account_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractAccountRepository:
         pass
 
     @abstractmethod
-    def create_addition_repository(self, connection) -> AbstractAdditionRepository:
+    def create_addition_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractAdditionRepository:
         pass
 
     @abstractmethod
-    def create_bank_repository(self, connection) -> AbstractBankRepository:
+    def create_bank_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractBankRepository:
         pass
 
     @abstractmethod
-    def create_transfer_repository(self, connection) -> AbstractTransferRepository:
+    def create_transfer_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractTransferRepository:
         pass
 
     @abstractmethod
-    def create_user_repository(self, connection) -> AbstractUserRepository:
+    def create_user_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractUserRepository:
         pass
 
     @abstractmethod
-    def create_withdrawal_repository(self, connection) -> AbstractWithdrawalRepository:
+    def create_withdrawal_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractWithdrawalRepository:
         pass
 
     @abstractmethod
-    def create_loan_repository(self, connection) -> AbstractLoanRepository:
+    def create_loan_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractLoanRepository:
         pass
 
     @abstractmethod
-    def create_deposit_repository(self, connection) -> AbstractDepositRepository:
+    def create_deposit_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractDepositRepository:
         pass
 
     @abstractmethod
-    def create_enterprise_repository(self, connection) -> AbstractEnterpriseRepository:
+    def create_enterprise_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractEnterpriseRepository:
         pass
\ No newline at end of file
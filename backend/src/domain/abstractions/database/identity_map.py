@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AbstractIdentityMap(ABC):
+    """Abstract class for the entities loaded by id within a single unit of work."""
+
+    @abstractmethod
+    def get(self, entity_type: type[T], entity_id: int) -> Optional[T]:
+        """Return the loaded entity of the given type and id, or None if it has not been loaded."""
+        pass
+
+    @abstractmethod
+    def add(self, entity: T) -> T:
+        """Remember the current state of the entity and return it."""
+        pass
+
+    @abstractmethod
+    def remove(self, entity_type: type[Any], entity_id: int) -> None:
+        """Forget the entity, so that the next read goes to the database."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all loaded entities."""
+        pass
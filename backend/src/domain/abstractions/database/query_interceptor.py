@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.query_stats import QueryStats
+
+
+class AbstractQueryInterceptor(ABC):
+    """Abstract class for observing the queries run on the pooled database connections."""
+
+    @abstractmethod
+    def on_query(self, query: str, seconds: float, rows: int) -> None:
+        """Called after each query with its duration and the number of rows it returned or affected."""
+        pass
+
+
+class AbstractQueryStatsInterceptor(AbstractQueryInterceptor):
+    """Abstract class for collecting statistics of the queries grouped by their fingerprint."""
+
+    @abstractmethod
+    def stats(self) -> list[QueryStats]:
+        """Return the statistics of every fingerprint, the one with the most total time first."""
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget the statistics collected so far."""
+        pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from typing import Iterable, Optional
 
 from src.domain.entities.account import Account
+from src.domain.entities.projection import Projection
 from src.domain.enums.account import AccountStatus
 
 
@@ -22,6 +24,40 @@ class AbstractAccountRepository(ABC):
         """Fetches all accounts associated with a specific user."""
         pass
 
+    @abstractmethod
+    async def get_account_projections_by_user_id(self, user_id: int) -> list[Projection]:
+        """Fetches all accounts of a specific user as read-only projections."""
+        pass
+
+    @abstractmethod
+    async def credit_accounts_balance(self, account_ids: list[int], amount: Decimal) -> None:
+        """Atomically adds the amount to the balance of every listed account in a single statement.
+
+        An account listed several times is credited once per occurrence.
+
+        Raises:
+            NotFoundError: If any of the accounts with the specified ids is not found.
+        """
+        pass
+
+    @abstractmethod
+    async def lock_accounts(self, account_ids: Iterable[int]) -> dict[int, Account]:
+        """Locks the accounts for update in ascending id order and returns them keyed by id.
+
+        Raises:
+            NotFoundError: If any of the accounts with the specified ids is not found.
+        """
+        pass
+
+    @abstractmethod
+    async def lock_account_ids(self, account_ids: Iterable[int]) -> None:
+        """Locks the accounts for update in ascending id order like `lock_accounts`, without reading them.
+
+        Raises:
+            NotFoundError: If any of the accounts with the specified ids is not found.
+        """
+        pass
+
     @abstractmethod
     async def create_account(self, account_create: Account) -> Account:
         """Creates a new account.
@@ -32,6 +68,15 @@ class AbstractAccountRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_accounts(self, accounts_create: list[Account]) -> list[int]:
+        """Creates all accounts in a single statement and returns the ids of the created accounts.
+
+        Raises:
+            ForeignKeyError: If a referenced user or bank does not exist.
+        """
+        pass
+
     @abstractmethod
     async def update_account(self, account_id: int, account_update: Account) -> Account:
         """Updates an account by its unique identifier.
@@ -50,6 +95,37 @@ class AbstractAccountRepository(ABC):
     async def update_account_balance(self, account_id: int, new_balance: Decimal) -> None:
         pass
 
+    @abstractmethod
+    async def credit_account_balance(
+            self,
+            account_id: int,
+            amount: Decimal,
+            required_status: Optional[AccountStatus] = None
+    ) -> Account:
+        """Atomically adds the amount to the account balance and returns the updated account.
+
+        Raises:
+            NotFoundError: If the account with the specified id is not found.
+            InactiveAccountError: If the account is not in the required status.
+        """
+        pass
+
+    @abstractmethod
+    async def debit_account_balance(
+            self,
+            account_id: int,
+            amount: Decimal,
+            required_status: Optional[AccountStatus] = None
+    ) -> Account:
+        """Atomically subtracts the amount from the account balance and returns the updated account.
+
+        Raises:
+            NotFoundError: If the account with the specified id is not found.
+            InactiveAccountError: If the account is not in the required status.
+            InsufficientFundsError: If the balance is lower than the amount.
+        """
+        pass
+
     @abstractmethod
     async def delete_account_by_id(self, account_id: int) -> None:
         """Deletes an account by its unique identifier.
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.domain.entities.addition import Addition
+from src.domain.entities.page import Page, PageCursor
+from src.domain.entities.projection import Projection
 
 
 class AbstractAdditionRepository(ABC):
@@ -15,8 +18,8 @@ class AbstractAdditionRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_additions(self) -> list[Addition]:
-        """Fetches all additions from the repository."""
+    async def get_additions(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[Addition]:
+        """Fetches a page of additions ordered by creation time, starting after the cursor."""
         pass
 
     @abstractmethod
@@ -24,6 +27,11 @@ class AbstractAdditionRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_additions_by_account_id(self, account_id: int) -> list[Addition]:
-        """Fetches all additions associated with a specific user."""
+    async def get_addition_projections_by_account_id(
+            self,
+            account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[Projection]:
+        """Fetches a page of additions to a specific account as read-only projections, starting after the cursor."""
         pass
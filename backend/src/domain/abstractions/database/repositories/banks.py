@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.domain.entities.bank import Bank
+from src.domain.entities.page import Page, PageCursor
 
 
 class AbstractBankRepository(ABC):
@@ -16,8 +18,8 @@ class AbstractBankRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_banks(self) -> list[Bank]:
-        """Fetches banks from the repository."""
+    async def get_banks(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[Bank]:
+        """Fetches a page of banks ordered by creation time, starting after the cursor."""
         pass
 
     @abstractmethod
@@ -53,6 +53,14 @@ class AbstractEnterpriseRepository(ABC):
     ) -> EnterprisePayrollTransaction:
         pass
 
+    @abstractmethod
+    async def create_enterprise_payroll_transactions(
+            self,
+            enterprise_payroll_transactions: list[EnterprisePayrollTransaction]
+    ) -> None:
+        """Inserts all payroll transactions in a single statement."""
+        pass
+
     async def create_enterprise(self, enterprise: Enterprise) -> Enterprise:
         pass
 
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Optional
 
 from src.domain.entities.loan import Loan, LoanTransaction, LoanAccount
+from src.domain.entities.page import Page, PageCursor
 
 
 class AbstractLoanRepository(ABC):
@@ -31,8 +34,18 @@ class AbstractLoanRepository(ABC):
         """Fetches loan accounts associated with a specific user."""
         pass
 
-    async def get_loan_transactions_by_loan_account_id(self, loan_account_id: int) -> list[LoanTransaction]:
-        """Fetches loan transactions associated with a specific loan account."""
+    async def get_loan_transactions_by_loan_account_id(
+            self,
+            loan_account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[LoanTransaction]:
+        """Fetches a page of loan transactions associated with a specific loan account, starting after the cursor."""
+        pass
+
+    @abstractmethod
+    async def get_loan_transactions_total_by_loan_account_id(self, loan_account_id: int) -> Decimal:
+        """Fetches the total amount of loan transactions associated with a specific loan account."""
         pass
 
     async def create_loan(self, loan: Loan) -> Loan:
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from src.domain.entities.page import Page, PageCursor
+from src.domain.entities.projection import Projection
 from src.domain.entities.transfer import Transfer
 from src.domain.enums.transfer import TransferStatus
 
@@ -16,8 +19,13 @@ class AbstractTransferRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_transfers_by_account_id(self, account_id: int) -> list[Transfer]:
-        """Fetches all transfers associated with a specific user."""
+    async def get_transfer_projections_by_account_id(
+            self,
+            account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[Projection]:
+        """Fetches a page of transfers sent or received by a specific account as read-only projections, starting after the cursor."""
         pass
 
     @abstractmethod
@@ -26,4 +34,11 @@ class AbstractTransferRepository(ABC):
 
     @abstractmethod
     async def update_transfer_status_by_id(self, transfer_id: int, transfer_status: TransferStatus) -> Transfer:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def cancel_completed_transfer_by_id(self, transfer_id: int) -> Optional[Transfer]:
+        """Marks a completed transfer as canceled in a single guarded statement.
+
+        Returns None if the transfer is not completed, e.g. because a concurrent reversal canceled it first."""
+        pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from src.domain.entities.page import Page, PageCursor
 from src.domain.entities.user import User
 
 
@@ -19,17 +21,16 @@ class AbstractUserRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_user_by_phone_number(self, phone_number: str) -> User:
-        """Fetches a user by their phone number.
+    async def get_users_by_passport_numbers(self, passport_numbers: list[str]) -> list[User]:
+        """Fetches all users whose passport number is in the given list in a single query.
 
-        Raises:
-            NotFoundError: If the user with the specified phone number is not found.
+        Passport numbers without a matching user are skipped.
         """
         pass
 
     @abstractmethod
-    async def get_user_hashed_password_by_phone_number(self, phone_number: str) -> str:
-        """Fetches the hashed password of a user by their phone number.
+    async def get_user_by_phone_number(self, phone_number: str) -> User:
+        """Fetches a user by their phone number.
 
         Raises:
             NotFoundError: If the user with the specified phone number is not found.
@@ -37,8 +38,17 @@ class AbstractUserRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_users(self) -> list[User]:
-        """Fetches users from the repository."""
+    async def get_users(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[User]:
+        """Fetches a page of users ordered by creation time, starting after the cursor."""
+        pass
+
+    @abstractmethod
+    async def check_user_uniqueness(self, passport_number: str, phone_number: str, email: str) -> None:
+        """Checks in a single query that no user already has any of the given unique values.
+
+        Raises:
+            UniqueConstraintError: For the first field whose value is already taken.
+        """
         pass
 
     @abstractmethod
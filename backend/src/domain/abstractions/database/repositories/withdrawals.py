@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from src.domain.entities.page import Page, PageCursor
+from src.domain.entities.projection import Projection
 from src.domain.entities.withdrawal import Withdrawal
 
 
@@ -15,13 +18,18 @@ class AbstractWithdrawalRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_withdrawals(self) -> list[Withdrawal]:
-        """Fetches all withdrawals from the repository."""
+    async def get_withdrawals(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[Withdrawal]:
+        """Fetches a page of withdrawals ordered by creation time, starting after the cursor."""
         pass
 
     @abstractmethod
-    async def get_withdrawals_by_account_id(self, account_id: int) -> list[Withdrawal]:
-        """Fetches all withdrawals associated with a specific user."""
+    async def get_withdrawal_projections_by_account_id(
+            self,
+            account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[Projection]:
+        """Fetches a page of withdrawals from an account as read-only projections, starting after the cursor."""
         pass
 
     async def create_withdrawal(self, withdrawal_create: Withdrawal) -> Withdrawal:
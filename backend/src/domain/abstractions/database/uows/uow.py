@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
 
 
 class AbstractUnitOfWork(ABC):
@@ -10,4 +13,10 @@ class AbstractUnitOfWork(ABC):
     @abstractmethod
     async def __aexit__(self, exc_type, exc, tb):
         """Clean up by committing or rolling back the transaction and closing the connection."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def run(self, operation: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Run the operation inside the unit of work, retrying it in a fresh transaction
+        if it is aborted by a transient concurrency conflict."""
+        pass
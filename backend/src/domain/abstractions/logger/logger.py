@@ -1,20 +1,36 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class AbstractLogger(ABC):
-    """Abstract class for logging messages."""
+    """Abstract class for logging messages.
+
+    The message is formatted with the positional arguments only when the record is written, and keyword
+    arguments are attached to the record as structured fields.
+    """
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
         """Add a regular message to the logs."""
         pass
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
         """Add an error message to the logs."""
         pass
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
         """Add warning to the logs."""
         pass
+
+    @property
+    @abstractmethod
+    def dropped(self) -> int:
+        """Return the number of messages dropped instead of logged because the logger was overloaded."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Write out the pending messages and release the logger."""
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractEventLoopMonitor(ABC):
+    """Abstract class for watching the event loop for calls that block it."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start monitoring the running event loop in the background."""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        pass
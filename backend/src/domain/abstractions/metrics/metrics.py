@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+
+from src.domain.abstractions.security.password_handler import AbstractPasswordHandler
+from src.domain.entities.metrics import RequestTiming
+
+
+class AbstractMetrics(ABC):
+    """Abstract class for recording where the time of the application goes.
+
+    Durations observed while a request is handled are also added to the timing of that request.
+    """
+
+    @abstractmethod
+    def observe_request(self, method: str, route: str, status_code: int, timing: RequestTiming) -> None:
+        """Record a handled request under the template of its route."""
+        pass
+
+    @abstractmethod
+    def observe_query(self, seconds: float) -> None:
+        """Record the duration of a database query."""
+        pass
+
+    @abstractmethod
+    def observe_pool_acquire(self, seconds: float) -> None:
+        """Record the time spent waiting for a connection from the pool."""
+        pass
+
+    @abstractmethod
+    def observe_password_queue(self, seconds: float) -> None:
+        """Record the time a password operation waited for a worker thread."""
+        pass
+
+    @abstractmethod
+    def track_password_handler(self, password_handler: AbstractPasswordHandler) -> None:
+        """Report the load counters of the password handler whenever the metrics are rendered."""
+        pass
+
+    @abstractmethod
+    def observe_loop_lag(self, seconds: float, blocked: bool) -> None:
+        """Record how late the event loop ran a scheduled callback, and whether that was past the threshold."""
+        pass
+
+    @abstractmethod
+    def render(self) -> str:
+        """Return all recorded metrics in the Prometheus text exposition format."""
+        pass
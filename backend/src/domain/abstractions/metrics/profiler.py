@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractRequestProfiler(ABC):
+    """Abstract class for sampling where the time of a single request goes."""
+
+    @abstractmethod
+    def start(self) -> str:
+        """Start sampling the request handled by the current task and return the id of its profile."""
+        pass
+
+    @abstractmethod
+    async def stop(self, profile_id: str) -> None:
+        """Stop sampling the request and store its profile."""
+        pass
+
+    @abstractmethod
+    async def load(self, profile_id: str) -> str:
+        """Return a stored profile in the folded stack format read by flame graph tools."""
+        pass
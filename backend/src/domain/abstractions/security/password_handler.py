@@ -1,15 +1,22 @@
 from abc import ABC, abstractmethod
 
+from src.domain.entities.password_handler import PasswordHandlerStats
+
 
 class AbstractPasswordHandler(ABC):
     """Abstract class for handling password operations."""
 
     @abstractmethod
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash the given password."""
         pass
 
     @abstractmethod
-    def validate_password(self, password: str, hashed_password: str) -> bool:
+    async def validate_password(self, password: str, hashed_password: str) -> bool:
         """Validate if the given password matches the hashed password."""
         pass
+
+    @abstractmethod
+    def stats(self) -> PasswordHandlerStats:
+        """Return the load counters of the handler."""
+        pass
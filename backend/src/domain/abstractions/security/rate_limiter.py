@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractRateLimiter(ABC):
+    """Abstract class for limiting how often an action may be performed per key."""
+
+    @abstractmethod
+    async def acquire(self, rule: str, key: str) -> float:
+        """Take one token from the bucket of the key under the named rule.
+
+        Return 0 if a token was available, else the number of seconds until one will be.
+        """
+        pass
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestTiming:
+    """Time spent by a request, accumulated while it is being handled."""
+    started_at: float
+    queries: int = 0
+    query_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    password_wait_seconds: float = 0.0
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PasswordHandlerStats:
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    max_workers: int
+    max_queue: int
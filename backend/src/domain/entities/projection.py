@@ -0,0 +1,5 @@
+from typing import Any
+
+# A row read straight into the shape of an API response, for read-only paths that carry no domain logic.
+# Projections are never mutated after they are read, so they may be shared, for instance through a cache.
+Projection = dict[str, Any]
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QueryStats:
+    fingerprint: str
+    count: int
+    total_seconds: float
+    p50_seconds: float
+    p99_seconds: float
+    max_seconds: float
+    rows: int
+    callers: tuple[str, ...]
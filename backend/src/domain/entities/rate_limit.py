@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    capacity: float
+    refill_per_second: float
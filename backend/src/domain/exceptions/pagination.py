@@ -0,0 +1,11 @@
+class PaginationError(Exception):
+    """Base exception for pagination handlers."""
+    pass
+
+
+class InvalidCursorError(PaginationError):
+    """Exception raised when a page cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid page cursor: {self.cursor}")
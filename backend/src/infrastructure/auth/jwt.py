@@ -3,6 +3,7 @@ from datetime import timedelta, datetime
 from typing import Optional, Union
 
 from src.domain.abstractions.auth.jwt_handler import AbstractJWTHandler
+from src.infrastructure.auth.key_ring import KeyRing
 from src.infrastructure.exceptions.jwt_exceptions import (
     InvalidTokenError,
     ExpiredTokenError,
@@ -12,16 +13,17 @@ from src.infrastructure.exceptions.jwt_exceptions import (
 
 
 class JWTHandler(AbstractJWTHandler):
+    """Signs JWTs with the signing key of the key ring and verifies them with the key named by their kid.
+
+    Verification only accepts the algorithm of the selected key, so a token cannot pick its own algorithm.
+    """
+
     def __init__(
             self,
-            private_key: str,
-            public_key: str,
-            algorithm: str,
+            key_ring: KeyRing,
             expire_minutes: int
     ):
-        self.private_key = private_key
-        self.public_key = public_key
-        self.algorithm = algorithm
+        self.key_ring = key_ring
         self.expire_minutes = expire_minutes
 
     def encode(
@@ -41,11 +43,13 @@ class JWTHandler(AbstractJWTHandler):
             exp=expire,
             iat=now
         )
+        key = self.key_ring.signing_key
         try:
             encoded = jwt.encode(
                 to_encode,
-                self.private_key,
-                algorithm=self.algorithm
+                key.signing_key,
+                algorithm=key.algorithm,
+                headers={"kid": key.kid}
             )
         except Exception:
             raise TokenCreationError("Failed to create token")
@@ -57,14 +61,15 @@ class JWTHandler(AbstractJWTHandler):
             token: Union[str, bytes]
     ) -> dict:
         try:
+            key = self.key_ring.get_verifying_key(jwt.get_unverified_header(token).get("kid"))
             decoded = jwt.decode(
                 token,
-                self.public_key,
-                algorithms=[self.algorithm]
+                key.verifying_key,
+                algorithms=[key.algorithm]
             )
         except jwt.ExpiredSignatureError:
             raise ExpiredTokenError("Token has expired")
-        except jwt.InvalidTokenError:
+        except (jwt.InvalidTokenError, InvalidTokenError):
             raise InvalidTokenError("The token is invalid.")
         except Exception:
             raise TokenDecodeError("Failed to decode token")
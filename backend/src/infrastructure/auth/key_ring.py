@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from jwt.algorithms import get_default_algorithms
+
+from src.infrastructure.exceptions.jwt_exceptions import InvalidTokenError, KeyRingConfigurationError
+
+SUPPORTED_ALGORITHMS = ("RS256", "EdDSA")
+
+
+@dataclass(frozen=True)
+class JWTKey:
+    kid: str
+    algorithm: str
+    verifying_key: Any
+    signing_key: Optional[Any] = None
+
+
+class KeyRing:
+    """Pre-parsed JWT keys selected by their kid.
+
+    Every key stays usable for verification, so tokens signed with a retired key remain valid until they
+    expire, while new tokens are signed with the key named by signing_kid.
+    """
+
+    def __init__(self, keys: list[dict], signing_kid: str):
+        self._keys = {key["kid"]: self._parse_key(key) for key in keys}
+
+        signing_key = self._keys.get(signing_kid)
+        if signing_key is None or signing_key.signing_key is None:
+            raise KeyRingConfigurationError(f"No private key is configured for the signing kid '{signing_kid}'")
+        self.signing_key = signing_key
+
+    def get_verifying_key(self, kid: Optional[str]) -> JWTKey:
+        """Return the key named by the token's kid. Tokens issued before key ids were introduced
+        carry no kid and are verified with the signing key."""
+        if kid is None:
+            return self.signing_key
+        key = self._keys.get(kid)
+        if key is None:
+            raise InvalidTokenError("The token is invalid.")
+        return key
+
+    @staticmethod
+    def _parse_key(key: dict) -> JWTKey:
+        algorithm = key["algorithm"]
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise KeyRingConfigurationError(f"Unsupported JWT algorithm '{algorithm}' for kid '{key['kid']}'")
+
+        signing_algorithm = get_default_algorithms()[algorithm]
+        return JWTKey(
+            kid=key["kid"],
+            algorithm=algorithm,
+            verifying_key=signing_algorithm.prepare_key(key["public_key"]),
+            signing_key=signing_algorithm.prepare_key(key["private_key"]) if key.get("private_key") else None
+        )
@@ -0,0 +1,103 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import asyncpg
+
+from src.domain.abstractions.cache.cache import AbstractCache
+from src.domain.abstractions.cache.invalidation import AbstractCacheInvalidationListener
+from src.domain.abstractions.logger.logger import AbstractLogger
+
+CHANNEL = "table_changes"
+
+
+@dataclass(frozen=True)
+class CacheSubscription:
+    """Evicts the value cached under the row's key_column from the cache when a row of the table changes.
+
+    Without a key column any change to the table clears the whole cache.
+    """
+    table: str
+    cache: AbstractCache
+    key_column: Optional[str] = None
+
+
+class CacheInvalidationListener(AbstractCacheInvalidationListener):
+    """Class that keeps the in-process caches of a worker consistent with writes made by any worker.
+
+    It holds one dedicated connection outside the pool that LISTENs for the notifications sent by the
+    table triggers. Notifications are only delivered while the connection is up, so every cache is cleared
+    whenever the connection is (re)established, which also covers whatever was loaded before that.
+    """
+
+    def __init__(
+            self,
+            dsn: str,
+            logger: AbstractLogger,
+            subscriptions: list[CacheSubscription],
+            reconnect_delay: float = 1.0
+    ):
+        self.dsn = dsn
+        self.logger = logger
+        self.subscriptions = subscriptions
+        self.reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as exc:
+                self.logger.warning("Cache invalidation listener could not connect: %s", exc)
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            connection_lost = asyncio.Event()
+            try:
+                connection.add_termination_listener(lambda _: connection_lost.set())
+                await connection.add_listener(CHANNEL, self._on_notification)
+                self._clear_caches()
+                self.logger.info("Cache invalidation listener is listening on '%s'", CHANNEL)
+                await connection_lost.wait()
+            except (OSError, asyncpg.PostgresError) as exc:
+                self.logger.warning("Cache invalidation listener failed: %s", exc)
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+
+            self.logger.warning("Cache invalidation listener lost its connection, reconnecting")
+            self._clear_caches()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """Handles the notification sent for a statement, which carries the distinct values of one key column
+        of the changed rows, or no values when the statement changed too many rows to list them."""
+        change = json.loads(payload)
+        for subscription in self.subscriptions:
+            if subscription.table != change["table"]:
+                continue
+            keys = change["keys"] if subscription.key_column == change["column"] else None
+            if keys is None:
+                subscription.cache.clear()
+            else:
+                for key in keys:
+                    subscription.cache.invalidate(key)
+
+    def _clear_caches(self) -> None:
+        for subscription in self.subscriptions:
+            subscription.cache.clear()
@@ -1,50 +1,102 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Sequence
+
 import asyncpg
 
 from src.config import settings
 from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.domain.abstractions.database.query_interceptor import AbstractQueryInterceptor
 from src.domain.abstractions.logger.logger import AbstractLogger
-from src.infrastructure.logger.logger import Logger
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
+from src.infrastructure.database.instrumented_connection import InstrumentedConnection
 
 DATABASE_URL = settings.db.url
 
 
 class DatabaseConnection(AbstractDatabaseConnection):
-    """Class for managing the connection to a PostgreSQL database using asyncpg."""
+    """Class for managing a pool of connections to a PostgreSQL database using asyncpg.
+
+    The time spent waiting for a pooled connection and running each query is recorded in the metrics, and
+    every query is passed to the query interceptors.
+    """
 
-    def __init__(self, dsn: str, logger: AbstractLogger):
+    def __init__(
+            self,
+            dsn: str,
+            logger: AbstractLogger,
+            metrics: AbstractMetrics,
+            query_interceptors: Sequence[AbstractQueryInterceptor] = (),
+            min_size: int = 5,
+            max_size: int = 20,
+            acquire_timeout: float = 10.0,
+            max_inactive_connection_lifetime: float = 300.0
+    ):
         self.dsn = dsn
         self.logger = logger
-        self._connection = None
+        self.metrics = metrics
+        self.query_interceptors = tuple(query_interceptors)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self._pool: Optional[asyncpg.Pool] = None
 
-    async def connect(self):
-        self._connection = await asyncpg.connect(self.dsn)
+    async def connect(self) -> None:
+        if self._pool is not None:
+            return
+        self._pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime
+        )
+        self.logger.info("Database connection pool opened (min_size=%s, max_size=%s)", self.min_size, self.max_size)
 
-    async def close(self):
-        if self.connection:
-            await self.connection.close()
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+        await self._pool.close()
+        self._pool = None
+        self.logger.info("Database connection pool closed")
 
     @property
-    def connection(self):
-        if not self._connection:
-            raise RuntimeError("Database connection has not been established. Call 'connect()' first.")
-        return self._connection
+    def pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            raise RuntimeError("Database connection pool has not been opened. Call 'connect()' first.")
+        return self._pool
+
+    async def acquire(self) -> InstrumentedConnection:
+        if self._pool is None:
+            await self.connect()
+        started_at = time.perf_counter()
+        connection = await self.pool.acquire(timeout=self.acquire_timeout)
+        self.metrics.observe_pool_acquire(time.perf_counter() - started_at)
+        return InstrumentedConnection(connection, self.metrics, self.query_interceptors)
+
+    async def release(self, connection: InstrumentedConnection) -> None:
+        await self.pool.release(connection.raw)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[InstrumentedConnection]:
+        connection = await self.acquire()
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
 
     async def execute(self, query: str, *args):
-        return await self.connection.execute(query, *args)
+        async with self.connection() as connection:
+            return await connection.execute(query, *args)
 
     async def fetch(self, query: str, *args):
-        return await self.connection.fetch(query, *args)
+        async with self.connection() as connection:
+            return await connection.fetch(query, *args)
 
     async def fetchrow(self, query: str, *args):
-        return await self.connection.fetchrow(query, *args)
+        async with self.connection() as connection:
+            return await connection.fetchrow(query, *args)
 
     async def fetchval(self, query: str, *args):
-        return await self.connection.fetchval(query, *args)
-
-    async def __aenter__(self):
-        """Set up the context manager by establishing a connection."""
-        await self.connect()
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        await self.connection.close()
+        async with self.connection() as connection:
+            return await connection.fetchval(query, *args)
@@ -1,4 +1,5 @@
 from src.domain.abstractions.database.factories.repository import AbstractRepositoryFactory
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.accounts import AbstractAccountRepository
 from src.domain.abstractions.database.repositories.additions import AbstractAdditionRepository
 from src.domain.abstractions.database.repositories.banks import AbstractBankRepository
@@ -20,29 +21,29 @@ from src.infrastructure.database.repositories.withdrawal import WithdrawalReposi
 
 
 class RepositoryFactory(AbstractRepositoryFactory):
-    def create_account_repository(self, connection) -> AbstractAccountRepository:
-        return AccountRepository(connection)
+    def create_account_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractAccountRepository:
+        return AccountRepository(connection, identity_map)
 
-    def create_addition_repository(self, connection) -> AbstractAdditionRepository:
-        return AdditionRepository(connection)
+    def create_addition_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractAdditionRepository:
+        return AdditionRepository(connection, identity_map)
 
-    def create_bank_repository(self, connection) -> AbstractBankRepository:
-        return BankRepository(connection)
+    def create_bank_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractBankRepository:
+        return BankRepository(connection, identity_map)
 
-    def create_transfer_repository(self, connection) -> AbstractTransferRepository:
-        return TransferRepository(connection)
+    def create_transfer_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractTransferRepository:
+        return TransferRepository(connection, identity_map)
 
-    def create_withdrawal_repository(self, connection) -> AbstractWithdrawalRepository:
-        return WithdrawalRepository(connection)
+    def create_withdrawal_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractWithdrawalRepository:
+        return WithdrawalRepository(connection, identity_map)
 
-    def create_user_repository(self, connection) -> AbstractUserRepository:
-        return UserRepository(connection)
+    def create_user_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractUserRepository:
+        return UserRepository(connection, identity_map)
 
-    def create_loan_repository(self, connection) -> AbstractLoanRepository:
-        return LoanRepository(connection)
+    def create_loan_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractLoanRepository:
+        return LoanRepository(connection, identity_map)
 
-    def create_deposit_repository(self, connection) -> AbstractDepositRepository:
-        return DepositRepository(connection)
+    def create_deposit_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractDepositRepository:
+        return DepositRepository(connection, identity_map)
 
-    def create_enterprise_repository(self, connection) -> AbstractEnterpriseRepository:
-        return EnterpriseRepository(connection)
\ No newline at end of file
+    def create_enterprise_repository(self, connection, identity_map: AbstractIdentityMap) -> AbstractEnterpriseRepository:
+        return EnterpriseRepository(connection, identity_map)
\ No newline at end of file
@@ -0,0 +1,43 @@
+from typing import Any, Callable, Optional, TypeVar
+
+from src.domain.entities.page import Page, PageCursor
+
+T = TypeVar("T")
+
+
+class PaginationHandler:
+    """Class for building keyset-paginated queries over (created_at, id)."""
+
+    @staticmethod
+    def build_page_query(
+            table: str,
+            condition: Optional[str],
+            args: tuple,
+            limit: int,
+            cursor: Optional[PageCursor] = None,
+            columns: str = "*"
+    ) -> tuple[str, tuple]:
+        """Builds a statement that selects one row past the page to detect whether a next page exists."""
+
+        conditions = [f"({condition})"] if condition else []
+        if cursor is not None:
+            conditions.append(f"(created_at, id) > (${len(args) + 1}, ${len(args) + 2})")
+            args = args + (cursor.created_at, cursor.id)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        stmt = f"SELECT {columns} FROM {table}{where} ORDER BY created_at, id LIMIT ${len(args) + 1}"
+
+        return stmt, args + (limit + 1,)
+
+    @staticmethod
+    def build_page(rows: list[Any], limit: int, mapper: Callable[[Any], T]) -> Page[T]:
+        """Maps the fetched rows to a page, deriving the next cursor from the last row on the page."""
+
+        if len(rows) <= limit:
+            return Page(items=[mapper(row) for row in rows])
+
+        last_row = rows[limit - 1]
+        return Page(
+            items=[mapper(row) for row in rows[:limit]],
+            next_cursor=PageCursor(created_at=last_row["created_at"], id=last_row["id"])
+        )
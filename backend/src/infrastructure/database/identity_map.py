@@ -0,0 +1,29 @@
+from typing import Any, Optional, TypeVar
+
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
+
+T = TypeVar("T")
+
+
+class IdentityMap(AbstractIdentityMap):
+    """Map of the entities loaded by id within a single unit of work.
+
+    Entities are immutable, so repositories can hand out the stored instance as is. Writes that return
+    the new row store it, and writes that do not invalidate the affected entities.
+    """
+
+    def __init__(self):
+        self._entities: dict[tuple[type, int], Any] = {}
+
+    def get(self, entity_type: type[T], entity_id: int) -> Optional[T]:
+        return self._entities.get((entity_type, entity_id))
+
+    def add(self, entity: T) -> T:
+        self._entities[(type(entity), entity.id)] = entity
+        return entity
+
+    def remove(self, entity_type: type[Any], entity_id: int) -> None:
+        self._entities.pop((entity_type, entity_id), None)
+
+    def clear(self) -> None:
+        self._entities.clear()
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import sys
+from datetime import datetime
+from typing import Any, Iterator, Union
+
+import asyncpg
+
+from src.config import settings
+from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.domain.entities.page import PageCursor
+from src.infrastructure.database import queries
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.logger.logger import Logger
+from src.infrastructure.metrics.metrics import PrometheusMetrics
+
+_CURSOR = PageCursor(created_at=datetime(2000, 1, 1), id=1)
+
+# Sample arguments of the right types for each statement and page query of the queries module.
+SAMPLE_ARGS: dict[str, tuple] = {
+    "SELECT_ACCOUNT_BY_ID": (1,),
+    "SELECT_ACCOUNTS_BY_USER_ID": (1,),
+    "SELECT_ACCOUNT_PROJECTIONS_BY_USER_ID": (1,),
+    "LOCK_ACCOUNTS": ([1, 2],),
+    "LOCK_ACCOUNT_IDS": ([1, 2],),
+    "SELECT_ADDITION_BY_ID": (1,),
+    "ADDITIONS_PAGE": (),
+    "ADDITION_PROJECTIONS_BY_ACCOUNT_ID_PAGE": (1,),
+    "SELECT_BANK_BY_ID": (1,),
+    "BANKS_PAGE": (),
+    "SELECT_DEPOSIT_ACCOUNT_BY_ID": (1,),
+    "SELECT_ENTERPRISE_BY_ID": (1,),
+    "SELECT_ENTERPRISE_SPECIALIST_BY_USER_ID": (1,),
+    "SELECT_ENTERPRISE_SPECIALIST_BY_ID": (1,),
+    "SELECT_ENTERPRISE_PAYROLL_REQUEST_BY_ID": (1,),
+    "SELECT_ENTERPRISE_PAYROLL_TRANSACTIONS_BY_REQUEST_ID": (1,),
+    "SELECT_LOAN_BY_ID": (1,),
+    "SELECT_LOAN_ACCOUNT_BY_ID": (1,),
+    "SELECT_LOAN_ACCOUNT_BY_ACCOUNT_ID": (1,),
+    "SELECT_LOAN_ACCOUNTS_BY_USER_ID": (1,),
+    "LOAN_TRANSACTIONS_BY_LOAN_ACCOUNT_ID_PAGE": (1,),
+    "SELECT_LOAN_TRANSACTIONS_TOTAL_BY_LOAN_ACCOUNT_ID": (1,),
+    "SELECT_TRANSFER_BY_ID": (1,),
+    "TRANSFER_PROJECTIONS_BY_ACCOUNT_ID_PAGE": (1,),
+    "SELECT_USER_BY_ID": (1,),
+    "SELECT_USER_BY_PHONE_NUMBER": ("+375",),
+    "SELECT_USERS_BY_PASSPORT_NUMBERS": (["AB1234567"],),
+    "SELECT_CONFLICTING_USER_FIELD": ("AB1234567", "+375", "user@example.com"),
+    "USERS_PAGE": (),
+    "SELECT_WITHDRAWAL_BY_ID": (1,),
+    "WITHDRAWALS_PAGE": (),
+    "WITHDRAWAL_PROJECTIONS_BY_ACCOUNT_ID_PAGE": (1,),
+}
+
+
+def repository_queries() -> dict[str, Union[str, queries.PageQuery]]:
+    """Returns every statement and page query the repositories read with, by constant name."""
+    return {
+        name: value
+        for name, value in vars(queries).items()
+        if name.isupper() and isinstance(value, (str, queries.PageQuery))
+    }
+
+
+def _statements(query: Union[str, queries.PageQuery], args: tuple) -> list[tuple[str, tuple]]:
+    """Returns the statements to explain for a query: both the first and a later page of a page query."""
+    if isinstance(query, queries.PageQuery):
+        return [query.build(args, 50), query.build(args, 50, _CURSOR)]
+    return [(query, args)]
+
+
+class IndexUsageChecker:
+    """Class that verifies every repository query can be answered without a sequential scan.
+
+    Sequential scans are disabled for the duration of each EXPLAIN, so a remaining Seq Scan node means
+    that no index matches the query predicate at all, regardless of the size of the table.
+    """
+
+    def __init__(self, db_connection: AbstractDatabaseConnection):
+        self.db_connection = db_connection
+
+    async def check(self) -> dict[str, list[str]]:
+        """Returns the problems found with each offending repository query: the tables it scans sequentially,
+        or why it could not be explained."""
+        violations = {}
+        async with self.db_connection.connection() as conn:
+            for query_name, query in repository_queries().items():
+                if query_name not in SAMPLE_ARGS:
+                    violations[query_name] = ["no sample arguments in SAMPLE_ARGS"]
+                    continue
+                for stmt, args in _statements(query, SAMPLE_ARGS[query_name]):
+                    try:
+                        async with conn.transaction():
+                            await conn.execute("SET LOCAL enable_seqscan = off")
+                            plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {stmt}", *args)
+                    except (asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+                        violations.setdefault(query_name, []).append(f"cannot be explained: {exc}")
+                        continue
+                    scanned_tables = sorted(set(self._sequential_scans(json.loads(plan)[0]["Plan"])))
+                    if scanned_tables:
+                        violations.setdefault(query_name, []).append(f"sequential scan on {', '.join(scanned_tables)}")
+        return violations
+
+    @classmethod
+    def _sequential_scans(cls, node: dict[str, Any]) -> Iterator[str]:
+        if node["Node Type"] == "Seq Scan":
+            yield node["Relation Name"]
+        for child in node.get("Plans", []):
+            yield from cls._sequential_scans(child)
+
+
+async def main() -> int:
+    db_connection = DatabaseConnection(
+        settings.db.url,
+        Logger(settings.logger.log_config),
+        PrometheusMetrics(),
+        min_size=1,
+        max_size=1
+    )
+    try:
+        violations = await IndexUsageChecker(db_connection).check()
+    finally:
+        await db_connection.close()
+
+    for query_name, problems in violations.items():
+        print(f"{query_name}: {'; '.join(dict.fromkeys(problems))}")
+    query_count = len(repository_queries())
+    print(f"{query_count - len(violations)}/{query_count} repository queries use an index")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
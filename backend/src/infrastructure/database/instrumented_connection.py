@@ -0,0 +1,71 @@
+import time
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+import asyncpg
+
+from src.domain.abstractions.database.query_interceptor import AbstractQueryInterceptor
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
+
+
+def _status_rows(status: str) -> int:
+    """Returns the number of rows affected according to a command status such as 'UPDATE 3'."""
+    count = status.rsplit(" ", 1)[-1] if status else ""
+    return int(count) if count.isdigit() else 0
+
+
+class InstrumentedConnection:
+    """Wraps a pooled asyncpg connection and passes every query the repositories run on it, with its duration
+    and the number of rows it returned or affected, to the metrics and the query interceptors.
+
+    Anything else, such as transactions, is delegated to the wrapped connection unchanged.
+    """
+
+    __slots__ = ("raw", "metrics", "interceptors")
+
+    def __init__(
+            self,
+            raw: asyncpg.Connection,
+            metrics: AbstractMetrics,
+            interceptors: Sequence[AbstractQueryInterceptor] = ()
+    ):
+        self.raw = raw
+        self.metrics = metrics
+        self.interceptors = interceptors
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        return await self._run(self.raw.execute, _status_rows, query, *args, **kwargs)
+
+    async def executemany(self, query: str, args: Any, **kwargs: Any) -> None:
+        return await self._run(self.raw.executemany, lambda _: len(args), query, args, **kwargs)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> list[asyncpg.Record]:
+        return await self._run(self.raw.fetch, len, query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Optional[asyncpg.Record]:
+        return await self._run(self.raw.fetchrow, lambda row: int(row is not None), query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(self.raw.fetchval, lambda value: int(value is not None), query, *args, **kwargs)
+
+    async def _run(
+            self,
+            method: Callable[..., Awaitable[Any]],
+            count_rows: Callable[[Any], int],
+            query: str,
+            *args: Any,
+            **kwargs: Any
+    ) -> Any:
+        started_at = time.perf_counter()
+        rows = 0
+        try:
+            result = await method(query, *args, **kwargs)
+            rows = count_rows(result)
+            return result
+        finally:
+            seconds = time.perf_counter() - started_at
+            self.metrics.observe_query(seconds)
+            for interceptor in self.interceptors:
+                interceptor.on_query(query, seconds, rows)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
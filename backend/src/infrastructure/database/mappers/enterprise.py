@@ -4,6 +4,7 @@ from src.domain.entities.enterprise import (
     EnterprisePayrollRequest,
     EnterprisePayrollTransaction
 )
+from src.domain.enums.enterprise import EnterprisePayrollRequestStatus
 
 class EnterpriseDatabaseMapper:
     """Utility class for mapping between database rows and Enterprise entities."""
@@ -34,8 +35,9 @@ class EnterpriseDatabaseMapper:
     def from_db_row_to_enterprise_payroll_request(row: dict) -> EnterprisePayrollRequest:
         return EnterprisePayrollRequest(
             id=row["id"],
-            status=row["status"],
+            status=EnterprisePayrollRequestStatus(row["status"]),
             passport_numbers=row["passport_numbers"],
+            accounts_id=row["accounts_id"],
             enterprise_id=row["enterprise_id"],
             specialist_id=row["specialist_id"],
             created_at=row["created_at"],
@@ -0,0 +1,23 @@
+import hashlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A versioned schema change applied at most once by the migration runner.
+
+    Statements of a transactional migration are applied atomically together with their bookkeeping row.
+    Non-transactional migrations (e.g. CREATE INDEX CONCURRENTLY) run statement by statement and must
+    therefore be idempotent, so that a migration interrupted halfway can be applied again. Before they run,
+    the runner drops the invalid indexes an interrupted CREATE INDEX CONCURRENTLY IF NOT EXISTS left behind,
+    which the statement would otherwise skip.
+    """
+    version: int
+    name: str
+    statements: tuple[str, ...]
+    transactional: bool = True
+
+    @property
+    def checksum(self) -> str:
+        content = "\n;\n".join(statement.strip() for statement in self.statements)
+        return hashlib.sha256(content.encode()).hexdigest()
@@ -0,0 +1,126 @@
+import re
+from typing import Any, Sequence
+
+from asyncpg.exceptions import UndefinedTableError
+
+from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.infrastructure.database.migrations.migration import Migration
+from src.infrastructure.database.migrations.versions import MIGRATIONS
+from src.infrastructure.exceptions.migration_exceptions import MigrationChecksumError
+
+MIGRATION_LOCK_KEY = 7_316_482_901
+
+_CONCURRENT_INDEX = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+    re.IGNORECASE
+)
+
+
+class MigrationRunner:
+    """Class responsible for bringing the database schema up to date with the versioned migrations.
+
+    A replica whose schema is already current pays a single query on one connection. Otherwise the runner
+    takes a session-level advisory lock, so that concurrently starting replicas apply each migration exactly
+    once, and re-reads the applied versions under the lock before applying the pending ones in order.
+    """
+
+    def __init__(
+            self,
+            db_connection: AbstractDatabaseConnection,
+            logger: AbstractLogger,
+            migrations: Sequence[Migration] = MIGRATIONS
+    ):
+        self.db_connection = db_connection
+        self.logger = logger
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+
+    async def migrate(self) -> None:
+        async with self.db_connection.connection() as conn:
+            try:
+                applied = await self._get_applied_checksums(conn)
+            except UndefinedTableError:
+                applied = None
+
+            if applied is not None and not self._get_pending(applied):
+                return
+
+            await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_KEY)
+            try:
+                await self._create_migrations_table(conn)
+                applied = await self._get_applied_checksums(conn)
+                for migration in self._get_pending(applied):
+                    await self._apply(conn, migration)
+            finally:
+                await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_KEY)
+
+    def _get_pending(self, applied: dict[int, str]) -> list[Migration]:
+        """Verifies the applied migrations against their definitions and returns those not applied yet."""
+        pending = []
+        for migration in self.migrations:
+            if migration.version not in applied:
+                pending.append(migration)
+            elif applied[migration.version] != migration.checksum:
+                raise MigrationChecksumError(migration.version, migration.name)
+
+        known_versions = {migration.version for migration in self.migrations}
+        unknown_versions = sorted(version for version in applied if version not in known_versions)
+        if unknown_versions:
+            self.logger.warning("Database schema contains migrations unknown to this release: %s", unknown_versions)
+
+        return pending
+
+    async def _apply(self, conn: Any, migration: Migration) -> None:
+        record_stmt = "INSERT INTO schema_migrations (version, name, checksum) VALUES ($1, $2, $3)"
+
+        self.logger.info("Applying migration %s (%s)", migration.version, migration.name)
+        if migration.transactional:
+            async with conn.transaction():
+                for statement in migration.statements:
+                    await conn.execute(statement)
+                await conn.execute(record_stmt, migration.version, migration.name, migration.checksum)
+        else:
+            await self._drop_invalid_indexes(conn, migration)
+            for statement in migration.statements:
+                await conn.execute(statement)
+            await conn.execute(record_stmt, migration.version, migration.name, migration.checksum)
+
+    async def _drop_invalid_indexes(self, conn: Any, migration: Migration) -> None:
+        """Drops the invalid indexes an interrupted concurrent build of the migration left behind.
+
+        IF NOT EXISTS would otherwise skip such an index, leaving it invalid, when the migration is applied again.
+        """
+        select_invalid_indexes = """
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE NOT i.indisvalid AND c.relname = ANY($1::text[])
+        """
+
+        index_names = [
+            match.group(1)
+            for statement in migration.statements
+            for match in _CONCURRENT_INDEX.finditer(statement)
+        ]
+        if not index_names:
+            return
+
+        for row in await conn.fetch(select_invalid_indexes, index_names):
+            self.logger.warning("Dropping invalid index %s left by an interrupted build", row["relname"])
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {row['relname']}")
+
+    @staticmethod
+    async def _get_applied_checksums(conn: Any) -> dict[int, str]:
+        rows = await conn.fetch("SELECT version, checksum FROM schema_migrations")
+        return {row["version"]: row["checksum"] for row in rows}
+
+    @staticmethod
+    async def _create_migrations_table(conn: Any) -> None:
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                checksum CHAR(64) NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT now()
+            )
+        """)
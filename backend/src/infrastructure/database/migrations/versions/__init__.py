@@ -0,0 +1,15 @@
+from src.infrastructure.database.migrations.versions import (
+    v0001_initial_schema,
+    v0002_lookup_indexes,
+    v0003_change_notifications,
+    v0004_rate_limit_buckets,
+    v0005_statement_change_notifications,
+)
+
+MIGRATIONS = (
+    v0001_initial_schema.migration,
+    v0002_lookup_indexes.migration,
+    v0003_change_notifications.migration,
+    v0004_rate_limit_buckets.migration,
+    v0005_statement_change_notifications.migration,
+)
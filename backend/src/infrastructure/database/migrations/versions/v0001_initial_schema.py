@@ -1,26 +1,10 @@
-from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.infrastructure.database.migrations.migration import Migration
 
-
-class DatabaseInitializer:
-    """Class responsible for initializing the database by creating all necessary tables and database objects (e.g., enums, triggers)."""
-
-    def __init__(self, db_connection: AbstractDatabaseConnection):
-        self.db_connection = db_connection
-
-    async def create_all_tables(self) -> None:
-        """Method to call the creation of all tables"""
-        await self.create_banks_table()
-        await self.create_users_table()
-        await self.create_accounts_table()
-        await self.create_additions_table()
-        await self.create_withdrawals_table()
-        await self.create_transfers_table()
-        await self.create_loans_table()
-        await self.create_deposits_table()
-        await self.create_enterprise_tables()
-
-    async def create_banks_table(self) -> None:
-        create_table = """
+migration = Migration(
+    version=1,
+    name="initial_schema",
+    statements=(
+        """
             CREATE TABLE IF NOT EXISTS banks (
                 id INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
                 name VARCHAR(150) NOT NULL,
@@ -29,11 +13,11 @@ class DatabaseInitializer:
                 created_at TIMESTAMP DEFAULT now() NOT NULL,
                 updated_at TIMESTAMP DEFAULT now() NOT NULL
             );
+        """,
+        """
+            CREATE INDEX IF NOT EXISTS idx_banks_bic ON banks(bic);
+        """,
         """
-
-        create_index = "CREATE INDEX IF NOT EXISTS idx_banks_bic ON banks(bic);"
-
-        create_function = """
             CREATE OR REPLACE FUNCTION update_updated_at_column()
             RETURNS TRIGGER AS $$
             BEGIN
@@ -41,10 +25,9 @@ class DatabaseInitializer:
                 RETURN NEW;
             END;
             $$ LANGUAGE plpgsql;
+        """,
         """
-
-        create_trigger = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_update_updated_at') THEN
                     CREATE TRIGGER trigger_update_updated_at
@@ -53,25 +36,16 @@ class DatabaseInitializer:
                     EXECUTE FUNCTION update_updated_at_column();
                 END IF;
             END $$;
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_table)
-            await conn.execute(create_index)
-            await conn.execute(create_function)
-            await conn.execute(create_trigger)
-
-    async def create_users_table(self) -> None:
-        create_enum_role = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'user_role') THEN
                     CREATE TYPE user_role AS ENUM ('CLIENT', 'OPERATOR', 'MANAGER', 'ADMINISTRATOR', 'SPECIALIST');
                 END IF;
             END $$;
+        """,
         """
-
-        create_table = """
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
                 name VARCHAR(150) NOT NULL,
@@ -85,9 +59,8 @@ class DatabaseInitializer:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
             );
+        """,
         """
-
-        create_function = """
             CREATE OR REPLACE FUNCTION update_user_updated_at()
             RETURNS TRIGGER AS $$
             BEGIN
@@ -95,10 +68,9 @@ class DatabaseInitializer:
                 RETURN NEW;
             END;
             $$ LANGUAGE plpgsql;
+        """,
         """
-
-        create_trigger = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_update_user_updated_at') THEN
                     CREATE TRIGGER trigger_update_user_updated_at
@@ -107,34 +79,24 @@ class DatabaseInitializer:
                     EXECUTE FUNCTION update_user_updated_at();
                 END IF;
             END $$;
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_role)
-            await conn.execute(create_table)
-            await conn.execute(create_function)
-            await conn.execute(create_trigger)
-
-    async def create_accounts_table(self) -> None:
-        create_enum_status = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'account_status') THEN
                     CREATE TYPE account_status AS ENUM ('ACTIVE', 'BLOCKED', 'FROZEN', 'ON_CONSIDERATION');
                 END IF;
             END $$;
+        """,
         """
-
-        create_enum_type = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'account_type') THEN
                     CREATE TYPE account_type AS ENUM ('SALARY', 'DEPOSIT', 'LOAN', 'SETTLEMENT', 'ENTERPRISE');
                 END IF;
             END $$;
+        """,
         """
-
-        create_table = """
             CREATE TABLE IF NOT EXISTS accounts (
                 id SERIAL PRIMARY KEY,
                 user_id INTEGER NOT NULL REFERENCES users(id),
@@ -145,9 +107,8 @@ class DatabaseInitializer:
                 created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
             );
+        """,
         """
-
-        create_function = """
             CREATE OR REPLACE FUNCTION update_account_updated_at()
             RETURNS TRIGGER AS $$
             BEGIN
@@ -155,10 +116,9 @@ class DatabaseInitializer:
                 RETURN NEW;
             END;
             $$ LANGUAGE plpgsql;
+        """,
         """
-
-        create_trigger = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_update_account_updated_at') THEN
                     CREATE TRIGGER trigger_update_account_updated_at
@@ -167,26 +127,16 @@ class DatabaseInitializer:
                     EXECUTE FUNCTION update_account_updated_at();
                 END IF;
             END $$;
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_status)
-            await conn.execute(create_enum_type)
-            await conn.execute(create_table)
-            await conn.execute(create_function)
-            await conn.execute(create_trigger)
-
-    async def create_additions_table(self) -> None:
-        create_enum_source = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'addition_source') THEN
                     CREATE TYPE addition_source AS ENUM ('BANK_TRANSFER', 'CARD_PAYMENT', 'CASH', 'CRYPTO', 'OTHER');
                 END IF;
             END $$;
+        """,
         """
-
-        create_table = """
             CREATE TABLE IF NOT EXISTS additions (
                 id SERIAL PRIMARY KEY,
                 account_id BIGINT NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
@@ -194,23 +144,16 @@ class DatabaseInitializer:
                 source addition_source NOT NULL,
                 created_at TIMESTAMP DEFAULT NOW() NOT NULL
             );
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_source)
-            await conn.execute(create_table)
-
-    async def create_withdrawals_table(self) -> None:
-        create_enum_source = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'withdrawal_source') THEN
                     CREATE TYPE withdrawal_source AS ENUM ('BANK_TRANSFER', 'CARD_PAYMENT', 'CASH', 'CRYPTO', 'OTHER');
                 END IF;
             END $$;
+        """,
         """
-
-        create_table = """
             CREATE TABLE IF NOT EXISTS withdrawals (
                 id SERIAL PRIMARY KEY,
                 account_id BIGINT NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
@@ -218,23 +161,16 @@ class DatabaseInitializer:
                 source withdrawal_source NOT NULL,
                 created_at TIMESTAMP DEFAULT NOW() NOT NULL
             );
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_source)
-            await conn.execute(create_table)
-
-    async def create_transfers_table(self) -> None:
-        create_enum_status = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'transfer_status') THEN
                     CREATE TYPE transfer_status AS ENUM ('COMPLETED', 'CANCELED');
                 END IF;
             END $$;
+        """,
         """
-
-        create_table = """
             CREATE TABLE IF NOT EXISTS transfers (
                 id SERIAL PRIMARY KEY,
                 from_account_id BIGINT NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
@@ -242,11 +178,10 @@ class DatabaseInitializer:
                 amount DECIMAL(18,2) NOT NULL CHECK (amount > 0),
                 status transfer_status NOT NULL DEFAULT 'COMPLETED',
                 updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                created_at TIMESTAMP NOT NULL DEFAULT NOW() 
+                created_at TIMESTAMP NOT NULL DEFAULT NOW()
             );
+        """,
         """
-
-        create_function = """
             CREATE OR REPLACE FUNCTION update_transfer_updated_at()
             RETURNS TRIGGER AS $$
             BEGIN
@@ -254,10 +189,9 @@ class DatabaseInitializer:
                 RETURN NEW;
             END;
             $$ LANGUAGE plpgsql;
+        """,
         """
-
-        create_trigger = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_update_transfer_updated_at') THEN
                     CREATE TRIGGER trigger_update_transfer_updated_at
@@ -266,25 +200,16 @@ class DatabaseInitializer:
                     EXECUTE FUNCTION update_transfer_updated_at();
                 END IF;
             END $$;
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_status)
-            await conn.execute(create_table)
-            await conn.execute(create_function)
-            await conn.execute(create_trigger)
-
-    async def create_loans_table(self) -> None:
-        create_enum_loan_transaction_type = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'loan_transaction_type') THEN
                     CREATE TYPE loan_transaction_type AS ENUM ('CREDIT', 'PAYMENT');
                 END IF;
             END $$;
+        """,
         """
-
-        create_loans_table = """
             CREATE TABLE IF NOT EXISTS loans (
                 id SERIAL PRIMARY KEY,
                 amount DECIMAL(18,2) NOT NULL,
@@ -293,18 +218,16 @@ class DatabaseInitializer:
                 updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 created_at TIMESTAMP NOT NULL DEFAULT NOW()
             );
+        """,
         """
-
-        create_loan_accounts_table = """
             CREATE TABLE IF NOT EXISTS loan_accounts (
                 id SERIAL PRIMARY KEY,
                 account_id BIGINT NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
                 loan_id BIGINT NOT NULL REFERENCES loans(id) ON DELETE CASCADE,
                 user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE
             );
+        """,
         """
-
-        create_loan_transactions_table = """
             CREATE TABLE IF NOT EXISTS loan_transactions (
                 id SERIAL PRIMARY KEY,
                 loan_account_id BIGINT NOT NULL REFERENCES loan_accounts(id) ON DELETE CASCADE,
@@ -312,10 +235,18 @@ class DatabaseInitializer:
                 amount DECIMAL(18 ,2) NOT NULL,
                 created_at TIMESTAMP NOT NULL DEFAULT NOW()
             );
+        """,
         """
-
-        create_trigger = """
-            DO $$ 
+            CREATE OR REPLACE FUNCTION update_loan_updated_at()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.updated_at = now();
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """,
+        """
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_update_loan_updated_at') THEN
                     CREATE TRIGGER trigger_update_loan_updated_at
@@ -324,37 +255,16 @@ class DatabaseInitializer:
                     EXECUTE FUNCTION update_loan_updated_at();
                 END IF;
             END $$;
+        """,
         """
-
-        create_function = """
-            CREATE OR REPLACE FUNCTION update_loan_updated_at()
-            RETURNS TRIGGER AS $$
-            BEGIN
-                NEW.updated_at = now();
-                RETURN NEW;
-            END;
-            $$ LANGUAGE plpgsql;
-        """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_loan_transaction_type)
-            await conn.execute(create_loans_table)
-            await conn.execute(create_loan_accounts_table)
-            await conn.execute(create_loan_transactions_table)
-            await conn.execute(create_function)
-            await conn.execute(create_trigger)
-
-    async def create_deposits_table(self) -> None:
-        create_enum_deposit_transaction_type = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'deposit_transaction_type') THEN
                     CREATE TYPE deposit_transaction_type AS ENUM ('DEPOSIT', 'WITHDRAWAL');
                 END IF;
             END $$;
+        """,
         """
-
-        create_deposit_accounts_table = """
             CREATE TABLE IF NOT EXISTS deposit_accounts (
                 id SERIAL PRIMARY KEY,
                 account_id BIGINT NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
@@ -362,9 +272,8 @@ class DatabaseInitializer:
                 from_account_id BIGINT NOT NULL REFERENCES accounts(id),
                 user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE
             );
+        """,
         """
-
-        create_deposit_transactions_table = """
             CREATE TABLE IF NOT EXISTS deposit_transactions (
                 id SERIAL PRIMARY KEY,
                 deposit_account_id BIGINT NOT NULL REFERENCES deposit_accounts(id) ON DELETE CASCADE,
@@ -373,33 +282,24 @@ class DatabaseInitializer:
                 amount DECIMAL(18 ,2) NOT NULL,
                 created_at TIMESTAMP NOT NULL DEFAULT NOW()
             );
+        """,
         """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_deposit_transaction_type)
-            await conn.execute(create_deposit_accounts_table)
-            await conn.execute(create_deposit_transactions_table)
-
-    async def create_enterprise_tables(self) -> None:
-        create_enum_enterprise_type = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'enterprise_type') THEN
                     CREATE TYPE enterprise_type AS ENUM ('LLC', 'SP', 'LLP');
                 END IF;
             END $$;
+        """,
         """
-
-        create_enum_payroll_request_status = """
-            DO $$ 
+            DO $$
             BEGIN
                 IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'enterprise_payroll_request_status') THEN
                     CREATE TYPE enterprise_payroll_request_status AS ENUM ('ON_CONSIDERATION', 'CANCELLED', 'APPROVED');
                 END IF;
             END $$;
+        """,
         """
-
-        create_enterprise_table = """
             CREATE TABLE IF NOT EXISTS enterprises (
                 id BIGSERIAL PRIMARY KEY,
                 name VARCHAR NOT NULL,
@@ -411,17 +311,15 @@ class DatabaseInitializer:
                 created_at TIMESTAMP DEFAULT NOW(),
                 updated_at TIMESTAMP DEFAULT NOW()
             );
+        """,
         """
-
-        create_enterprise_specialists_table = """
             CREATE TABLE IF NOT EXISTS enterprise_specialists (
                 id BIGSERIAL PRIMARY KEY,
                 user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
                 enterprise_id BIGINT NOT NULL REFERENCES enterprises(id) ON DELETE CASCADE
             );
+        """,
         """
-
-        create_enterprise_payroll_requests_table = """
             CREATE TABLE IF NOT EXISTS enterprise_payroll_requests (
                 id BIGSERIAL PRIMARY KEY,
                 status enterprise_payroll_request_status NOT NULL,
@@ -432,20 +330,13 @@ class DatabaseInitializer:
                 created_at TIMESTAMP DEFAULT NOW(),
                 updated_at TIMESTAMP DEFAULT NOW()
             );
+        """,
         """
-
-        create_enterprise_payroll_transactions_table = """
             CREATE TABLE IF NOT EXISTS enterprise_payroll_transactions (
                 id BIGSERIAL PRIMARY KEY,
                 enterprise_payroll_request_id BIGINT NOT NULL REFERENCES enterprise_payroll_requests(id) ON DELETE CASCADE,
                 created_at TIMESTAMP DEFAULT NOW()
             );
-        """
-
-        async with self.db_connection as conn:
-            await conn.execute(create_enum_enterprise_type)
-            await conn.execute(create_enum_payroll_request_status)
-            await conn.execute(create_enterprise_table)
-            await conn.execute(create_enterprise_specialists_table)
-            await conn.execute(create_enterprise_payroll_requests_table)
-            await conn.execute(create_enterprise_payroll_transactions_table)
+        """,
+    ),
+)
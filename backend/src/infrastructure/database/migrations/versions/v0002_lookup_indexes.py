@@ -0,0 +1,72 @@
+from src.infrastructure.database.migrations.migration import Migration
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so this migration runs without one.
+migration = Migration(
+    version=2,
+    name="lookup_indexes",
+    transactional=False,
+    statements=(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_accounts_user_id ON accounts (user_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_accounts_bank_id ON accounts (bank_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_at_id ON users (created_at, id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_banks_created_at_id ON banks (created_at, id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_additions_created_at_id ON additions (created_at, id)",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_additions_account_id_created_at_id "
+            "ON additions (account_id, created_at, id)"
+        ),
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_withdrawals_created_at_id ON withdrawals (created_at, id)",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_withdrawals_account_id_created_at_id "
+            "ON withdrawals (account_id, created_at, id)"
+        ),
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transfers_from_account_id_created_at_id "
+            "ON transfers (from_account_id, created_at, id)"
+        ),
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transfers_to_account_id_created_at_id "
+            "ON transfers (to_account_id, created_at, id)"
+        ),
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_loan_accounts_account_id ON loan_accounts (account_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_loan_accounts_loan_id ON loan_accounts (loan_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_loan_accounts_user_id ON loan_accounts (user_id)",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_loan_transactions_loan_account_id_created_at_id "
+            "ON loan_transactions (loan_account_id, created_at, id)"
+        ),
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deposit_accounts_account_id ON deposit_accounts (account_id)",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deposit_accounts_from_account_id "
+            "ON deposit_accounts (from_account_id)"
+        ),
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deposit_accounts_user_id ON deposit_accounts (user_id)",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deposit_transactions_deposit_account_id "
+            "ON deposit_transactions (deposit_account_id)"
+        ),
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deposit_transactions_account_id "
+            "ON deposit_transactions (account_id)"
+        ),
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprises_bank_id ON enterprises (bank_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprises_account_id ON enterprises (account_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprise_specialists_user_id ON enterprise_specialists (user_id)",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprise_specialists_enterprise_id "
+            "ON enterprise_specialists (enterprise_id)"
+        ),
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprise_payroll_requests_enterprise_id "
+            "ON enterprise_payroll_requests (enterprise_id)"
+        ),
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprise_payroll_requests_specialist_id "
+            "ON enterprise_payroll_requests (specialist_id)"
+        ),
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enterprise_payroll_transactions_request_id "
+            "ON enterprise_payroll_transactions (enterprise_payroll_request_id)"
+        ),
+    ),
+)
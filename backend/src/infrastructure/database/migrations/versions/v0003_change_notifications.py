@@ -0,0 +1,51 @@
+from src.infrastructure.database.migrations.migration import Migration
+
+# Every committed change to a cached table is announced on the table_changes channel with the id of the row
+# and, for accounts, the id of the owning user, so that each worker can evict what it has cached.
+migration = Migration(
+    version=3,
+    name="change_notifications",
+    statements=(
+        """
+            CREATE OR REPLACE FUNCTION notify_table_change()
+            RETURNS TRIGGER AS $$
+            DECLARE
+                affected JSONB;
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    affected := to_jsonb(OLD);
+                ELSE
+                    affected := to_jsonb(NEW);
+                END IF;
+                PERFORM pg_notify(
+                    'table_changes',
+                    json_build_object(
+                        'table', TG_TABLE_NAME,
+                        'id', affected -> 'id',
+                        'user_id', affected -> 'user_id'
+                    )::text
+                );
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+        """,
+        """
+            CREATE OR REPLACE TRIGGER trigger_banks_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON banks
+            FOR EACH ROW
+            EXECUTE FUNCTION notify_table_change();
+        """,
+        """
+            CREATE OR REPLACE TRIGGER trigger_users_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON users
+            FOR EACH ROW
+            EXECUTE FUNCTION notify_table_change();
+        """,
+        """
+            CREATE OR REPLACE TRIGGER trigger_accounts_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON accounts
+            FOR EACH ROW
+            EXECUTE FUNCTION notify_table_change();
+        """,
+    )
+)
@@ -0,0 +1,19 @@
+from src.infrastructure.database.migrations.migration import Migration
+
+# Rate limit buckets are cheap to lose, so the table is unlogged: writes skip the WAL and the table is
+# emptied after a crash, which only resets every bucket to full.
+migration = Migration(
+    version=4,
+    name="rate_limit_buckets",
+    statements=(
+        """
+            CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+                key TEXT PRIMARY KEY,
+                tokens DOUBLE PRECISION NOT NULL,
+                allowed BOOLEAN NOT NULL,
+                updated_at TIMESTAMPTZ NOT NULL
+            );
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_updated_at ON rate_limit_buckets (updated_at)",
+    )
+)
@@ -0,0 +1,78 @@
+from src.infrastructure.database.migrations.migration import Migration
+
+# (table, key column) of the cached tables. The row-level triggers of migration 3 sent a notification per
+# changed row, so a payroll crediting thousands of accounts flooded every worker. Statement-level triggers
+# send one notification per statement with the distinct keys of the changed rows, or without keys, which
+# clears the whole cache, when there are too many to fit in a notification payload.
+NOTIFIED_TABLES = (
+    ("banks", "id"),
+    ("users", "id"),
+    ("accounts", "user_id"),
+)
+
+# Transition tables can only be declared on triggers for a single event.
+TRIGGER_EVENTS = (
+    ("insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("delete", "DELETE", "OLD TABLE AS old_rows"),
+)
+
+migration = Migration(
+    version=5,
+    name="statement_change_notifications",
+    statements=(
+        *(f"DROP TRIGGER IF EXISTS trigger_{table}_notify_change ON {table}" for table, _ in NOTIFIED_TABLES),
+        "DROP FUNCTION IF EXISTS notify_table_change()",
+        """
+            CREATE OR REPLACE FUNCTION notify_table_changes()
+            RETURNS TRIGGER AS $$
+            DECLARE
+                key_column TEXT := TG_ARGV[0];
+                keys JSONB;
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    EXECUTE format(
+                        'SELECT jsonb_agg(DISTINCT %1$I) FILTER (WHERE %1$I IS NOT NULL) FROM new_rows',
+                        key_column
+                    ) INTO keys;
+                ELSIF TG_OP = 'DELETE' THEN
+                    EXECUTE format(
+                        'SELECT jsonb_agg(DISTINCT %1$I) FILTER (WHERE %1$I IS NOT NULL) FROM old_rows',
+                        key_column
+                    ) INTO keys;
+                ELSE
+                    EXECUTE format(
+                        'SELECT jsonb_agg(DISTINCT key) FILTER (WHERE key IS NOT NULL) '
+                        'FROM (SELECT %1$I AS key FROM old_rows UNION ALL SELECT %1$I FROM new_rows) AS changed',
+                        key_column
+                    ) INTO keys;
+                END IF;
+
+                IF keys IS NULL THEN
+                    RETURN NULL;
+                END IF;
+                IF jsonb_array_length(keys) > 500 THEN
+                    keys := NULL;
+                END IF;
+
+                PERFORM pg_notify(
+                    'table_changes',
+                    json_build_object('table', TG_TABLE_NAME, 'column', key_column, 'keys', keys)::text
+                );
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+        """,
+        *(
+            f"""
+                CREATE OR REPLACE TRIGGER trigger_{table}_notify_{name}
+                AFTER {event} ON {table}
+                REFERENCING {transition_tables}
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION notify_table_changes('{key_column}');
+            """
+            for table, key_column in NOTIFIED_TABLES
+            for name, event, transition_tables in TRIGGER_EVENTS
+        ),
+    )
+)
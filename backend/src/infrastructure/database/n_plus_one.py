@@ -0,0 +1,86 @@
+import traceback
+from dataclasses import dataclass
+
+from src.domain.abstractions.database.query_interceptor import AbstractQueryInterceptor
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.infrastructure.database.query_scope import QueryScope
+from src.infrastructure.database.query_stats import fingerprint
+from src.infrastructure.exceptions.repository_exceptions import NPlusOneQueryError
+
+# Frames of the modules that only carry the query to the database, left out of the reported stack.
+_INSTRUMENTATION_FILES = (
+    "/infrastructure/database/instrumented_connection.py",
+    "/infrastructure/database/n_plus_one.py",
+)
+
+
+@dataclass(frozen=True)
+class NPlusOneViolation:
+    unit_of_work: str
+    fingerprint: str
+    count: int
+    stack: str
+
+
+class NPlusOneDetector(AbstractQueryInterceptor):
+    """Flags a unit of work that runs the same query fingerprint `threshold` times, which is what a query
+    issued once per row of an earlier result looks like.
+
+    Each violation is logged once per unit of work and fingerprint together with the application frames of
+    the stack, the innermost service line last. With `raise_errors` the query that reaches the threshold
+    raises NPlusOneQueryError, so the operation fails. The violations are also kept until `clear()`, so that
+    the fail_on_n_plus_one_queries fixture of the test suite can clear them before each test and fail the
+    test if any were recorded during it, even when the error was turned into an HTTP response.
+
+    Detection is off unless `enabled`, as it is meant for development and test runs.
+    """
+
+    max_violations = 100
+
+    def __init__(self, logger: AbstractLogger, enabled: bool = False, threshold: int = 5, raise_errors: bool = False):
+        self.logger = logger
+        self.enabled = enabled
+        self.threshold = threshold
+        self.raise_errors = raise_errors
+        self._violations: list[NPlusOneViolation] = []
+
+    def on_query(self, query: str, seconds: float, rows: int) -> None:
+        if not self.enabled:
+            return
+        queries = QueryScope.current()
+        if queries is None:
+            return
+
+        query_fingerprint = fingerprint(query)
+        count = queries.counts.get(query_fingerprint, 0) + 1
+        queries.counts[query_fingerprint] = count
+        if count != self.threshold:
+            return
+
+        violation = NPlusOneViolation(queries.unit_of_work, query_fingerprint, count, self._application_stack())
+        if len(self._violations) < self.max_violations:
+            self._violations.append(violation)
+        self.logger.warning(
+            "Possible N+1 query: %s ran the same query %s times: %s\n%s",
+            violation.unit_of_work,
+            violation.count,
+            violation.fingerprint,
+            violation.stack
+        )
+        if self.raise_errors:
+            raise NPlusOneQueryError(violation.unit_of_work, violation.fingerprint, violation.count, violation.stack)
+
+    def violations(self) -> list[NPlusOneViolation]:
+        return list(self._violations)
+
+    def clear(self) -> None:
+        self._violations.clear()
+
+    @staticmethod
+    def _application_stack() -> str:
+        """Returns the frames of the application's own code that led to the query."""
+        frames = [
+            frame for frame in traceback.extract_stack()
+            if "/src/" in frame.filename and not frame.filename.endswith(_INSTRUMENTATION_FILES)
+        ]
+        return "".join(traceback.format_list(frames)).rstrip()
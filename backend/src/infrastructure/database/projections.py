@@ -0,0 +1,5 @@
+# Columns selected for the read-only projections, matching the fields of the corresponding API responses.
+ACCOUNT_PROJECTION_COLUMNS = "id, user_id, bank_id, balance, status, type, created_at, updated_at"
+TRANSFER_PROJECTION_COLUMNS = "id, from_account_id, to_account_id, amount, status, created_at, updated_at"
+ADDITION_PROJECTION_COLUMNS = "id, amount, source, account_id, created_at"
+WITHDRAWAL_PROJECTION_COLUMNS = "id, amount, source, account_id, created_at"
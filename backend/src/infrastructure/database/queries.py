@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.domain.entities.page import PageCursor
+from src.infrastructure.database import projections
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
+
+# Read statements of the repositories. The index usage checker explains every statement and page query
+# defined here, so a read added to or changed in a repository is checked as it actually runs.
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    """Keyset-paginated read of a table, optionally filtered by a condition on the leading arguments."""
+    table: str
+    condition: Optional[str] = None
+    columns: str = "*"
+
+    def build(self, args: tuple, limit: int, cursor: Optional[PageCursor] = None) -> tuple[str, tuple]:
+        return PaginationHandler.build_page_query(self.table, self.condition, args, limit, cursor, self.columns)
+
+
+SELECT_ACCOUNT_BY_ID = "SELECT * FROM accounts WHERE id = $1"
+SELECT_ACCOUNTS_BY_USER_ID = "SELECT * FROM accounts WHERE user_id = $1"
+SELECT_ACCOUNT_PROJECTIONS_BY_USER_ID = (
+    f"SELECT {projections.ACCOUNT_PROJECTION_COLUMNS} FROM accounts WHERE user_id = $1"
+)
+LOCK_ACCOUNTS = "SELECT * FROM accounts WHERE id = ANY($1::int[]) ORDER BY id FOR UPDATE"
+LOCK_ACCOUNT_IDS = "SELECT id FROM accounts WHERE id = ANY($1::int[]) ORDER BY id FOR UPDATE"
+
+SELECT_ADDITION_BY_ID = "SELECT * FROM additions WHERE id = $1"
+ADDITIONS_PAGE = PageQuery("additions")
+ADDITION_PROJECTIONS_BY_ACCOUNT_ID_PAGE = PageQuery(
+    "additions",
+    "account_id = $1",
+    projections.ADDITION_PROJECTION_COLUMNS
+)
+
+SELECT_BANK_BY_ID = "SELECT * FROM banks WHERE id = $1"
+BANKS_PAGE = PageQuery("banks")
+
+SELECT_DEPOSIT_ACCOUNT_BY_ID = "SELECT * FROM deposit_accounts WHERE id = $1"
+
+SELECT_ENTERPRISE_BY_ID = "SELECT * FROM enterprises WHERE id = $1"
+SELECT_ENTERPRISE_SPECIALIST_BY_USER_ID = "SELECT * FROM enterprise_specialists WHERE user_id = $1"
+SELECT_ENTERPRISE_SPECIALIST_BY_ID = "SELECT * FROM enterprise_specialists WHERE id = $1"
+SELECT_ENTERPRISE_PAYROLL_REQUEST_BY_ID = "SELECT * FROM enterprise_payroll_requests WHERE id = $1"
+SELECT_ENTERPRISE_PAYROLL_TRANSACTIONS_BY_REQUEST_ID = (
+    "SELECT * FROM enterprise_payroll_transactions WHERE payroll_request_id = $1"
+)
+
+SELECT_LOAN_BY_ID = "SELECT * FROM loans WHERE id = $1"
+SELECT_LOAN_ACCOUNT_BY_ID = "SELECT * FROM loan_accounts WHERE id = $1"
+SELECT_LOAN_ACCOUNT_BY_ACCOUNT_ID = "SELECT * FROM loan_accounts WHERE account_id = $1"
+SELECT_LOAN_ACCOUNTS_BY_USER_ID = "SELECT * FROM loan_accounts WHERE user_id = $1"
+LOAN_TRANSACTIONS_BY_LOAN_ACCOUNT_ID_PAGE = PageQuery("loan_transactions", "loan_account_id = $1")
+SELECT_LOAN_TRANSACTIONS_TOTAL_BY_LOAN_ACCOUNT_ID = (
+    "SELECT COALESCE(SUM(amount), 0) FROM loan_transactions WHERE loan_account_id = $1"
+)
+
+SELECT_TRANSFER_BY_ID = "SELECT * FROM transfers WHERE id = $1"
+TRANSFER_PROJECTIONS_BY_ACCOUNT_ID_PAGE = PageQuery(
+    "transfers",
+    "from_account_id = $1 OR to_account_id = $1",
+    projections.TRANSFER_PROJECTION_COLUMNS
+)
+
+SELECT_USER_BY_ID = "SELECT * FROM users WHERE id = $1"
+SELECT_USER_BY_PHONE_NUMBER = "SELECT * FROM users WHERE phone_number = $1"
+SELECT_USERS_BY_PASSPORT_NUMBERS = "SELECT * FROM users WHERE passport_number = ANY($1::varchar[])"
+SELECT_CONFLICTING_USER_FIELD = """
+    SELECT CASE
+        WHEN passport_number = $1 THEN 'passport_number'
+        WHEN phone_number = $2 THEN 'phone_number'
+        ELSE 'email'
+    END AS field
+    FROM users
+    WHERE passport_number = $1 OR phone_number = $2 OR email = $3
+    LIMIT 1
+"""
+USERS_PAGE = PageQuery("users")
+
+SELECT_WITHDRAWAL_BY_ID = "SELECT * FROM withdrawals WHERE id = $1"
+WITHDRAWALS_PAGE = PageQuery("withdrawals")
+WITHDRAWAL_PROJECTIONS_BY_ACCOUNT_ID_PAGE = PageQuery(
+    "withdrawals",
+    "account_id = $1",
+    projections.WITHDRAWAL_PROJECTION_COLUMNS
+)
@@ -0,0 +1,29 @@
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class UnitOfWorkQueries:
+    """Number of runs of each query fingerprint within one unit of work."""
+    unit_of_work: str
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+_unit_of_work_queries: ContextVar[Optional[UnitOfWorkQueries]] = ContextVar("unit_of_work_queries", default=None)
+
+
+class QueryScope:
+    """Queries of the unit of work running in the current context."""
+
+    @staticmethod
+    def start(unit_of_work: str) -> Token:
+        return _unit_of_work_queries.set(UnitOfWorkQueries(unit_of_work))
+
+    @staticmethod
+    def reset(token: Token) -> None:
+        _unit_of_work_queries.reset(token)
+
+    @staticmethod
+    def current() -> Optional[UnitOfWorkQueries]:
+        return _unit_of_work_queries.get()
@@ -0,0 +1,140 @@
+import math
+import re
+import sys
+from collections import deque
+from functools import lru_cache
+
+from src.domain.abstractions.database.query_interceptor import AbstractQueryStatsInterceptor
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.domain.entities.query_stats import QueryStats
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\((?:\s*(?:\$\?|\?)\s*,)+\s*(?:\$\?|\?)\s*\)")
+_ROW = r"\((?:[^()]|\([^()]*\))*\)"
+_VALUES_ROWS = re.compile(rf"\b(VALUES\s*{_ROW})(?:\s*,\s*{_ROW})+", re.IGNORECASE)
+
+# Modules whose frames sit between a repository and the query, skipped when looking for the caller.
+_INSTRUMENTATION_MODULES = frozenset({
+    __name__,
+    "src.infrastructure.database.instrumented_connection",
+    "src.infrastructure.database.connection",
+    "contextlib",
+})
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(query: str) -> str:
+    """Returns the query with its literals and placeholders replaced by ? and its value lists and the rows of
+    its VALUES lists collapsed, so that the statements built for different arguments or numbers of values or
+    rows share one fingerprint."""
+    query = _WHITESPACE.sub(" ", query).strip()
+    query = _STRING_LITERAL.sub("?", query)
+    query = _PLACEHOLDER.sub("$?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    query = _VALUE_LIST.sub("(...)", query)
+    return _VALUES_ROWS.sub(r"\1", query)
+
+
+def _caller() -> str:
+    """Returns the qualified name of the function that issued the query being observed."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module not in _INSTRUMENTATION_MODULES:
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class _FingerprintStats:
+    __slots__ = ("count", "total_seconds", "max_seconds", "rows", "durations", "callers")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.durations: deque[float] = deque(maxlen=window)
+        self.callers: set[str] = set()
+
+
+class QueryStatsInterceptor(AbstractQueryStatsInterceptor):
+    """Collects per-fingerprint query statistics and logs the queries slower than a threshold.
+
+    The percentiles are computed over the last `window` durations of each fingerprint. At most
+    `max_fingerprints` fingerprints are tracked; queries with new fingerprints beyond that are only checked
+    against the threshold. With `echo` every query is logged along with the repository method that ran it.
+    """
+
+    max_callers = 8
+
+    def __init__(
+            self,
+            logger: AbstractLogger,
+            slow_query_ms: float = 200.0,
+            window: int = 1000,
+            max_fingerprints: int = 1000,
+            echo: bool = False
+    ):
+        self.logger = logger
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+        self.echo = echo
+        self._stats: dict[str, _FingerprintStats] = {}
+
+    def on_query(self, query: str, seconds: float, rows: int) -> None:
+        query_fingerprint = fingerprint(query)
+        caller = _caller()
+
+        stats = self._stats.get(query_fingerprint)
+        if stats is None and len(self._stats) < self.max_fingerprints:
+            stats = self._stats[query_fingerprint] = _FingerprintStats(self.window)
+        if stats is not None:
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.rows += rows
+            stats.durations.append(seconds)
+            if len(stats.callers) < self.max_callers:
+                stats.callers.add(caller)
+
+        if seconds >= self.slow_query_seconds:
+            self.logger.warning(
+                "Slow query took %.1f ms in %s: %s",
+                seconds * 1000,
+                caller,
+                query_fingerprint,
+                query_ms=round(seconds * 1000, 3),
+                caller=caller
+            )
+        elif self.echo:
+            self.logger.info("Query took %.1f ms in %s: %s", seconds * 1000, caller, query_fingerprint)
+
+    def stats(self) -> list[QueryStats]:
+        query_stats = [
+            QueryStats(
+                fingerprint=query_fingerprint,
+                count=stats.count,
+                total_seconds=stats.total_seconds,
+                p50_seconds=self._percentile(stats.durations, 0.5),
+                p99_seconds=self._percentile(stats.durations, 0.99),
+                max_seconds=stats.max_seconds,
+                rows=stats.rows,
+                callers=tuple(sorted(stats.callers))
+            )
+            for query_fingerprint, stats in list(self._stats.items())
+        ]
+        return sorted(query_stats, key=lambda item: item.total_seconds, reverse=True)
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    @staticmethod
+    def _percentile(durations: deque[float], quantile: float) -> float:
+        """Returns the nearest-rank percentile of the durations."""
+        ordered = sorted(durations)
+        return ordered[max(math.ceil(quantile * len(ordered)) - 1, 0)]
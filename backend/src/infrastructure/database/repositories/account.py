@@ -1,35 +1,79 @@
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterable, Optional
 from asyncpg.exceptions import UniqueViolationError, ForeignKeyViolationError
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.accounts import AbstractAccountRepository
 from src.domain.entities.account import Account
+from src.domain.entities.projection import Projection
 from src.domain.enums.account import AccountStatus
+from src.domain.exceptions.account import InsufficientFundsError, InactiveAccountError
 from src.infrastructure.database.handlers.error_handler import ErrorHandler
 from src.infrastructure.database.mappers.account import AccountDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class AccountRepository(AbstractAccountRepository):
-    def __init__(self, db_connection: Any):
+    def __init__(self, db_connection: Any, identity_map: AbstractIdentityMap):
         self.connection = db_connection
+        self.identity_map = identity_map
 
     async def get_account_by_id(self, account_id) -> Account:
-        stmt = "SELECT * FROM accounts WHERE id = $1"
+        account = self.identity_map.get(Account, account_id)
+        if account is not None:
+            return account
+
+        stmt = queries.SELECT_ACCOUNT_BY_ID
 
         row = await self.connection.fetchrow(stmt, account_id)
 
         if row:
-            return AccountDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(AccountDatabaseMapper.from_db_row(row))
 
         raise NotFoundError(f"Account with id {account_id} not found")
 
     async def get_accounts_by_user_id(self, user_id) -> list[Account]:
-        stmt = "SELECT * FROM accounts WHERE user_id = $1"
+        stmt = queries.SELECT_ACCOUNTS_BY_USER_ID
+
+        rows = await self.connection.fetch(stmt, user_id)
+
+        return [self.identity_map.add(AccountDatabaseMapper.from_db_row(row)) for row in rows] if rows else []
+
+    async def get_account_projections_by_user_id(self, user_id: int) -> list[Projection]:
+        stmt = queries.SELECT_ACCOUNT_PROJECTIONS_BY_USER_ID
 
         rows = await self.connection.fetch(stmt, user_id)
 
-        return [AccountDatabaseMapper.from_db_row(row) for row in rows] if rows else []
+        return [dict(row) for row in rows]
+
+    async def lock_accounts(self, account_ids: Iterable[int]) -> dict[int, Account]:
+        """Locks all rows in one statement and in a global order, so that units of work
+        touching the same accounts queue behind each other instead of deadlocking."""
+        ids = sorted(set(account_ids))
+        stmt = queries.LOCK_ACCOUNTS
+
+        rows = await self.connection.fetch(stmt, ids)
+
+        accounts = {row["id"]: self.identity_map.add(AccountDatabaseMapper.from_db_row(row)) for row in rows}
+        missing_ids = [account_id for account_id in ids if account_id not in accounts]
+        if missing_ids:
+            raise NotFoundError(f"Accounts with ids {missing_ids} not found")
+
+        return accounts
+
+    async def lock_account_ids(self, account_ids: Iterable[int]) -> None:
+        """Takes the same ordered locks as `lock_accounts` for many rows that are only updated afterwards,
+        without building and tracking an entity per row."""
+        ids = sorted(set(account_ids))
+        stmt = queries.LOCK_ACCOUNT_IDS
+
+        rows = await self.connection.fetch(stmt, ids)
+
+        if len(rows) != len(ids):
+            locked_ids = {row["id"] for row in rows}
+            missing_ids = [account_id for account_id in ids if account_id not in locked_ids]
+            raise NotFoundError(f"Accounts with ids {missing_ids} not found")
 
     async def create_account(self, account_create: Account) -> Account:
         account_create_row = AccountDatabaseMapper.to_db_row(account_create)
@@ -47,7 +91,26 @@ class AccountRepository(AbstractAccountRepository):
         except ForeignKeyViolationError as exc:
             raise ErrorHandler.handle_unique_violation("Account", exc, account_create)
 
-        return AccountDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(AccountDatabaseMapper.from_db_row(row))
+
+    async def create_accounts(self, accounts_create: list[Account]) -> list[int]:
+        account_create_rows = [AccountDatabaseMapper.to_db_row(account) for account in accounts_create]
+
+        stmt = """
+            INSERT INTO accounts (bank_id, status, type, user_id)
+            SELECT bank_id, status, type, user_id
+            FROM unnest($1::int[], $2::account_status[], $3::account_type[], $4::int[])
+                AS rows (bank_id, status, type, user_id)
+            RETURNING id
+        """
+        values = tuple([row[column] for row in account_create_rows] for column in ("bank_id", "status", "type", "user_id"))
+
+        try:
+            rows = await self.connection.fetch(stmt, *values)
+        except ForeignKeyViolationError as exc:
+            raise ErrorHandler.handle_foreign_key_violation("Account", exc)
+
+        return [row["id"] for row in rows]
 
     async def update_account(self, account_id: int, account_update: Account) -> Account:
         account_update_row = AccountDatabaseMapper.to_db_row(account_update)
@@ -62,25 +125,114 @@ class AccountRepository(AbstractAccountRepository):
             raise ErrorHandler.handle_unique_violation("Account", exc, account_update)
 
         if row:
-            return AccountDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(AccountDatabaseMapper.from_db_row(row))
 
         raise NotFoundError(f"Account with id {account_id} not found")
 
     async def update_account_balance(self, account_id: int, new_balance: Decimal) -> None:
-        stmt = "UPDATE accounts SET balance = $2 WHERE id = $1"
+        stmt = "UPDATE accounts SET balance = $2 WHERE id = $1 RETURNING *"
+
+        row = await self.connection.fetchrow(stmt, account_id, new_balance)
+
+        self._remember_updated_row(account_id, row)
+
+    async def credit_account_balance(
+            self,
+            account_id: int,
+            amount: Decimal,
+            required_status: Optional[AccountStatus] = None
+    ) -> Account:
+        return await self._apply_balance_delta(account_id, amount, required_status)
+
+    async def debit_account_balance(
+            self,
+            account_id: int,
+            amount: Decimal,
+            required_status: Optional[AccountStatus] = None
+    ) -> Account:
+        return await self._apply_balance_delta(account_id, -amount, required_status)
+
+    async def credit_accounts_balance(self, account_ids: list[int], amount: Decimal) -> None:
+        stmt = """
+            WITH credits AS (
+                SELECT account_id, count(*) AS times
+                FROM unnest($1::bigint[]) AS account_id
+                GROUP BY account_id
+            ), updated AS (
+                UPDATE accounts
+                SET balance = balance + $2 * credits.times
+                FROM credits
+                WHERE accounts.id = credits.account_id
+                RETURNING accounts.id
+            )
+            SELECT (SELECT count(*) FROM credits) - (SELECT count(*) FROM updated)
+        """
+
+        missing_count = await self.connection.fetchval(stmt, account_ids, amount)
+
+        for account_id in set(account_ids):
+            self.identity_map.remove(Account, account_id)
+
+        if missing_count:
+            raise NotFoundError(f"{missing_count} of the accounts to credit not found")
+
+    async def _apply_balance_delta(
+            self,
+            account_id: int,
+            delta: Decimal,
+            required_status: Optional[AccountStatus]
+    ) -> Account:
+        """Adds delta to the balance in a single guarded statement.
+
+        The guard is evaluated against the locked row, so concurrent mutations can
+        neither be lost nor drive the balance below zero. The pre-update row is
+        returned alongside to explain why the guard rejected the change.
+        """
+        stmt = """
+            WITH current AS (
+                SELECT balance, status FROM accounts WHERE id = $1
+            ), updated AS (
+                UPDATE accounts
+                SET balance = balance + $2
+                WHERE id = $1
+                  AND balance + $2 >= 0
+                  AND ($3::account_status IS NULL OR status = $3::account_status)
+                RETURNING *
+            )
+            SELECT updated.*, current.balance AS current_balance, current.status AS current_status
+            FROM current LEFT JOIN updated ON TRUE
+        """
+        status = required_status.value if required_status else None
+
+        row = await self.connection.fetchrow(stmt, account_id, delta, status)
+
+        if row is None:
+            raise NotFoundError(f"Account with id {account_id} not found")
+        if row["id"] is None:
+            if required_status and AccountStatus(row["current_status"]) is not required_status:
+                raise InactiveAccountError(AccountStatus(row["current_status"]))
+            raise InsufficientFundsError(row["current_balance"])
 
-        await self.connection.execute(stmt, account_id, new_balance)
+        return self.identity_map.add(AccountDatabaseMapper.from_db_row(row))
 
     async def update_account_status(self, account_id: int, new_status: AccountStatus) -> None:
-        stmt = "UPDATE accounts SET status = $2 WHERE id = $1"
+        stmt = "UPDATE accounts SET status = $2 WHERE id = $1 RETURNING *"
 
-        await self.connection.execute(stmt, account_id, new_status.value)
+        row = await self.connection.fetchrow(stmt, account_id, new_status.value)
+
+        self._remember_updated_row(account_id, row)
 
     async def delete_account_by_id(self, account_id: int) -> None:
         stmt = "DELETE FROM accounts WHERE id = $1"
 
         result = await self.connection.execute(stmt, account_id)
+        self.identity_map.remove(Account, account_id)
 
         if result == "DELETE 0":
             raise NotFoundError(f"Account with id {account_id} not found")
 
+    def _remember_updated_row(self, account_id: int, row: Any) -> None:
+        if row:
+            self.identity_map.add(AccountDatabaseMapper.from_db_row(row))
+        else:
+            self.identity_map.remove(Account, account_id)
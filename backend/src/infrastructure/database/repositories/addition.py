@@ -1,38 +1,53 @@
-from typing import Any
+from typing import Any, Optional
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.additions import AbstractAdditionRepository
 from src.domain.entities.addition import Addition
+from src.domain.entities.page import Page, PageCursor
+from src.domain.entities.projection import Projection
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
 from src.infrastructure.database.mappers.addition import AdditionDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class AdditionRepository(AbstractAdditionRepository):
-    def __init__(self, db_connection: Any):
+    def __init__(self, db_connection: Any, identity_map: AbstractIdentityMap):
         self.connection = db_connection
+        self.identity_map = identity_map
 
     async def get_addition_by_id(self, addition_id: int) -> Addition:
-        stmt = "SELECT * FROM additions WHERE id = $1"
+        addition = self.identity_map.get(Addition, addition_id)
+        if addition is not None:
+            return addition
+
+        stmt = queries.SELECT_ADDITION_BY_ID
 
         row = await self.connection.fetchrow(stmt, addition_id)
 
         if row:
-            return AdditionDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(AdditionDatabaseMapper.from_db_row(row))
 
         raise NotFoundError("Addition with id = {addition_id} not found")
 
-    async def get_additions(self) -> list[Addition]:
-        stmt = "SELECT * FROM additions"
+    async def get_additions(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[Addition]:
+        stmt, args = queries.ADDITIONS_PAGE.build((), limit, cursor)
 
-        rows = await self.connection.fetch(stmt)
+        rows = await self.connection.fetch(stmt, *args)
 
-        return [AdditionDatabaseMapper.from_db_row(row) for row in rows]
+        return PaginationHandler.build_page(rows, limit, AdditionDatabaseMapper.from_db_row)
 
-    async def get_additions_by_account_id(self, account_id: int) -> list[Addition]:
-        stmt = "SELECT * FROM additions WHERE account_id = $1"
+    async def get_addition_projections_by_account_id(
+            self,
+            account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[Projection]:
+        stmt, args = queries.ADDITION_PROJECTIONS_BY_ACCOUNT_ID_PAGE.build((account_id,), limit, cursor)
 
-        rows = await self.connection.fetch(stmt, account_id)
+        rows = await self.connection.fetch(stmt, *args)
 
-        return [AdditionDatabaseMapper.from_db_row(row) for row in rows]
+        return PaginationHandler.build_page(rows, limit, dict)
 
     async def create_addition(self, addition_create: Addition) -> Addition:
         addition_create_row = AdditionDatabaseMapper.to_db_row(addition_create)
@@ -45,4 +60,4 @@ class AdditionRepository(AbstractAdditionRepository):
 
         row = await self.connection.fetchrow(stmt, *values)
 
-        return AdditionDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(AdditionDatabaseMapper.from_db_row(row))
@@ -1,33 +1,42 @@
-from typing import Any
+from typing import Any, Optional
 from asyncpg.exceptions import UniqueViolationError
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.banks import AbstractBankRepository
 from src.domain.entities.bank import Bank
+from src.domain.entities.page import Page, PageCursor
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError, NoFieldsToUpdateError
 from src.infrastructure.database.mappers.bank import BankDatabaseMapper
 from src.infrastructure.database.handlers.error_handler import ErrorHandler
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
+from src.infrastructure.database import queries
 
 
 class BankRepository(AbstractBankRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_bank_by_id(self, bank_id: int) -> Bank:
-        stmt = "SELECT * FROM banks WHERE id = $1"
+        bank = self.identity_map.get(Bank, bank_id)
+        if bank is not None:
+            return bank
+
+        stmt = queries.SELECT_BANK_BY_ID
 
         row = await self.connection.fetchrow(stmt, bank_id)
 
         if row is None:
             raise NotFoundError(f"Bank with id = {bank_id} not found")
 
-        return BankDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(BankDatabaseMapper.from_db_row(row))
 
-    async def get_banks(self) -> list[Bank]:
-        stmt = "SELECT * FROM banks"
+    async def get_banks(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[Bank]:
+        stmt, args = queries.BANKS_PAGE.build((), limit, cursor)
 
-        rows = await self.connection.fetch(stmt)
+        rows = await self.connection.fetch(stmt, *args)
 
-        return [BankDatabaseMapper.from_db_row(row) for row in rows]
+        return PaginationHandler.build_page(rows, limit, BankDatabaseMapper.from_db_row)
 
     async def create_bank(self, bank_create: Bank) -> Bank:
         bank_create_row = BankDatabaseMapper.to_db_row(bank_create)
@@ -43,7 +52,7 @@ class BankRepository(AbstractBankRepository):
         except UniqueViolationError as exc:
             raise ErrorHandler.handle_unique_violation("Bank", exc, bank_create)
 
-        return BankDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(BankDatabaseMapper.from_db_row(row))
 
     async def update_bank_by_id(self, bank_id: int, bank_update: Bank) -> Bank:
         bank_update_row = BankDatabaseMapper.to_db_row(bank_update)
@@ -58,7 +67,7 @@ class BankRepository(AbstractBankRepository):
             raise ErrorHandler.handle_unique_violation("Bank", exc, bank_update)
 
         if row:
-            return BankDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(BankDatabaseMapper.from_db_row(row))
 
         raise NotFoundError(f"Bank with id = {bank_id} not found")
 
@@ -66,6 +75,7 @@ class BankRepository(AbstractBankRepository):
         stmt = "DELETE FROM banks WHERE id = $1"
 
         result = await self.connection.execute(stmt, bank_id)
+        self.identity_map.remove(Bank, bank_id)
 
         if result == "DELETE 0":
             raise NotFoundError(f"Bank with id = {bank_id} not found")
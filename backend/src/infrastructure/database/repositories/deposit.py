@@ -1,21 +1,27 @@
 from typing import Any
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.deposit import AbstractDepositRepository
 from src.domain.entities.deposit import DepositAccount, DepositTransaction
 from src.infrastructure.database.mappers.deposit import DepositDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class DepositRepository(AbstractDepositRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_deposit_account_by_id(self, deposit_account_id: int) -> DepositAccount:
-        stmt = "SELECT * FROM deposit_accounts WHERE id = $1"
+        deposit_account = self.identity_map.get(DepositAccount, deposit_account_id)
+        if deposit_account is not None:
+            return deposit_account
+        stmt = queries.SELECT_DEPOSIT_ACCOUNT_BY_ID
         row = await self.connection.fetchrow(stmt, deposit_account_id)
         if row is None:
             raise NotFoundError(f"Deposit account with id = {deposit_account_id} not found")
-        return DepositDatabaseMapper.from_db_row_to_deposit_account(row)
+        return self.identity_map.add(DepositDatabaseMapper.from_db_row_to_deposit_account(row))
 
     async def create_deposit_transaction(self, deposit_transaction_create: DepositTransaction) -> DepositTransaction:
         loan_create_row = DepositDatabaseMapper.from_deposit_transaction_to_db_row(deposit_transaction_create)
@@ -35,4 +41,4 @@ class DepositRepository(AbstractDepositRepository):
 
         stmt = f"INSERT INTO deposit_accounts ({columns}) VALUES ({placeholders}) RETURNING *"
         row = await self.connection.fetchrow(stmt, *values)
-        return DepositDatabaseMapper.from_db_row_to_deposit_account(row)
+        return self.identity_map.add(DepositDatabaseMapper.from_db_row_to_deposit_account(row))
@@ -1,5 +1,6 @@
 from typing import Any
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.enterprise import AbstractEnterpriseRepository
 from src.domain.enums.enterprise import EnterprisePayrollRequestStatus
 from src.domain.entities.enterprise import (
@@ -9,40 +10,51 @@ from src.domain.entities.enterprise import (
     EnterprisePayrollTransaction
 )
 from src.infrastructure.database.mappers.enterprise import EnterpriseDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class EnterpriseRepository(AbstractEnterpriseRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_enterprise_by_id(self, enterprise_id: int) -> Enterprise:
-        stmt = "SELECT * FROM enterprises WHERE id = $1"
+        enterprise = self.identity_map.get(Enterprise, enterprise_id)
+        if enterprise is not None:
+            return enterprise
+        stmt = queries.SELECT_ENTERPRISE_BY_ID
         row = await self.connection.fetchrow(stmt, enterprise_id)
         if row is None:
             raise NotFoundError(f"Enterprise with id = {enterprise_id} not found")
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise(row))
 
     async def get_enterprise_specialist_by_user_id(self, user_id: int) -> EnterpriseSpecialist:
-        stmt = "SELECT * FROM enterprise_specialists WHERE user_id = $1"
+        stmt = queries.SELECT_ENTERPRISE_SPECIALIST_BY_USER_ID
         row = await self.connection.fetchrow(stmt, user_id)
         if row is None:
             raise NotFoundError(f"Enterprise specialist with user_id = {user_id} not found")
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise_specialist(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise_specialist(row))
 
     async def get_enterprise_specialist_by_id(self, specialist_id: int) -> EnterpriseSpecialist:
-        stmt = "SELECT * FROM enterprise_specialists WHERE id = $1"
+        enterprise_specialist = self.identity_map.get(EnterpriseSpecialist, specialist_id)
+        if enterprise_specialist is not None:
+            return enterprise_specialist
+        stmt = queries.SELECT_ENTERPRISE_SPECIALIST_BY_ID
         row = await self.connection.fetchrow(stmt, specialist_id)
         if row is None:
             raise NotFoundError(f"Enterprise specialist with id = {specialist_id} not found")
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise_specialist(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise_specialist(row))
 
     async def get_enterprise_payroll_request_by_id(self, enterprise_payroll_request_id: int) -> EnterprisePayrollRequest:
-        stmt = "SELECT * FROM enterprise_payroll_requests WHERE id = $1"
+        enterprise_payroll_request = self.identity_map.get(EnterprisePayrollRequest, enterprise_payroll_request_id)
+        if enterprise_payroll_request is not None:
+            return enterprise_payroll_request
+        stmt = queries.SELECT_ENTERPRISE_PAYROLL_REQUEST_BY_ID
         row = await self.connection.fetchrow(stmt, enterprise_payroll_request_id)
         if row is None:
             raise NotFoundError(f"Enterprise payroll request with id = {enterprise_payroll_request_id} not found")
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_request(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_request(row))
 
     async def create_enterprise_specialist(self, enterprise_specialist: EnterpriseSpecialist) -> EnterpriseSpecialist:
         data = EnterpriseDatabaseMapper.from_enterprise_specialist_to_db_row(enterprise_specialist)
@@ -51,12 +63,12 @@ class EnterpriseRepository(AbstractEnterpriseRepository):
         values = tuple(data.values())
         stmt = f"INSERT INTO enterprise_specialists ({columns}) VALUES ({placeholders}) RETURNING *"
         row = await self.connection.fetchrow(stmt, *values)
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise_specialist(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise_specialist(row))
 
     async def get_enterprise_payroll_transactions_by_payroll_request_id(
             self, enterprise_payroll_request_id: int
     ) -> list[EnterprisePayrollTransaction]:
-        stmt = "SELECT * FROM enterprise_payroll_transactions WHERE payroll_request_id = $1"
+        stmt = queries.SELECT_ENTERPRISE_PAYROLL_TRANSACTIONS_BY_REQUEST_ID
         rows = await self.connection.fetch(stmt, enterprise_payroll_request_id)
         return [EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_transaction(row) for row in rows]
 
@@ -67,7 +79,7 @@ class EnterpriseRepository(AbstractEnterpriseRepository):
         values = tuple(data.values())
         stmt = f"INSERT INTO enterprise_payroll_requests ({columns}) VALUES ({placeholders}) RETURNING *"
         row = await self.connection.fetchrow(stmt, *values)
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_request(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_request(row))
 
     async def create_enterprise_payroll_transaction(
             self, enterprise_payroll_transaction: EnterprisePayrollTransaction
@@ -80,6 +92,16 @@ class EnterpriseRepository(AbstractEnterpriseRepository):
         row = await self.connection.fetchrow(stmt, *values)
         return EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_transaction(row)
 
+    async def create_enterprise_payroll_transactions(
+            self, enterprise_payroll_transactions: list[EnterprisePayrollTransaction]
+    ) -> None:
+        payroll_request_ids = [transaction.payroll_request_id for transaction in enterprise_payroll_transactions]
+        stmt = """
+            INSERT INTO enterprise_payroll_transactions (enterprise_payroll_request_id)
+            SELECT * FROM unnest($1::bigint[])
+        """
+        await self.connection.execute(stmt, payroll_request_ids)
+
     async def create_enterprise(self, enterprise: Enterprise) -> Enterprise:
         data = EnterpriseDatabaseMapper.from_enterprise_to_db_row(enterprise)
         columns = ', '.join(data.keys())
@@ -87,7 +109,7 @@ class EnterpriseRepository(AbstractEnterpriseRepository):
         values = tuple(data.values())
         stmt = f"INSERT INTO enterprises ({columns}) VALUES ({placeholders}) RETURNING *"
         row = await self.connection.fetchrow(stmt, *values)
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise(row))
 
     async def update_payroll_request_status_by_id(
             self, payroll_request_id: int, payroll_request_status: EnterprisePayrollRequestStatus
@@ -96,4 +118,4 @@ class EnterpriseRepository(AbstractEnterpriseRepository):
         row = await self.connection.fetchrow(stmt, payroll_request_status.value, payroll_request_id)
         if row is None:
             raise NotFoundError(f"Enterprise payroll request with id = {payroll_request_id} not found")
-        return EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_request(row)
+        return self.identity_map.add(EnterpriseDatabaseMapper.from_db_row_to_enterprise_payroll_request(row))
@@ -1,44 +1,65 @@
-from typing import Any
+from decimal import Decimal
+from typing import Any, Optional
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.loans import AbstractLoanRepository
 from src.domain.entities.loan import Loan, LoanTransaction, LoanAccount
+from src.domain.entities.page import Page, PageCursor
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
 from src.infrastructure.database.mappers.loan import LoanDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class LoanRepository(AbstractLoanRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_loan_by_id(self, loan_id: int) -> Loan:
-        stmt = "SELECT * FROM loans WHERE id = $1"
+        loan = self.identity_map.get(Loan, loan_id)
+        if loan is not None:
+            return loan
+        stmt = queries.SELECT_LOAN_BY_ID
         row = await self.connection.fetchrow(stmt, loan_id)
         if row is None:
             raise NotFoundError(f"Loan with id = {loan_id} not found")
-        return LoanDatabaseMapper.from_db_row_to_loan(row)
+        return self.identity_map.add(LoanDatabaseMapper.from_db_row_to_loan(row))
 
     async def get_loan_account_by_account_id(self, account_id: int) -> LoanAccount:
-        stmt = "SELECT * FROM loan_accounts WHERE account_id = $1"
+        stmt = queries.SELECT_LOAN_ACCOUNT_BY_ACCOUNT_ID
         row = await self.connection.fetchrow(stmt, account_id)
         if row is None:
             raise NotFoundError(f"Loan account with account id = {account_id} not found")
-        return LoanDatabaseMapper.from_db_row_to_loan(row)
+        return self.identity_map.add(LoanDatabaseMapper.from_db_row_to_loan_account(row))
 
 
-    async def get_loan_transactions_by_loan_account_id(self, loan_account_id: int) -> list[LoanTransaction]:
-        stmt = "SELECT * FROM loan_transactions WHERE loan_account_id = $1"
-        rows = await self.connection.fetch(stmt, loan_account_id)
-        return [LoanDatabaseMapper.from_db_row_to_loan_transaction(row) for row in rows]
+    async def get_loan_transactions_by_loan_account_id(
+            self,
+            loan_account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[LoanTransaction]:
+        stmt, args = queries.LOAN_TRANSACTIONS_BY_LOAN_ACCOUNT_ID_PAGE.build((loan_account_id,), limit, cursor)
+        rows = await self.connection.fetch(stmt, *args)
+        return PaginationHandler.build_page(rows, limit, LoanDatabaseMapper.from_db_row_to_loan_transaction)
+
+    async def get_loan_transactions_total_by_loan_account_id(self, loan_account_id: int) -> Decimal:
+        stmt = queries.SELECT_LOAN_TRANSACTIONS_TOTAL_BY_LOAN_ACCOUNT_ID
+        return await self.connection.fetchval(stmt, loan_account_id)
 
     async def get_loan_account_by_id(self, loan_account_id: int) -> LoanAccount:
-        stmt = "SELECT * FROM loan_accounts WHERE id = $1"
+        loan_account = self.identity_map.get(LoanAccount, loan_account_id)
+        if loan_account is not None:
+            return loan_account
+        stmt = queries.SELECT_LOAN_ACCOUNT_BY_ID
         row = await self.connection.fetchrow(stmt, loan_account_id)
         if row is None:
             raise NotFoundError(f"Loan account with id = {loan_account_id} not found")
-        return LoanDatabaseMapper.from_db_row_to_loan_account(row)
+        return self.identity_map.add(LoanDatabaseMapper.from_db_row_to_loan_account(row))
 
     async def get_loan_accounts_by_user_id(self, user_id: int) -> list[LoanAccount]:
-        stmt = "SELECT * FROM loan_accounts WHERE user_id = $1"
+        stmt = queries.SELECT_LOAN_ACCOUNTS_BY_USER_ID
         row = await self.connection.fetchrow(stmt, user_id)
         return LoanDatabaseMapper.from_db_row_to_loan_account(row)
 
@@ -50,7 +71,7 @@ class LoanRepository(AbstractLoanRepository):
 
         stmt = f"INSERT INTO loans ({columns}) VALUES ({placeholders}) RETURNING *"
         row = await self.connection.fetchrow(stmt, *values)
-        return LoanDatabaseMapper.from_db_row_to_loan(row)
+        return self.identity_map.add(LoanDatabaseMapper.from_db_row_to_loan(row))
 
     async def create_loan_transaction(self, loan_transaction: LoanTransaction) -> LoanTransaction:
         loan_transaction_create_row = LoanDatabaseMapper.from_loan_transaction_to_db_row(loan_transaction)
@@ -70,4 +91,4 @@ class LoanRepository(AbstractLoanRepository):
 
         stmt = f"INSERT INTO loan_accounts ({columns}) VALUES ({placeholders}) RETURNING *"
         row = await self.connection.fetchrow(stmt, *values)
-        return LoanDatabaseMapper.from_db_row_to_loan_account(row)
+        return self.identity_map.add(LoanDatabaseMapper.from_db_row_to_loan_account(row))
@@ -1,32 +1,47 @@
-from typing import Any
+from typing import Any, Optional
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.transfer import AbstractTransferRepository
+from src.domain.entities.page import Page, PageCursor
+from src.domain.entities.projection import Projection
 from src.domain.entities.transfer import Transfer
 from src.domain.enums.transfer import TransferStatus
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
 from src.infrastructure.database.mappers.transfer import TransferDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class TransferRepository(AbstractTransferRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_transfer_by_id(self, transfer_id: int) -> Transfer:
-        stmt = "SELECT * FROM transfers WHERE id = $1"
+        transfer = self.identity_map.get(Transfer, transfer_id)
+        if transfer is not None:
+            return transfer
+
+        stmt = queries.SELECT_TRANSFER_BY_ID
 
         row = await self.connection.fetchrow(stmt, transfer_id)
 
         if row:
-            return TransferDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(TransferDatabaseMapper.from_db_row(row))
 
         raise NotFoundError("Transfer with id = {transfer_id} not found")
 
-    async def get_transfers_by_account_id(self, account_id: int) -> list[Transfer]:
-        stmt = "SELECT * FROM transfers WHERE from_account_id = $1 OR to_account_id = $1"
+    async def get_transfer_projections_by_account_id(
+            self,
+            account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[Projection]:
+        stmt, args = queries.TRANSFER_PROJECTIONS_BY_ACCOUNT_ID_PAGE.build((account_id,), limit, cursor)
 
-        rows = await self.connection.fetch(stmt, account_id)
+        rows = await self.connection.fetch(stmt, *args)
 
-        return [TransferDatabaseMapper.from_db_row(row) for row in rows]
+        return PaginationHandler.build_page(rows, limit, dict)
 
     async def create_transfer(self, transfer_create: Transfer) -> Transfer:
         transfer_create_row = TransferDatabaseMapper.to_db_row(transfer_create)
@@ -39,7 +54,7 @@ class TransferRepository(AbstractTransferRepository):
 
         row = await self.connection.fetchrow(stmt, *values)
         print(row["status"])
-        return TransferDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(TransferDatabaseMapper.from_db_row(row))
 
     async def update_transfer_status_by_id(
             self,
@@ -49,5 +64,22 @@ class TransferRepository(AbstractTransferRepository):
         stmt = f"UPDATE transfers SET status = $2 WHERE id = $1 RETURNING *"
         row = await self.connection.fetchrow(stmt, transfer_id, transfer_status.value)
         if row:
-            return TransferDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(TransferDatabaseMapper.from_db_row(row))
         raise NotFoundError(f"Transfer with id = {transfer_id} not found")
+
+    async def cancel_completed_transfer_by_id(self, transfer_id: int) -> Optional[Transfer]:
+        stmt = """
+            UPDATE transfers SET status = $2
+            WHERE id = $1 AND status = $3
+            RETURNING *
+        """
+        row = await self.connection.fetchrow(
+            stmt,
+            transfer_id,
+            TransferStatus.CANCELED.value,
+            TransferStatus.COMPLETED.value
+        )
+        if row:
+            return self.identity_map.add(TransferDatabaseMapper.from_db_row(row))
+        self.identity_map.remove(Transfer, transfer_id)
+        return None
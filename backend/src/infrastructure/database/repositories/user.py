@@ -1,53 +1,68 @@
-from typing import Any
+from typing import Any, Optional
 from asyncpg.exceptions import UniqueViolationError
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.users import AbstractUserRepository
+from src.domain.entities.page import Page, PageCursor
 from src.domain.entities.user import User
-from src.infrastructure.exceptions.repository_exceptions import NotFoundError
+from src.infrastructure.exceptions.repository_exceptions import NotFoundError, UniqueConstraintError
 from src.infrastructure.database.mappers.user import UserDatabaseMapper
 from src.infrastructure.database.handlers.error_handler import ErrorHandler
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
+from src.infrastructure.database import queries
 
 
 class UserRepository(AbstractUserRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_user_by_id(self, user_id: int) -> User:
-        stmt = "SELECT * FROM users WHERE id = $1"
+        user = self.identity_map.get(User, user_id)
+        if user is not None:
+            return user
+
+        stmt = queries.SELECT_USER_BY_ID
 
         row = await self.connection.fetchrow(stmt, user_id)
 
         if row:
-            return UserDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(UserDatabaseMapper.from_db_row(row))
 
         raise NotFoundError(f"User with id = {user_id} not found")
 
+    async def get_users_by_passport_numbers(self, passport_numbers: list[str]) -> list[User]:
+        stmt = queries.SELECT_USERS_BY_PASSPORT_NUMBERS
+
+        rows = await self.connection.fetch(stmt, passport_numbers)
+
+        return [self.identity_map.add(UserDatabaseMapper.from_db_row(row)) for row in rows] if rows else []
+
     async def get_user_by_phone_number(self, phone_number: str) -> User:
-        stmt = "SELECT * FROM users WHERE phone_number = $1"
+        stmt = queries.SELECT_USER_BY_PHONE_NUMBER
 
         row = await self.connection.fetchrow(stmt, phone_number)
 
         if row:
-            return UserDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(UserDatabaseMapper.from_db_row(row))
 
         raise NotFoundError(f"User with phone_number = {phone_number} not found")
 
-    async def get_user_hashed_password_by_phone_number(self, phone_number: str) -> str:
-        stmt = "SELECT hashed_password FROM users WHERE phone_number = $1"
+    async def get_users(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[User]:
+        stmt, args = queries.USERS_PAGE.build((), limit, cursor)
 
-        row = await self.connection.fetchrow(stmt, phone_number)
-
-        if row:
-            return row['hashed_password']
+        rows = await self.connection.fetch(stmt, *args)
 
-        raise NotFoundError(f"User with phone_number = {phone_number} not found")
+        return PaginationHandler.build_page(rows, limit, UserDatabaseMapper.from_db_row)
 
-    async def get_users(self) -> list[User]:
-        stmt = "SELECT * FROM users"
+    async def check_user_uniqueness(self, passport_number: str, phone_number: str, email: str) -> None:
+        stmt = queries.SELECT_CONFLICTING_USER_FIELD
 
-        rows = await self.connection.fetch(stmt)
+        field = await self.connection.fetchval(stmt, passport_number, phone_number, email)
 
-        return [UserDatabaseMapper.from_db_row(row) for row in rows] if rows else []
+        if field:
+            values = {"passport_number": passport_number, "phone_number": phone_number, "email": email}
+            raise UniqueConstraintError("User", field, values[field])
 
     async def create_user(self, user_create: User) -> User:
         user_create_row = UserDatabaseMapper.to_db_row(user_create)
@@ -63,7 +78,7 @@ class UserRepository(AbstractUserRepository):
         except UniqueViolationError as exc:
             raise ErrorHandler.handle_unique_violation("User", exc, user_create)
 
-        return UserDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(UserDatabaseMapper.from_db_row(row))
 
     async def update_user_by_id(self, user_id: int, user_update: User) -> User:
         user_update_row = UserDatabaseMapper.to_db_row(user_update)
@@ -78,7 +93,7 @@ class UserRepository(AbstractUserRepository):
             raise ErrorHandler.handle_unique_violation("User", exc, user_update)
 
         if row:
-            return UserDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(UserDatabaseMapper.from_db_row(row))
 
         raise NotFoundError(f"User with id = {user_id} not found")
 
@@ -86,6 +101,7 @@ class UserRepository(AbstractUserRepository):
         stmt = "DELETE FROM users WHERE id = $1"
 
         result = await self.connection.execute(stmt, user_id)
+        self.identity_map.remove(User, user_id)
 
         if result == "DELETE 0":
             raise NotFoundError(f"User with id = {user_id} not found")
@@ -1,41 +1,56 @@
-from typing import Any
+from typing import Any, Optional
 
 from asyncpg.exceptions import UniqueViolationError, ForeignKeyViolationError
 
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.withdrawals import AbstractWithdrawalRepository
+from src.domain.entities.page import Page, PageCursor
+from src.domain.entities.projection import Projection
 from src.domain.entities.withdrawal import Withdrawal
 from src.infrastructure.database.handlers.error_handler import ErrorHandler
+from src.infrastructure.database.handlers.pagination_handler import PaginationHandler
 from src.infrastructure.database.mappers.withdrawal import WithdrawalDatabaseMapper
+from src.infrastructure.database import queries
 from src.infrastructure.exceptions.repository_exceptions import NotFoundError
 
 
 class WithdrawalRepository(AbstractWithdrawalRepository):
-    def __init__(self, connection: Any):
+    def __init__(self, connection: Any, identity_map: AbstractIdentityMap):
         self.connection = connection
+        self.identity_map = identity_map
 
     async def get_withdrawal_by_id(self, withdrawal_id: int) -> Withdrawal:
-        stmt = "SELECT * FROM withdrawals WHERE id = $1"
+        withdrawal = self.identity_map.get(Withdrawal, withdrawal_id)
+        if withdrawal is not None:
+            return withdrawal
+
+        stmt = queries.SELECT_WITHDRAWAL_BY_ID
 
         row = await self.connection.fetchrow(stmt, withdrawal_id)
 
         if row:
-            return WithdrawalDatabaseMapper.from_db_row(row)
+            return self.identity_map.add(WithdrawalDatabaseMapper.from_db_row(row))
 
         raise NotFoundError("withdrawal with id = {withdrawal_id} not found")
 
-    async def get_withdrawals(self) -> list[Withdrawal]:
-        stmt = "SELECT * FROM withdrawals"
+    async def get_withdrawals(self, limit: int, cursor: Optional[PageCursor] = None) -> Page[Withdrawal]:
+        stmt, args = queries.WITHDRAWALS_PAGE.build((), limit, cursor)
 
-        rows = await self.connection.fetch(stmt)
+        rows = await self.connection.fetch(stmt, *args)
 
-        return [WithdrawalDatabaseMapper.from_db_row(row) for row in rows]
+        return PaginationHandler.build_page(rows, limit, WithdrawalDatabaseMapper.from_db_row)
 
-    async def get_withdrawals_by_account_id(self, account_id: int) -> list[Withdrawal]:
-        stmt = "SELECT * FROM withdrawals WHERE account_id = $1"
+    async def get_withdrawal_projections_by_account_id(
+            self,
+            account_id: int,
+            limit: int,
+            cursor: Optional[PageCursor] = None
+    ) -> Page[Projection]:
+        stmt, args = queries.WITHDRAWAL_PROJECTIONS_BY_ACCOUNT_ID_PAGE.build((account_id,), limit, cursor)
 
-        rows = await self.connection.fetch(stmt, account_id)
+        rows = await self.connection.fetch(stmt, *args)
 
-        return [WithdrawalDatabaseMapper.from_db_row(row) for row in rows]
+        return PaginationHandler.build_page(rows, limit, dict)
 
     async def create_withdrawal(self, withdrawal_create: Withdrawal) -> Withdrawal:
         withdrawal_create_row = WithdrawalDatabaseMapper.to_db_row(withdrawal_create)
@@ -52,4 +67,4 @@ class WithdrawalRepository(AbstractWithdrawalRepository):
         except ForeignKeyViolationError as exc:
             raise ErrorHandler.handle_unique_violation("Withdrawal", exc, withdrawal_create)
 
-        return WithdrawalDatabaseMapper.from_db_row(row)
+        return self.identity_map.add(WithdrawalDatabaseMapper.from_db_row(row))
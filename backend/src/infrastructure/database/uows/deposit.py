@@ -1,41 +1,24 @@
-from typing import Optional
+from typing import Any, Optional
 
 from src.domain.abstractions.database.connection import AbstractDatabaseConnection
 from src.domain.abstractions.database.factories.repository import AbstractRepositoryFactory
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
 from src.domain.abstractions.database.repositories.accounts import AbstractAccountRepository
 from src.domain.abstractions.database.repositories.deposit import AbstractDepositRepository
 from src.domain.abstractions.database.repositories.loans import AbstractLoanRepository
 from src.domain.abstractions.database.uows.deposit import AbstractDepositUnitOfWork
+from src.infrastructure.database.uows.uow import BaseUnitOfWork
 
 
-class DepositUnitOfWork(AbstractDepositUnitOfWork):
+class DepositUnitOfWork(BaseUnitOfWork, AbstractDepositUnitOfWork):
     def __init__(self, db_connection: AbstractDatabaseConnection, repository_factory: AbstractRepositoryFactory):
-        self.db_connection = db_connection
-        self.repository_factory = repository_factory
+        super().__init__(db_connection, repository_factory)
         self._deposit_repository: Optional[AbstractDepositRepository] = None
         self._account_repository: Optional[AbstractAccountRepository] = None
-        self._transaction = None
 
-    async def __aenter__(self):
-        """Set up the context manager by establishing a connection and starting a transaction."""
-        await self.db_connection.connect()
-        self._transaction = self.db_connection.connection.transaction()
-        await self._transaction.start()
-
-        self._deposit_repository = self.repository_factory.create_deposit_repository(self.db_connection.connection)
-        self._account_repository = self.repository_factory.create_account_repository(self.db_connection.connection)
-
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        """Clean up by committing or rolling back the transaction and closing the connection."""
-        if self._transaction:
-            if exc_type is None:
-                await self._transaction.commit()
-            else:
-                await self._transaction.rollback()
-            self._transaction = None
-        await self.db_connection.close()
+    def _init_repositories(self, connection: Any, identity_map: AbstractIdentityMap) -> None:
+        self._deposit_repository = self.repository_factory.create_deposit_repository(connection, identity_map)
+        self._account_repository = self.repository_factory.create_account_repository(connection, identity_map)
 
     @property
     def account_repository(self) -> AbstractAccountRepository:
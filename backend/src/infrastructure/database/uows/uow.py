@@ -0,0 +1,93 @@
+import asyncio
+import random
+from abc import abstractmethod
+from contextvars import Token
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from asyncpg.exceptions import DeadlockDetectedError, SerializationError
+
+from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.domain.abstractions.database.factories.repository import AbstractRepositoryFactory
+from src.domain.abstractions.database.identity_map import AbstractIdentityMap
+from src.domain.abstractions.database.uows.uow import AbstractUnitOfWork
+from src.infrastructure.database.identity_map import IdentityMap
+from src.infrastructure.database.query_scope import QueryScope
+
+T = TypeVar("T")
+
+
+class BaseUnitOfWork(AbstractUnitOfWork):
+    """Base unit of work that runs its repositories on one pooled connection inside a single transaction.
+
+    The repositories share an identity map that lives as long as the transaction, so each row is read
+    from the database at most once per unit of work. The queries run meanwhile are counted in a query scope
+    of their own, which the N+1 detector inspects.
+    """
+
+    retryable_errors = (SerializationError, DeadlockDetectedError)
+    max_attempts = 5
+    retry_base_delay = 0.01
+    retry_max_delay = 0.5
+
+    def __init__(self, db_connection: AbstractDatabaseConnection, repository_factory: AbstractRepositoryFactory):
+        self.db_connection = db_connection
+        self.repository_factory = repository_factory
+        self._connection = None
+        self._transaction = None
+        self._identity_map: Optional[AbstractIdentityMap] = None
+        self._query_scope: Optional[Token] = None
+
+    async def __aenter__(self):
+        """Set up the context manager by acquiring a pooled connection and starting a transaction."""
+        self._connection = await self.db_connection.acquire()
+        try:
+            self._transaction = self._connection.transaction()
+            await self._transaction.start()
+        except BaseException:
+            await self._release_connection()
+            raise
+
+        self._identity_map = IdentityMap()
+        self._query_scope = QueryScope.start(type(self).__name__)
+        self._init_repositories(self._connection, self._identity_map)
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Clean up by committing or rolling back the transaction and releasing the connection to the pool."""
+        try:
+            if self._transaction:
+                if exc_type is None:
+                    await self._transaction.commit()
+                else:
+                    await self._transaction.rollback()
+        finally:
+            self._transaction = None
+            self._identity_map = None
+            if self._query_scope is not None:
+                QueryScope.reset(self._query_scope)
+                self._query_scope = None
+            await self._release_connection()
+
+    async def run(self, operation: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Run the operation in a transaction, retrying on serialization failures and deadlocks
+        with exponential backoff and full jitter so that contending workers spread out."""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                async with self:
+                    return await operation(*args, **kwargs)
+            except self.retryable_errors:
+                if attempt == self.max_attempts:
+                    raise
+            delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+
+    async def _release_connection(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await self.db_connection.release(connection)
+
+    @abstractmethod
+    def _init_repositories(self, connection: Any, identity_map: AbstractIdentityMap) -> None:
+        """Create the repositories of this unit of work bound to the acquired connection and identity map."""
+        pass
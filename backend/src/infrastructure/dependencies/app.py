@@ -34,4 +34,5 @@ class Application(containers.DeclarativeContainer):
         config=config.services,
         uow=uow,
         core=core,
+        gateways=gateways,
     )
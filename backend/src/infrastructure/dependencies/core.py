@@ -1,7 +1,12 @@
 from dependency_injector import containers, providers
 
 from src.infrastructure.auth.jwt import JWTHandler
+from src.infrastructure.auth.key_ring import KeyRing
+from src.infrastructure.cache.ttl_cache import TTLCache
 from src.infrastructure.logger.logger import Logger
+from src.infrastructure.metrics.loop_monitor import EventLoopLagMonitor
+from src.infrastructure.metrics.metrics import PrometheusMetrics
+from src.infrastructure.metrics.profiler import RequestProfiler
 from src.infrastructure.security.password_handler import PasswordHandler
 
 
@@ -13,14 +18,72 @@ class Core(containers.DeclarativeContainer):
         logger_config=config.logger_config
     )
 
+    bank_cache = providers.Singleton(
+        TTLCache,
+        ttl=config.caches.banks.ttl,
+        max_size=config.caches.banks.max_size,
+    )
+
+    profile_cache = providers.Singleton(
+        TTLCache,
+        ttl=config.caches.profiles.ttl,
+        max_size=config.caches.profiles.max_size,
+    )
+
+    account_cache = providers.Singleton(
+        TTLCache,
+        ttl=config.caches.accounts.ttl,
+        max_size=config.caches.accounts.max_size,
+    )
+
+    token_cache = providers.Singleton(
+        TTLCache,
+        ttl=config.caches.tokens.ttl,
+        max_size=config.caches.tokens.max_size,
+    )
+
+    metrics = providers.Singleton(
+        PrometheusMetrics,
+        caches=providers.Dict(
+            banks=bank_cache,
+            profiles=profile_cache,
+            accounts=account_cache,
+            tokens=token_cache,
+        ),
+        logger=logger,
+    )
+
+    loop_monitor = providers.Singleton(
+        EventLoopLagMonitor,
+        metrics=metrics,
+        logger=logger,
+        interval_ms=config.loop_monitor.interval_ms,
+        threshold_ms=config.loop_monitor.threshold_ms,
+    )
+
+    request_profiler = providers.Singleton(
+        RequestProfiler,
+        logger=logger,
+        directory=config.profiler.directory,
+        interval_ms=config.profiler.interval_ms,
+        max_duration=config.profiler.max_duration,
+    )
+
     password_handler = providers.Singleton(
         PasswordHandler,
+        metrics=metrics,
+        max_workers=config.password_handler.max_workers,
+        max_queue=config.password_handler.max_queue,
+    )
+
+    key_ring = providers.Singleton(
+        KeyRing,
+        keys=config.jwt_keys,
+        signing_kid=config.jwt_handler.signing_kid,
     )
 
     token_handler = providers.Singleton(
         JWTHandler,
-        private_key=config.private_key,
-        public_key=config.public_key,
-        algorithm=config.jwt_handler.algorithm,
+        key_ring=key_ring,
         expire_minutes=config.jwt_handler.expire_minutes,
     )
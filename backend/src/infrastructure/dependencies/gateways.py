@@ -1,8 +1,12 @@
 from dependency_injector import containers, providers
 
+from src.infrastructure.cache.invalidation import CacheInvalidationListener, CacheSubscription
 from src.infrastructure.database.connection import DatabaseConnection
-from src.infrastructure.database.database_initializer import DatabaseInitializer
 from src.infrastructure.database.factories.repository_factory import RepositoryFactory
+from src.infrastructure.database.migrations.runner import MigrationRunner
+from src.infrastructure.database.n_plus_one import NPlusOneDetector
+from src.infrastructure.database.query_stats import QueryStatsInterceptor
+from src.infrastructure.security.rate_limiter import PostgresTokenBucketRateLimiter, TokenBucketRateLimiter
 
 
 class Gateways(containers.DeclarativeContainer):
@@ -10,17 +14,66 @@ class Gateways(containers.DeclarativeContainer):
 
     core = providers.DependenciesContainer()
 
+    query_stats = providers.Singleton(
+        QueryStatsInterceptor,
+        logger=core.logger,
+        slow_query_ms=config.database.query_stats.slow_query_ms,
+        window=config.database.query_stats.window,
+        max_fingerprints=config.database.query_stats.max_fingerprints,
+        echo=config.database.echo,
+    )
+
+    n_plus_one_detector = providers.Singleton(
+        NPlusOneDetector,
+        logger=core.logger,
+        enabled=config.database.n_plus_one.enabled,
+        threshold=config.database.n_plus_one.threshold,
+        raise_errors=config.database.n_plus_one.raise_errors,
+    )
+
     database_connection = providers.Singleton(
         DatabaseConnection,
         logger=core.logger,
-        dsn=config.url
+        metrics=core.metrics,
+        query_interceptors=providers.List(query_stats, n_plus_one_detector),
+        dsn=config.url,
+        min_size=config.database.pool.min_size,
+        max_size=config.database.pool.max_size,
+        acquire_timeout=config.database.pool.acquire_timeout,
+        max_inactive_connection_lifetime=config.database.pool.max_inactive_connection_lifetime,
     )
 
-    database_initializer = providers.Factory(
-        DatabaseInitializer,
+    migration_runner = providers.Factory(
+        MigrationRunner,
         db_connection=database_connection,
+        logger=core.logger,
     )
 
     repository_factory = providers.Factory(
         RepositoryFactory,
     )
+
+    rate_limiter = providers.Selector(
+        config.rate_limiter.backend,
+        memory=providers.Singleton(
+            TokenBucketRateLimiter,
+            rules=config.rate_limiter.rules,
+            max_keys=config.rate_limiter.max_keys,
+        ),
+        postgres=providers.Singleton(
+            PostgresTokenBucketRateLimiter,
+            db_connection=database_connection,
+            rules=config.rate_limiter.rules,
+        ),
+    )
+
+    cache_invalidation_listener = providers.Singleton(
+        CacheInvalidationListener,
+        dsn=config.url,
+        logger=core.logger,
+        subscriptions=providers.List(
+            providers.Factory(CacheSubscription, table="banks", cache=core.bank_cache),
+            providers.Factory(CacheSubscription, table="users", cache=core.profile_cache, key_column="id"),
+            providers.Factory(CacheSubscription, table="accounts", cache=core.account_cache, key_column="user_id"),
+        ),
+    )
@@ -7,11 +7,14 @@ from src.application.services.auth.auth import AuthService
 from src.application.services.auth.login import LoginService
 from src.application.services.auth.password import PasswordService
 from src.application.services.auth.payload import PayloadExtractorService
+from src.application.services.auth.rate_limit import AuthRateLimitService
 from src.application.services.auth.token import TokenService
 from src.application.services.auth.user import AuthUserService
 from src.application.services.banks.bank_management import BankManagementService
 from src.application.services.banks.bank_public import BankPublicService
 from src.application.services.deposits.deposit_profile import DepositProfileService
+from src.application.services.diagnostics.profiling import ProfilingService
+from src.application.services.diagnostics.query_stats import QueryStatsService
 from src.application.services.enterprises.enterprise_management import EnterpriseManagementService
 from src.application.services.enterprises.enterprise_specialist import EnterpriseSpecialistService
 from src.application.services.loans.loan_management import LoanManagementService
@@ -31,6 +34,7 @@ class Services(containers.DeclarativeContainer):
 
     core = providers.DependenciesContainer()
     uow = providers.DependenciesContainer()
+    gateways = providers.DependenciesContainer()
 
     log_service = providers.Factory(
         LogService,
@@ -56,6 +60,7 @@ class Services(containers.DeclarativeContainer):
         AuthService,
         token_service=token_service,
         payload_extractor_service=payload_extractor_service,
+        token_cache=core.token_cache,
     )
 
     user_registration_service = providers.Factory(
@@ -69,6 +74,11 @@ class Services(containers.DeclarativeContainer):
         uow=uow.user_unit_of_work,
     )
 
+    auth_rate_limit_service = providers.Factory(
+        AuthRateLimitService,
+        rate_limiter=gateways.rate_limiter,
+    )
+
     login_service = providers.Factory(
         LoginService,
         auth_user_service=auth_user_service,
@@ -79,16 +89,19 @@ class Services(containers.DeclarativeContainer):
     bank_info_service = providers.Factory(
         BankPublicService,
         uow=uow.bank_unit_of_work,
+        bank_cache=core.bank_cache,
     )
 
     profile_service = providers.Factory(
         ProfileService,
         uow=uow.user_unit_of_work,
+        profile_cache=core.profile_cache,
     )
 
     account_profile_service = providers.Factory(
         AccountProfileService,
         uow=uow.account_unit_of_work,
+        account_cache=core.account_cache,
     )
 
     addition_profile_service = providers.Factory(
@@ -99,11 +112,13 @@ class Services(containers.DeclarativeContainer):
     bank_management_service = providers.Factory(
         BankManagementService,
         uow=uow.bank_unit_of_work,
+        bank_cache=core.bank_cache,
     )
 
     user_management_service = providers.Factory(
         UserManagementService,
         uow=uow.user_unit_of_work,
+        profile_cache=core.profile_cache,
     )
 
     account_management_service = providers.Factory(
@@ -150,3 +165,13 @@ class Services(containers.DeclarativeContainer):
         EnterpriseSpecialistService,
         uow=uow.enterprise_unit_of_work
     )
+
+    query_stats_service = providers.Factory(
+        QueryStatsService,
+        query_stats=gateways.query_stats,
+    )
+
+    profiling_service = providers.Factory(
+        ProfilingService,
+        profiler=core.request_profiler,
+    )
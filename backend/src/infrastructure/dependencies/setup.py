@@ -6,8 +6,8 @@ def setup_container() -> Application:
     container = Application()
 
     container.config.gateways.url.from_value(settings.db.url)
-    container.config.core.public_key.from_value(settings.auth_jwt.public_key)
-    container.config.core.private_key.from_value(settings.auth_jwt.private_key)
+    container.config.gateways.database.echo.from_value(settings.db.echo)
+    container.config.core.jwt_keys.from_value(settings.auth_jwt.keys)
     container.config.core.logger_config.from_value(settings.logger.log_config)
 
     return container
@@ -27,6 +27,11 @@ class TokenCreationError(JWTError):
     pass
 
 
+class KeyRingConfigurationError(JWTError):
+    """Exception raised when the configured JWT keys cannot be used."""
+    pass
+
+
 class InvalidLoginError(Exception):
     """Exception raised for invalid login attempts (wrong phone number or password)."""
 
@@ -0,0 +1,13 @@
+class MigrationError(Exception):
+    """Base exception for migration handlers."""
+    pass
+
+
+class MigrationChecksumError(MigrationError):
+    """Exception raised when an applied migration no longer matches its definition."""
+
+    def __init__(self, version: int, name: str):
+        self.version = version
+        self.name = name
+        super().__init__(f"Migration {version} ({name}) was modified after it had been applied.")
+
@@ -44,4 +44,14 @@ class ForeignKeyError(RepositoryError):
 
         super().__init__(
             f"Foreign key violation: {entity}.{field} = {value} does not exist in {referenced_table}."
-        )
\ No newline at end of file
+        )
+
+class NPlusOneQueryError(RepositoryError):
+    """Exception raised when a unit of work repeats the same query past the N+1 detection threshold."""
+
+    def __init__(self, unit_of_work: str, fingerprint: str, count: int, stack: str):
+        self.unit_of_work = unit_of_work
+        self.fingerprint = fingerprint
+        self.count = count
+        self.stack = stack
+        super().__init__(f"{unit_of_work} ran the same query {count} times: {fingerprint}\n{stack}")
@@ -0,0 +1,22 @@
+class PasswordHandlerError(Exception):
+    """Base exception for password handler errors."""
+    pass
+
+
+class PasswordHandlerOverloadedError(PasswordHandlerError):
+    """Exception raised when too many password operations are already waiting for a worker thread."""
+
+    DEFAULT_MESSAGE = "Too many authentication requests are being processed. Please retry shortly."
+
+    def __init__(self, message: str = DEFAULT_MESSAGE):
+        super().__init__(message)
+
+
+class RateLimitExceededError(Exception):
+    """Exception raised when an action is attempted more often than its rate limit allows."""
+
+    DEFAULT_MESSAGE = "Too many attempts. Please retry later."
+
+    def __init__(self, retry_after: float, message: str = DEFAULT_MESSAGE):
+        super().__init__(message)
+        self.retry_after = retry_after
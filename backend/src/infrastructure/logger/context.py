@@ -0,0 +1,37 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+_log_context: ContextVar[Optional[dict[str, Any]]] = ContextVar("log_context", default=None)
+
+
+class LogContext:
+    """Fields attached to every record logged while a request is handled.
+
+    The fields live in one mutable dict per request, so fields bound from a dependency running in the thread
+    pool, such as the id of the authenticated user, are seen by everything logged later in the request.
+    """
+
+    @staticmethod
+    def start(route: str) -> Token:
+        return _log_context.set({"route": route, "_started_at": time.perf_counter()})
+
+    @staticmethod
+    def reset(token: Token) -> None:
+        _log_context.reset(token)
+
+    @staticmethod
+    def bind(**fields: Any) -> None:
+        context = _log_context.get()
+        if context is not None:
+            context.update(fields)
+
+    @staticmethod
+    def fields() -> dict[str, Any]:
+        """Returns the fields of the current request with the time elapsed since it started."""
+        context = _log_context.get()
+        if context is None:
+            return {}
+        fields = {key: value for key, value in context.items() if key != "_started_at"}
+        fields["latency_ms"] = round((time.perf_counter() - context["_started_at"]) * 1000, 3)
+        return fields
@@ -0,0 +1,31 @@
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object holding the message and the structured fields of the record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "fields", {})
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """Formats a record with the configured format, followed by its structured fields as key=value pairs."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        fields = getattr(record, "fields", None)
+        if not fields:
+            return message
+        return f"{message} " + " ".join(f"{key}={value}" for key, value in fields.items())
@@ -1,33 +1,100 @@
+import atexit
 import logging
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
 from src.domain.abstractions.logger.logger import AbstractLogger
+from src.infrastructure.logger.context import LogContext
+from src.infrastructure.logger.formatters import JsonFormatter, TextFormatter
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting of the message to the listener thread and drops records
+    instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Records are logged from worker threads too.
+            with self._dropped_lock:
+                self.dropped += 1
 
 
 class Logger(AbstractLogger):
-    def __init__(self, logger_config: dict):
-        format_str = logger_config['formatters']['formatter']['format']
-        log_level = logger_config['root']['level']
+    """Logger that hands records to a background thread, which formats and writes them.
 
-        formatter = logging.Formatter(format_str)
+    Logging from the event loop only puts the record on a bounded queue: the message is formatted with its
+    arguments, and written to the console and the file, by the listener thread. Each record carries the
+    fields of the current request and those passed by the caller. A level can be sampled, so that only
+    the configured share of its records is kept.
+    """
+
+    def __init__(self, logger_config: dict):
+        formatters = {
+            "formatter": TextFormatter(logger_config['formatters']['formatter']['format']),
+            "json": JsonFormatter()
+        }
 
         self.logger = logging.getLogger("application_log")
-        self.logger.setLevel(log_level)
+        self.logger.setLevel(logger_config['root']['level'])
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logger_config['handlers']['console']['level'])
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatters[logger_config['handlers']['console']['formatter']])
 
         file_handler = logging.FileHandler(logger_config['handlers']['file']['filename'])
         file_handler.setLevel(logger_config['handlers']['file']['level'])
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(formatters[logger_config['handlers']['file']['formatter']])
+
+        log_queue = queue.Queue(maxsize=logger_config['queue']['max_size'])
+        self._queue_handler = _DeferredQueueHandler(log_queue)
+        self.logger.addHandler(self._queue_handler)
+
+        self._listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        self._listener.start()
+        self._closed = False
+        atexit.register(self.close)
+
+        self._sampling = {
+            logging.getLevelName(level): rate for level, rate in logger_config.get('sampling', {}).items()
+        }
+
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(logging.INFO, message, args, fields)
+
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(logging.ERROR, message, args, fields)
 
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(logging.WARNING, message, args, fields)
 
-    def info(self, message: str):
-        self.logger.info(message)
+    def close(self) -> None:
+        """Writes out the records still queued and stops the listener thread."""
+        if not self._closed:
+            self._closed = True
+            self._listener.stop()
 
-    def error(self, message: str):
-        self.logger.error(message)
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the queue of the listener thread was full."""
+        return self._queue_handler.dropped
 
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def _log(self, level: int, message: str, args: tuple, fields: dict[str, Any]) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        rate = self._sampling.get(level, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            return
+        self.logger.log(level, message, *args, extra={"fields": {**LogContext.fields(), **fields}})
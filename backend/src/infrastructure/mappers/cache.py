@@ -0,0 +1,17 @@
+from src.application.dtos.cache import CacheStatsReadDTO
+from src.infrastructure.schemas.cache import CacheStatsResponse
+
+
+class CacheSchemaMapper:
+    """Utility class for mapping cache statistics DTOs to Pydantic models."""
+
+    @staticmethod
+    def to_response(dto: CacheStatsReadDTO) -> CacheStatsResponse:
+        return CacheStatsResponse(
+            hits=dto.hits,
+            misses=dto.misses,
+            hit_ratio=dto.hit_ratio,
+            evictions=dto.evictions,
+            size=dto.size,
+            max_size=dto.max_size
+        )
@@ -0,0 +1,24 @@
+from typing import Callable, TypeVar
+
+from src.application.dtos.page import PageReadDTO
+from src.domain.entities.projection import Projection
+from src.infrastructure.schemas.page import PageResponse
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class PageSchemaMapper:
+    """Utility class for mapping page DTOs to paginated Pydantic responses."""
+
+    @staticmethod
+    def to_response(dto: PageReadDTO[T], item_mapper: Callable[[T], R]) -> PageResponse[R]:
+        return PageResponse(
+            items=[item_mapper(item) for item in dto.items],
+            next_cursor=dto.next_cursor
+        )
+
+    @staticmethod
+    def to_projection_response(dto: PageReadDTO[Projection]) -> dict:
+        """Builds the content of a paginated response from projections, which need no schema to be rendered."""
+        return {"items": dto.items, "next_cursor": dto.next_cursor}
@@ -0,0 +1,19 @@
+from src.application.dtos.query_stats import QueryStatsReadDTO
+from src.infrastructure.schemas.query_stats import QueryStatsResponse
+
+
+class QueryStatsSchemaMapper:
+    """Utility class for mapping query statistics DTOs to Pydantic models."""
+
+    @staticmethod
+    def to_response(dto: QueryStatsReadDTO) -> QueryStatsResponse:
+        return QueryStatsResponse(
+            fingerprint=dto.fingerprint,
+            count=dto.count,
+            total_ms=dto.total_ms,
+            p50_ms=dto.p50_ms,
+            p99_ms=dto.p99_ms,
+            max_ms=dto.max_ms,
+            rows=dto.rows,
+            callers=dto.callers
+        )
@@ -0,0 +1,37 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from src.domain.entities.metrics import RequestTiming
+
+_request_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+class RequestTimings:
+    """Timing of the request being handled in the current context."""
+
+    @staticmethod
+    def start() -> Token:
+        return _request_timing.set(RequestTiming(started_at=time.perf_counter()))
+
+    @staticmethod
+    def reset(token: Token) -> None:
+        _request_timing.reset(token)
+
+    @staticmethod
+    def current() -> Optional[RequestTiming]:
+        return _request_timing.get()
+
+    @staticmethod
+    def server_timing(timing: RequestTiming) -> str:
+        """Returns the value of the Server-Timing header for the timing so far, in milliseconds."""
+        total_ms = (time.perf_counter() - timing.started_at) * 1000
+        metrics = [
+            f"total;dur={total_ms:.3f}",
+            f'db;dur={timing.query_seconds * 1000:.3f};desc="queries={timing.queries}"',
+        ]
+        if timing.pool_wait_seconds:
+            metrics.append(f"pool;dur={timing.pool_wait_seconds * 1000:.3f}")
+        if timing.password_wait_seconds:
+            metrics.append(f"bcrypt;dur={timing.password_wait_seconds * 1000:.3f}")
+        return ", ".join(metrics)
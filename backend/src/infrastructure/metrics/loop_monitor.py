@@ -0,0 +1,84 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.domain.abstractions.metrics.loop_monitor import AbstractEventLoopMonitor
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
+
+
+class EventLoopLagMonitor(AbstractEventLoopMonitor):
+    """Measures how late the event loop runs a task that sleeps for a fixed interval, and logs the stack of
+    whatever is blocking the loop when it is late by more than a threshold.
+
+    The lag of every wake-up is recorded in the metrics. A watchdog thread checks when the task last ran;
+    once that is longer ago than the interval plus the threshold, the loop is stuck in a call, so the thread
+    takes the current frame of the loop's thread and logs its stack, once per stall.
+    """
+
+    def __init__(
+            self,
+            metrics: AbstractMetrics,
+            logger: AbstractLogger,
+            interval_ms: float = 50.0,
+            threshold_ms: float = 100.0
+    ):
+        self.metrics = metrics
+        self.logger = logger
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_tick = 0.0
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.perf_counter()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        self._stopping.set()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self._watchdog.join()
+        self._watchdog = None
+
+    async def _measure(self) -> None:
+        while True:
+            self._last_tick = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - self._last_tick - self.interval, 0.0)
+            self.metrics.observe_loop_lag(lag, blocked=lag >= self.threshold)
+
+    def _watch(self) -> None:
+        reported_tick = None
+        while not self._stopping.wait(self.threshold / 2):
+            last_tick = self._last_tick
+            blocked_for = time.perf_counter() - last_tick - self.interval
+            if blocked_for < self.threshold or last_tick == reported_tick:
+                continue
+            reported_tick = last_tick
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)).rstrip() if frame is not None else "<unavailable>"
+            self.logger.warning(
+                "Event loop blocked for more than %.0f ms in:\n%s",
+                blocked_for * 1000,
+                stack,
+                blocked_ms=round(blocked_for * 1000, 3)
+            )
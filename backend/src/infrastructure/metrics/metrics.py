@@ -0,0 +1,157 @@
+import time
+from typing import Mapping, Optional, Union
+
+from src.domain.abstractions.cache.cache import AbstractCache
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
+from src.domain.abstractions.security.password_handler import AbstractPasswordHandler
+from src.domain.entities.metrics import RequestTiming
+from src.infrastructure.metrics.context import RequestTimings
+from src.infrastructure.metrics.prometheus import COUNT_BUCKETS, Counter, Gauge, Histogram
+
+
+class PrometheusMetrics(AbstractMetrics):
+    """Metrics of the application kept in memory and exposed in the Prometheus text format.
+
+    Every observation is made from the event loop, so the metrics are updated without locking. The counters of
+    the in-process caches, of the password handler and of the records the logger dropped are read from them
+    when the metrics are rendered.
+    """
+
+    def __init__(self, caches: Optional[Mapping[str, AbstractCache]] = None, logger: Optional[AbstractLogger] = None):
+        self.caches = dict(caches or {})
+        self.logger = logger
+        self.password_handler: Optional[AbstractPasswordHandler] = None
+        self.requests = Counter(
+            "http_requests_total",
+            "Handled requests by route template and status code.",
+            ("method", "route", "status")
+        )
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "Time to handle a request, by route template.",
+            ("method", "route")
+        )
+        self.request_queries = Histogram(
+            "http_request_db_queries",
+            "Database queries issued per request, by route template.",
+            ("method", "route"),
+            buckets=COUNT_BUCKETS
+        )
+        self.request_query_duration = Histogram(
+            "http_request_db_duration_seconds",
+            "Total time of the database queries of a request, by route template.",
+            ("method", "route")
+        )
+        self.query_duration = Histogram("db_query_duration_seconds", "Time to run a database query.")
+        self.pool_acquire_wait = Histogram(
+            "db_pool_acquire_wait_seconds",
+            "Time spent waiting for a connection from the pool."
+        )
+        self.password_queue_wait = Histogram(
+            "password_handler_queue_wait_seconds",
+            "Time a password operation waited for a bcrypt worker thread."
+        )
+        self.loop_lag = Histogram(
+            "event_loop_lag_seconds",
+            "Delay between when a callback was due on the event loop and when it ran.",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+        )
+        self.loop_blocked = Counter(
+            "event_loop_blocked_total",
+            "Times the event loop ran a callback later than the blocking threshold."
+        )
+
+    def observe_request(self, method: str, route: str, status_code: int, timing: RequestTiming) -> None:
+        self.requests.inc(method, route, str(status_code))
+        self.request_duration.observe(time.perf_counter() - timing.started_at, method, route)
+        self.request_queries.observe(timing.queries, method, route)
+        self.request_query_duration.observe(timing.query_seconds, method, route)
+
+    def observe_query(self, seconds: float) -> None:
+        self.query_duration.observe(seconds)
+        timing = RequestTimings.current()
+        if timing is not None:
+            timing.queries += 1
+            timing.query_seconds += seconds
+
+    def observe_pool_acquire(self, seconds: float) -> None:
+        self.pool_acquire_wait.observe(seconds)
+        timing = RequestTimings.current()
+        if timing is not None:
+            timing.pool_wait_seconds += seconds
+
+    def observe_password_queue(self, seconds: float) -> None:
+        self.password_queue_wait.observe(seconds)
+        timing = RequestTimings.current()
+        if timing is not None:
+            timing.password_wait_seconds += seconds
+
+    def track_password_handler(self, password_handler: AbstractPasswordHandler) -> None:
+        self.password_handler = password_handler
+
+    def observe_loop_lag(self, seconds: float, blocked: bool) -> None:
+        self.loop_lag.observe(seconds)
+        if blocked:
+            self.loop_blocked.inc()
+
+    def render(self) -> str:
+        lines = []
+        for metric in (
+                self.requests,
+                self.request_duration,
+                self.request_queries,
+                self.request_query_duration,
+                self.query_duration,
+                self.pool_acquire_wait,
+                self.password_queue_wait,
+                self.loop_lag,
+                self.loop_blocked,
+                *self._cache_counters(),
+                *self._password_handler_metrics(),
+                *self._logger_counters()
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _cache_counters(self) -> tuple[Counter, Counter, Counter]:
+        hits = Counter("cache_hits_total", "Reads served from an in-process cache, by cache.", ("cache",))
+        misses = Counter("cache_misses_total", "Reads an in-process cache had no value for, by cache.", ("cache",))
+        evictions = Counter(
+            "cache_evictions_total",
+            "Values evicted from an in-process cache to stay within its size, by cache.",
+            ("cache",)
+        )
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            hits.inc(name, amount=stats.hits)
+            misses.inc(name, amount=stats.misses)
+            evictions.inc(name, amount=stats.evictions)
+        return hits, misses, evictions
+
+    def _password_handler_metrics(self) -> tuple[Union[Gauge, Counter], ...]:
+        if self.password_handler is None:
+            return ()
+        stats = self.password_handler.stats()
+        running = Gauge("password_handler_running", "Password operations running on a bcrypt worker thread.")
+        queued = Gauge("password_handler_queued", "Password operations waiting for a bcrypt worker thread.")
+        completed = Counter("password_handler_completed_total", "Password operations completed.")
+        rejected = Counter(
+            "password_handler_rejected_total",
+            "Password operations rejected because the worker threads and their queue were full."
+        )
+        running.set(stats.running)
+        queued.set(stats.queued)
+        completed.inc(amount=stats.completed)
+        rejected.inc(amount=stats.rejected)
+        return running, queued, completed, rejected
+
+    def _logger_counters(self) -> tuple[Counter, ...]:
+        if self.logger is None:
+            return ()
+        dropped = Counter(
+            "log_records_dropped_total",
+            "Log records dropped because the queue of the logging thread was full."
+        )
+        dropped.inc(amount=self.logger.dropped)
+        return (dropped,)
@@ -0,0 +1,164 @@
+import asyncio
+import gc
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Optional
+
+from src.domain.abstractions.logger.logger import AbstractLogger
+from src.domain.abstractions.metrics.profiler import AbstractRequestProfiler
+from src.infrastructure.exceptions.repository_exceptions import NotFoundError
+
+_PROFILE_ID = re.compile(r"[0-9a-f]{32}")
+
+# Layer of a sample, given by the innermost of its frames that matches a (module prefix, function) rule.
+_LAYERS = (
+    ("src.infrastructure.database", None, "repository"),
+    ("src.application.services", None, "service"),
+    ("fastapi.routing", "serialize_response", "serialization"),
+    ("fastapi.encoders", None, "serialization"),
+    ("src.api.responses", None, "serialization"),
+    ("starlette.responses", None, "serialization"),
+    ("fastapi.dependencies", None, "dependency_injection"),
+    ("dependency_injector", None, "dependency_injection"),
+    ("src.api", None, "route"),
+)
+_WAITING = "(waiting)"
+
+
+def _frame_name(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _layer(frames: list[FrameType]) -> str:
+    for frame in reversed(frames):
+        module = frame.f_globals.get("__name__", "")
+        for prefix, function, layer in _LAYERS:
+            if module.startswith(prefix) and (function is None or frame.f_code.co_name == function):
+                return layer
+    return "framework"
+
+
+def _awaited(awaitable: Any) -> Any:
+    """Returns what a suspended coroutine or generator is waiting on.
+
+    Compiled coroutines, such as the one dependency-injector wraps the endpoints in, await through a wrapper
+    object that only refers to the awaited coroutine.
+    """
+    awaited = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    if awaited is not None and type(awaited).__name__ == "coroutine_wrapper":
+        awaited = next(iter(gc.get_referents(awaited)), None)
+    return awaited
+
+
+class _Sampler(threading.Thread):
+    """Samples the stack of one request from its own thread until stopped.
+
+    While the request runs on the event loop its stack is read from the loop's thread; while it waits, from
+    the chain of coroutines it is suspended in. Only the frames below the coroutine of the task handling the
+    request belong to the request.
+    """
+
+    def __init__(self, task: asyncio.Task, interval: float, max_duration: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.task = task
+        self.root = task.get_coro().cr_frame
+        self.interval = interval
+        self.max_duration = max_duration
+        self.loop_thread_id = threading.get_ident()
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self.started_at = time.perf_counter()
+        self.stopping = threading.Event()
+
+    def run(self) -> None:
+        deadline = self.started_at + self.max_duration
+        while not self.stopping.wait(self.interval) and time.perf_counter() < deadline:
+            frames = self._running_frames()
+            waiting = frames is None
+            if waiting:
+                frames = self._suspended_frames()
+            names = tuple(_frame_name(frame) for frame in frames)
+            self.samples[(_layer(frames),) + names + ((_WAITING,) if waiting else ())] += 1
+
+    def _running_frames(self) -> Optional[list[FrameType]]:
+        frame = sys._current_frames().get(self.loop_thread_id)
+        frames = []
+        while frame is not None and frame is not self.root:
+            frames.append(frame)
+            frame = frame.f_back
+        if frame is None:
+            return None
+        frames.reverse()
+        return frames
+
+    def _suspended_frames(self) -> list[FrameType]:
+        frames = []
+        inside = False
+        awaitable = self.task.get_coro()
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+            if frame is not None:
+                if inside:
+                    frames.append(frame)
+                inside = inside or frame is self.root
+            awaitable = _awaited(awaitable)
+        return frames
+
+
+class RequestProfiler(AbstractRequestProfiler):
+    """Sampling profiler for single requests, whose profiles are stored as folded stacks in a directory.
+
+    Every `interval_ms` a thread records the stack of the request, whether it is running or waiting, under
+    a root frame naming the layer the time was spent in, so the widest frames of the flame graph split the
+    request into dependency injection, route, service, repository and serialization time. Nothing is
+    sampled for requests that are not being profiled.
+    """
+
+    def __init__(self, logger: AbstractLogger, directory: str, interval_ms: float = 1.0, max_duration: float = 30.0):
+        self.logger = logger
+        self.directory = Path(directory)
+        self.interval = interval_ms / 1000
+        self.max_duration = max_duration
+        self._samplers: dict[str, _Sampler] = {}
+
+    def start(self) -> str:
+        profile_id = uuid.uuid4().hex
+        sampler = _Sampler(asyncio.current_task(), self.interval, self.max_duration)
+        self._samplers[profile_id] = sampler
+        sampler.start()
+        return profile_id
+
+    async def stop(self, profile_id: str) -> None:
+        sampler = self._samplers.pop(profile_id)
+        sampler.stopping.set()
+        await asyncio.to_thread(sampler.join)
+        elapsed_ms = (time.perf_counter() - sampler.started_at) * 1000
+
+        layers = Counter()
+        for stack, count in sampler.samples.items():
+            layers[stack[0]] += count
+        total = sum(layers.values()) or 1
+        self.logger.info(
+            "Profiled request in %.1f ms as %s: %s",
+            elapsed_ms,
+            profile_id,
+            ", ".join(f"{layer} {count / total:.0%}" for layer, count in layers.most_common()),
+            profile_id=profile_id
+        )
+        folded = "".join(f"{';'.join(stack)} {count}\n" for stack, count in sampler.samples.items())
+        await asyncio.to_thread(self._write, profile_id, folded)
+
+    async def load(self, profile_id: str) -> str:
+        path = self.directory / f"{profile_id}.folded"
+        if not _PROFILE_ID.fullmatch(profile_id) or not path.is_file():
+            raise NotFoundError(f"Profile with id {profile_id} not found")
+        return await asyncio.to_thread(path.read_text)
+
+    def _write(self, profile_id: str, folded: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{profile_id}.folded").write_text(folded)
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    size: int
+    max_size: int
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class QueryStatsResponse(BaseModel):
+    fingerprint: str
+    count: int
+    total_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    rows: int
+    callers: list[str]
@@ -1,16 +1,95 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 import bcrypt
 
+from src.domain.abstractions.metrics.metrics import AbstractMetrics
 from src.domain.abstractions.security.password_handler import AbstractPasswordHandler
+from src.domain.entities.password_handler import PasswordHandlerStats
+from src.infrastructure.exceptions.security_exceptions import PasswordHandlerOverloadedError
+
+T = TypeVar("T")
 
 
 class PasswordHandler(AbstractPasswordHandler):
-    def hash_password(self, password: str) -> str:
+    """Handles passwords with bcrypt on a bounded pool of worker threads.
+
+    bcrypt releases the GIL while hashing, so the event loop keeps serving other requests meanwhile. At most
+    max_workers operations run at once and at most max_queue wait for a thread; beyond that an operation is
+    rejected immediately instead of queueing behind work it could only time out on. The time an operation
+    waits for a thread is recorded in the metrics, which also report the load counters of the handler.
+
+    An operation holds its slot until its job leaves the executor, so a caller cancelled while bcrypt is still
+    running does not free the slot early.
+    """
+
+    def __init__(self, metrics: AbstractMetrics, max_workers: int = 4, max_queue: int = 64):
+        self.metrics = metrics
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        metrics.track_password_handler(self)
+
+    async def hash_password(self, password: str) -> str:
         """Hashes password using bcrypt."""
 
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode(), salt).decode('utf-8')
+        hashed_password = await self._run(bcrypt.hashpw, password.encode(), bcrypt.gensalt())
+        return hashed_password.decode('utf-8')
 
-    def validate_password(self, password: str, hashed_password: str) -> bool:
+    async def validate_password(self, password: str, hashed_password: str) -> bool:
         """Checks if the password you entered matches the hash."""
 
-        return bcrypt.checkpw(password.encode(), hashed_password.encode())
+        return await self._run(bcrypt.checkpw, password.encode(), hashed_password.encode())
+
+    def stats(self) -> PasswordHandlerStats:
+        with self._lock:
+            return PasswordHandlerStats(
+                running=self._running,
+                queued=self._pending - self._running,
+                completed=self._completed,
+                rejected=self._rejected,
+                max_workers=self.max_workers,
+                max_queue=self.max_queue
+            )
+
+    async def _run(self, function: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHandlerOverloadedError()
+            self._pending += 1
+
+        try:
+            job = self._executor.submit(self._call, time.perf_counter(), function, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Called once the job has run or was cancelled before starting, from whichever thread finished it.
+        job.add_done_callback(lambda _: self._release())
+
+        queue_wait, result = await asyncio.wrap_future(job)
+        self.metrics.observe_password_queue(queue_wait)
+        return result
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _call(self, submitted_at: float, function: Callable[..., T], *args) -> tuple[float, T]:
+        queue_wait = time.perf_counter() - submitted_at
+        with self._lock:
+            self._running += 1
+        try:
+            return queue_wait, function(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
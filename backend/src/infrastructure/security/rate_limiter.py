@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+
+from src.domain.abstractions.database.connection import AbstractDatabaseConnection
+from src.domain.abstractions.security.rate_limiter import AbstractRateLimiter
+from src.domain.entities.rate_limit import RateLimitRule
+
+
+def _parse_rules(rules: dict[str, dict]) -> dict[str, RateLimitRule]:
+    return {
+        name: RateLimitRule(capacity=rule["capacity"], refill_per_second=rule["refill_per_second"])
+        for name, rule in rules.items()
+    }
+
+
+class TokenBucketRateLimiter(AbstractRateLimiter):
+    """In-process token buckets, one per rule and key, refilled continuously at the rate of the rule.
+
+    At most max_keys buckets are kept; the least recently used one is dropped beyond that, which only
+    resets it to a full bucket. State is private to the worker, so each worker enforces the limits on its own.
+    """
+
+    def __init__(self, rules: dict[str, dict], max_keys: int = 100_000):
+        self.rules = _parse_rules(rules)
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[tuple[str, str], tuple[float, float]] = OrderedDict()
+
+    async def acquire(self, rule: str, key: str) -> float:
+        limit = self.rules[rule]
+        now = time.monotonic()
+        bucket_key = (rule, key)
+
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            tokens = limit.capacity
+        else:
+            stored_tokens, updated_at = bucket
+            tokens = min(limit.capacity, stored_tokens + (now - updated_at) * limit.refill_per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[bucket_key] = (tokens, now)
+        self._buckets.move_to_end(bucket_key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        return 0.0 if allowed else (1 - tokens) / limit.refill_per_second
+
+
+class PostgresTokenBucketRateLimiter(AbstractRateLimiter):
+    """Token buckets kept in the unlogged rate_limit_buckets table, so that all workers share them.
+
+    Each acquire is a single upsert that refills and takes from the bucket atomically. Buckets that have
+    been idle long enough to be full again are purged at most once per purge_interval seconds.
+    """
+
+    _refilled_tokens = (
+        "LEAST($2::float8, bucket.tokens + EXTRACT(EPOCH FROM now() - bucket.updated_at)::float8 * $3::float8)"
+    )
+
+    def __init__(self, db_connection: AbstractDatabaseConnection, rules: dict[str, dict], purge_interval: float = 60.0):
+        self.db_connection = db_connection
+        self.rules = _parse_rules(rules)
+        self.purge_interval = purge_interval
+        self._idle_seconds = max(rule.capacity / rule.refill_per_second for rule in self.rules.values())
+        self._purged_at = time.monotonic()
+
+    async def acquire(self, rule: str, key: str) -> float:
+        limit = self.rules[rule]
+        await self._purge_idle_buckets()
+
+        query = f"""
+            INSERT INTO rate_limit_buckets AS bucket (key, tokens, allowed, updated_at)
+            VALUES ($1, $2::float8 - 1, TRUE, now())
+            ON CONFLICT (key) DO UPDATE SET
+                allowed = {self._refilled_tokens} >= 1,
+                tokens = CASE
+                    WHEN {self._refilled_tokens} >= 1 THEN {self._refilled_tokens} - 1
+                    ELSE {self._refilled_tokens}
+                END,
+                updated_at = now()
+            RETURNING allowed, tokens
+        """
+        row = await self.db_connection.fetchrow(query, f"{rule}:{key}", limit.capacity, limit.refill_per_second)
+        return 0.0 if row["allowed"] else (1 - row["tokens"]) / limit.refill_per_second
+
+    async def _purge_idle_buckets(self) -> None:
+        if time.monotonic() - self._purged_at < self.purge_interval:
+            return
+        self._purged_at = time.monotonic()
+        await self.db_connection.execute(
+            "DELETE FROM rate_limit_buckets WHERE updated_at < now() - make_interval(secs => $1)",
+            self._idle_seconds
+        )
@@ -2,13 +2,17 @@ from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from src.api.main import router
+from src.api.middlewares.log_context import LogContextMiddleware
+from src.api.middlewares.metrics import MetricsMiddleware
+from src.api.middlewares.profiling import ProfilingMiddleware
+from src.api.responses import ORJSONResponse
 
-from src.api.startup import app_startup
+from src.api.startup import app_startup, app_shutdown
 from src.infrastructure.dependencies.setup import setup_container
 
 container = setup_container()
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.container = container
 
@@ -19,7 +23,16 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(LogContextMiddleware)
+app.add_middleware(MetricsMiddleware, metrics=container.core.metrics())
+app.add_middleware(
+    ProfilingMiddleware,
+    auth_service=container.services.auth_service,
+    profiling_service=container.services.profiling_service,
+    log_service=container.services.log_service,
+)
 
 app.add_event_handler("startup", app_startup)
+app.add_event_handler("shutdown", app_shutdown)
 
 app.include_router(router)
@@ -0,0 +1,38 @@
+import pytest
+
+from src.infrastructure.database.n_plus_one import NPlusOneDetector
+from src.infrastructure.dependencies.app import Application
+from src.infrastructure.dependencies.setup import setup_container
+
+pytest_plugins = ["pytester"]
+
+
+@pytest.fixture(scope="session")
+def container() -> Application:
+    container = setup_container()
+    container.config.gateways.database.n_plus_one.enabled.from_value(True)
+    return container
+
+
+@pytest.fixture(scope="session")
+def n_plus_one_detector(container: Application) -> NPlusOneDetector:
+    return container.gateways.n_plus_one_detector()
+
+
+@pytest.fixture(autouse=True)
+def fail_on_n_plus_one_queries(n_plus_one_detector: NPlusOneDetector):
+    """Fails every test during which a unit of work ran the same query fingerprint `threshold` times,
+    even when the application turned the NPlusOneQueryError into an HTTP response."""
+    n_plus_one_detector.clear()
+    yield
+    violations = n_plus_one_detector.violations()
+    n_plus_one_detector.clear()
+    if violations:
+        pytest.fail(
+            "\n\n".join(
+                f"Possible N+1 query: {violation.unit_of_work} ran the same query {violation.count} times: "
+                f"{violation.fingerprint}\n{violation.stack}"
+                for violation in violations
+            ),
+            pytrace=False
+        )
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+import pytest
+
+from src.application.dtos.user import UserAccessDTO
+from src.domain.enums.user import UserRole
+from src.infrastructure.database import queries
+from src.infrastructure.dependencies.app import Application
+
+NOW = datetime(2025, 1, 1)
+ENTERPRISE_ACCOUNT_ID = 1
+SPECIALIST_USER_ID = 2
+PAYEE_COUNTS = (1, 50)
+
+
+class FakeTransaction:
+    async def start(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakePayrollConnection:
+    """Stands in for a pooled asyncpg connection holding one enterprise, its specialist and a payroll
+    request to `payee_count` users, and records every statement it runs."""
+
+    def __init__(self, payee_count: int):
+        self.payee_count = payee_count
+        self.statements: list[str] = []
+
+    def transaction(self, **kwargs: Any) -> FakeTransaction:
+        return FakeTransaction()
+
+    async def fetch(self, query: str, *args: Any) -> list[dict]:
+        self.statements.append(query)
+        if query == queries.LOCK_ACCOUNT_IDS:
+            return [{"id": account_id} for account_id in args[0]]
+        if query == queries.LOCK_ACCOUNTS:
+            return [self._account(account_id) for account_id in args[0]]
+        if query == queries.SELECT_USERS_BY_PASSPORT_NUMBERS:
+            return [self._user(100 + index, passport_number) for index, passport_number in enumerate(args[0])]
+        if "INSERT INTO accounts" in query:
+            return [{"id": 1000 + index} for index in range(len(args[0]))]
+        raise AssertionError(f"Unexpected fetch: {query}")
+
+    async def fetchrow(self, query: str, *args: Any) -> Optional[dict]:
+        self.statements.append(query)
+        if query == queries.SELECT_ENTERPRISE_PAYROLL_REQUEST_BY_ID:
+            return self._payroll_request("ON_CONSIDERATION")
+        if query == queries.SELECT_ENTERPRISE_SPECIALIST_BY_ID:
+            return {"id": args[0], "user_id": SPECIALIST_USER_ID, "enterprise_id": 1}
+        if query == queries.SELECT_ENTERPRISE_BY_ID:
+            return {
+                "id": args[0], "name": "Enterprise", "type": "LLC", "unp": "123456789", "bank_id": 1,
+                "address": "Minsk", "account_id": ENTERPRISE_ACCOUNT_ID, "created_at": NOW, "updated_at": NOW
+            }
+        if query == queries.SELECT_ACCOUNT_BY_ID:
+            return self._account(args[0])
+        if query == queries.SELECT_USER_BY_ID:
+            return self._user(args[0], "CD0000000")
+        if "UPDATE accounts" in query:
+            return {**self._account(args[0]), "current_balance": Decimal("1000000"), "current_status": "ACTIVE"}
+        if "UPDATE enterprise_payroll_requests" in query:
+            return self._payroll_request(args[0])
+        raise AssertionError(f"Unexpected fetchrow: {query}")
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        self.statements.append(query)
+        if "UPDATE accounts" in query:
+            return 0
+        raise AssertionError(f"Unexpected fetchval: {query}")
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.statements.append(query)
+        if "INSERT INTO enterprise_payroll_transactions" in query:
+            return f"INSERT 0 {len(args[0])}"
+        raise AssertionError(f"Unexpected execute: {query}")
+
+    def _payroll_request(self, status: str) -> dict:
+        return {
+            "id": 1, "status": status, "enterprise_id": 1, "specialist_id": 1, "amount": Decimal("100.00"),
+            "passport_numbers": [f"AB{index:07d}" for index in range(self.payee_count)],
+            "accounts_id": [1000 + index for index in range(self.payee_count)],
+            "created_at": NOW, "updated_at": NOW
+        }
+
+    @staticmethod
+    def _account(account_id: int) -> dict:
+        return {
+            "id": account_id, "user_id": SPECIALIST_USER_ID, "bank_id": 1, "balance": Decimal("1000000"),
+            "status": "ACTIVE", "type": "SETTLEMENT", "created_at": NOW, "updated_at": NOW
+        }
+
+    @staticmethod
+    def _user(user_id: int, passport_number: str) -> dict:
+        return {
+            "id": user_id, "name": "User", "passport_number": passport_number, "phone_number": f"+375{user_id:09d}",
+            "email": f"user{user_id}@example.com", "role": "CLIENT", "hashed_password": "", "is_active": True,
+            "is_foreign": False, "created_at": NOW, "updated_at": NOW
+        }
+
+
+class FakePool:
+    def __init__(self, connection: FakePayrollConnection):
+        self.connection = connection
+
+    async def acquire(self, timeout: Optional[float] = None) -> FakePayrollConnection:
+        return self.connection
+
+    async def release(self, connection: FakePayrollConnection) -> None:
+        pass
+
+
+@pytest.fixture
+def connect(container: Application, monkeypatch: pytest.MonkeyPatch):
+    """Points the units of work of the container at a fake payroll database of the given size."""
+    def connect(payee_count: int) -> FakePayrollConnection:
+        connection = FakePayrollConnection(payee_count)
+        monkeypatch.setattr(container.gateways.database_connection(), "_pool", FakePool(connection))
+        return connection
+    return connect
+
+
+def test_make_enterprise_payroll_request_runs_same_queries_for_any_number_of_payees(
+        container: Application,
+        connect
+):
+    service = container.services.enterprise_specialist_service()
+    specialist = UserAccessDTO(id=SPECIALIST_USER_ID, role=UserRole.SPECIALIST)
+
+    statements = []
+    for payee_count in PAYEE_COUNTS:
+        connection = connect(payee_count)
+        asyncio.run(service.make_enterprise_payroll_request(1, specialist))
+        statements.append(connection.statements)
+
+    assert statements[0] == statements[-1]
+
+
+def test_approve_enterprise_payroll_request_runs_same_queries_for_any_number_of_payees(
+        container: Application,
+        connect
+):
+    service = container.services.enterprise_management_service()
+    manager = UserAccessDTO(id=3, role=UserRole.MANAGER)
+
+    statements = []
+    for payee_count in PAYEE_COUNTS:
+        connection = connect(payee_count)
+        asyncio.run(service.approve_enterprise_payroll_request(1, manager))
+        statements.append(connection.statements)
+
+    assert statements[0] == statements[-1]
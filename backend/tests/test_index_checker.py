@@ -0,0 +1,5 @@
+from src.infrastructure.database.index_checker import SAMPLE_ARGS, repository_queries
+
+
+def test_every_repository_query_has_sample_arguments():
+    assert set(repository_queries()) == set(SAMPLE_ARGS)
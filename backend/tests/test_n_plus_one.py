@@ -0,0 +1,69 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.infrastructure.database.instrumented_connection import InstrumentedConnection
+from src.infrastructure.database.n_plus_one import NPlusOneDetector
+from src.infrastructure.database.query_scope import QueryScope
+from src.infrastructure.dependencies.app import Application
+
+
+class FakeRawConnection:
+    """Stands in for a pooled asyncpg connection, returning one row per query."""
+
+    async def fetchrow(self, query: str, *args: Any) -> dict:
+        return {"id": args[0]}
+
+
+async def fetch_banks_one_by_one(connection: InstrumentedConnection, bank_ids: range) -> None:
+    scope = QueryScope.start("BankUnitOfWork")
+    try:
+        for bank_id in bank_ids:
+            await connection.fetchrow("SELECT * FROM banks WHERE id = $1", bank_id)
+    finally:
+        QueryScope.reset(scope)
+
+
+def test_detector_flags_query_repeated_within_unit_of_work(
+        container: Application,
+        n_plus_one_detector: NPlusOneDetector
+):
+    connection = InstrumentedConnection(FakeRawConnection(), container.core.metrics(), (n_plus_one_detector,))
+
+    asyncio.run(fetch_banks_one_by_one(connection, range(n_plus_one_detector.threshold)))
+
+    violations = n_plus_one_detector.violations()
+    # The violation is what this test expects, so it must not fail the test through the fixture.
+    n_plus_one_detector.clear()
+    assert len(violations) == 1
+    assert violations[0].unit_of_work == "BankUnitOfWork"
+    assert violations[0].fingerprint == "SELECT * FROM banks WHERE id = $?"
+    assert violations[0].count == n_plus_one_detector.threshold
+
+
+def test_fixture_fails_test_that_runs_n_plus_one_queries(pytester: pytest.Pytester):
+    pytester.makeconftest(Path(__file__).with_name("conftest.py").read_text())
+    pytester.makefile(".yml", config=Path(__file__).parent.parent.joinpath("config.yml").read_text())
+    pytester.makepyfile(f"""
+        import asyncio
+
+        from src.infrastructure.database.instrumented_connection import InstrumentedConnection
+        from {__name__} import FakeRawConnection, fetch_banks_one_by_one
+
+
+        def test_below_threshold(container, n_plus_one_detector):
+            connection = InstrumentedConnection(FakeRawConnection(), container.core.metrics(), (n_plus_one_detector,))
+            asyncio.run(fetch_banks_one_by_one(connection, range(n_plus_one_detector.threshold - 1)))
+
+
+        def test_at_threshold(container, n_plus_one_detector):
+            connection = InstrumentedConnection(FakeRawConnection(), container.core.metrics(), (n_plus_one_detector,))
+            asyncio.run(fetch_banks_one_by_one(connection, range(n_plus_one_detector.threshold)))
+    """)
+
+    result = pytester.runpytest_inprocess()
+
+    result.assert_outcomes(passed=2, errors=1)
+    result.stdout.fnmatch_lines(["*Possible N+1 query: BankUnitOfWork ran the same query*"])